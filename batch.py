@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Batch solver for Maze Solver
+Solves many independent mazes across a pool of worker processes.
+"""
+
+import argparse
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from itertools import islice
+import json
+import os
+import sys
+from maze import Maze
+from mazefile import load_maze, read_text
+from solver import SOLVERS
+
+def _solve_chunk(solver_name, chunk):
+    """
+    Worker entry point: solve a chunk of serialized mazes.
+
+    Args:
+        solver_name (str): Key into SOLVERS
+        chunk (list): (index, serialized maze) pairs
+
+    Returns:
+        list: (index, path) pairs in the same order as the chunk
+    """
+    solver = SOLVERS[solver_name]()
+    return [(index, solver.solve(Maze.from_bytes(data))) for index, data in chunk]
+
+def _chunks(mazes, chunksize):
+    """Serialize mazes and group them into numbered chunks."""
+    numbered = enumerate(mazes)
+    while True:
+        chunk = [
+            (index, maze.to_bytes() if isinstance(maze, Maze) else maze)
+            for index, maze in islice(numbered, chunksize)
+        ]
+        if not chunk:
+            return
+        yield chunk
+
+def solve_batch(mazes, solver_name='bfs', workers=None, chunksize=16, ordered=True):
+    """
+    Solve a stream of mazes on a process pool.
+
+    Mazes are sent to workers in their compact to_bytes form, a chunk at a
+    time, and only a bounded number of chunks is in flight, so the input can
+    be an arbitrarily long iterator.
+
+    Args:
+        mazes (iterable): Maze objects (or bytes from Maze.to_bytes)
+        solver_name (str): Key into solver.SOLVERS
+        workers (int): Number of worker processes (defaults to the CPU count)
+        chunksize (int): Mazes sent to a worker per task
+        ordered (bool): Yield results in input order; otherwise as they complete
+
+    Yields:
+        tuple: (index, path) for every maze, index being its input position
+    """
+    if solver_name not in SOLVERS:
+        raise ValueError(f"Unknown solver: {solver_name}")
+
+    workers = workers or os.cpu_count() or 1
+    max_pending = workers * 2
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for chunk in _chunks(mazes, chunksize):
+            pending.append(executor.submit(_solve_chunk, solver_name, chunk))
+            if len(pending) >= max_pending:
+                yield from _collect(pending, ordered)
+
+        while pending:
+            yield from _collect(pending, ordered)
+
+def _collect(pending, ordered):
+    """Wait for the next chunk (or, unordered, any finished chunks) and yield its results."""
+    if ordered:
+        yield from pending.popleft().result()
+        return
+
+    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+    for future in done:
+        pending.remove(future)
+        yield from future.result()
+
+def read_mazes(stream):
+    """Read mazes from a stream with one JSON grid (list of rows) per line."""
+    for line in stream:
+        line = line.strip()
+        if line:
+            yield Maze(json.loads(line))
+
+def main(argv=None):
+    """Command-line entry point: solve mazes from files or stdin, one JSON result per line."""
+    parser = argparse.ArgumentParser(description="Solve many mazes in parallel.")
+    parser.add_argument('inputs', nargs='*',
+                        help="Files with one JSON grid per line, or .maze/.txt maze files (default: stdin)")
+    parser.add_argument('--solver', default='bfs', choices=sorted(SOLVERS), help="Solver algorithm")
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument('--chunksize', type=int, default=16, help="Mazes per worker task")
+    parser.add_argument('--unordered', action='store_true', help="Emit results as they complete")
+    parser.add_argument('--no-paths', action='store_true', help="Only report path lengths")
+    args = parser.parse_args(argv)
+
+    def mazes():
+        if not args.inputs:
+            yield from read_mazes(sys.stdin)
+        for name in args.inputs:
+            if name.endswith('.maze'):
+                yield load_maze(name)
+            elif name.endswith('.txt'):
+                yield read_text(name)
+            else:
+                with open(name) as f:
+                    yield from read_mazes(f)
+
+    results = solve_batch(mazes(), args.solver, args.workers, args.chunksize, not args.unordered)
+    for index, path in results:
+        record = {'index': index, 'solved': bool(path), 'length': len(path)}
+        if not args.no_paths:
+            record['path'] = path
+        print(json.dumps(record))
+
+if __name__ == "__main__":
+    main()
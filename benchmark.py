@@ -0,0 +1,400 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for Maze Solver
+Compares how much work each solver algorithm does on larger mazes.
+
+Run with no arguments to print the comparison tables, `suite` to time every
+solver across maze sizes and shapes into a JSON file, or `compare` to check
+a new suite run against an old one for regressions.
+"""
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from generator import recursive_backtracker, random_noise
+from maze import Maze, WALL, OPEN
+from queries import PathQueryService, SearchTree
+from solver import (BFSMazeSolver, BidirectionalBFSMazeSolver, AStarMazeSolver, BidirectionalAStarMazeSolver,
+                    JPSMazeSolver, SOLVERS)
+
+def create_noise_grid(width, height, wall_density, seed=0):
+    """Create a random grid with start and end in opposite corners."""
+    rng = random.Random(seed)
+    grid = [[1 if rng.random() < wall_density else 0 for _ in range(width)] for _ in range(height)]
+    grid[0][0] = 'S'
+    grid[height - 1][width - 1] = 'E'
+    return grid
+
+def compare_bidirectional(sizes=(50, 100, 200, 400), wall_density=0.2, seed=0):
+    """
+    Count the nodes each BFS and A* variant expands on random grids.
+
+    Args:
+        sizes (tuple): Side lengths of the square grids to solve
+        wall_density (float): Probability that a cell is a wall
+        seed (int): Random seed for the grids
+
+    Returns:
+        list: One row per size with path length and nodes expanded per solver
+    """
+    solvers = [
+        ("BFS", BFSMazeSolver()),
+        ("Bi-BFS", BidirectionalBFSMazeSolver()),
+        ("A*", AStarMazeSolver()),
+        ("Bi-A*", BidirectionalAStarMazeSolver())
+    ]
+
+    rows = []
+    for size in sizes:
+        maze = Maze(create_noise_grid(size, size, wall_density, seed))
+        row = {'size': size, 'path_length': 0, 'expanded': {}}
+        for name, solver in solvers:
+            path = solver.solve(maze)
+            row['path_length'] = len(path)
+            row['expanded'][name] = solver.nodes_expanded
+        rows.append(row)
+
+    return rows
+
+def compare_jump_points(size=300, wall_densities=(0.0, 0.02, 0.1), seed=0):
+    """
+    Count the nodes A* and Jump Point Search expand on open grids.
+
+    Args:
+        size (int): Side length of the square grids to solve
+        wall_densities (tuple): Wall probabilities to try, from open rooms upwards
+        seed (int): Random seed for the grids
+
+    Returns:
+        list: One row per density with path length and nodes expanded per solver
+    """
+    rows = []
+    for wall_density in wall_densities:
+        maze = Maze(create_noise_grid(size, size, wall_density, seed))
+        row = {'wall_density': wall_density, 'path_length': 0, 'expanded': {}}
+        for name, solver in (("A*", AStarMazeSolver()), ("JPS", JPSMazeSolver())):
+            path = solver.solve(maze)
+            row['path_length'] = len(path)
+            row['expanded'][name] = solver.nodes_expanded
+        rows.append(row)
+
+    return rows
+
+def benchmark_queries(size=1000, queries=10000, sources=10, wall_density=0.2, seed=0):
+    """
+    Measure query throughput of PathQueryService against one BFS per query.
+
+    Args:
+        size (int): Side length of the square grid
+        queries (int): Number of (source, target) queries to answer
+        sources (int): Number of distinct sources the queries are drawn from
+        wall_density (float): Probability that a cell is a wall
+        seed (int): Random seed for the grid and the queries
+
+    Returns:
+        dict: Timings and queries per second, with and without reuse
+    """
+    maze = Maze(create_noise_grid(size, size, wall_density, seed))
+    maze.neighbor_index()
+    rng = random.Random(seed)
+    open_cells = [maze.to_position(index) for index, cell in enumerate(maze.cells) if not cell]
+    source_pool = rng.sample(open_cells, sources)
+    pairs = [(rng.choice(source_pool), rng.choice(open_cells)) for _ in range(queries)]
+
+    service = PathQueryService(maze, max_trees=sources)
+    started = time.perf_counter()
+    for source, target in pairs:
+        service.shortest_path(source, target)
+    service_time = time.perf_counter() - started
+
+    # Without reuse every query is a fresh BFS; time a sample and extrapolate
+    sample = pairs[:20]
+    started = time.perf_counter()
+    for source, target in sample:
+        tree = SearchTree(maze, source)
+        index = maze.to_index(target)
+        tree.grow_until({index})
+        tree.path_to(index)
+    fresh_time = (time.perf_counter() - started) * queries / len(sample)
+
+    return {
+        'size': size,
+        'queries': queries,
+        'sources': sources,
+        'service_seconds': service_time,
+        'service_qps': queries / service_time,
+        'fresh_bfs_seconds': fresh_time,
+        'fresh_bfs_qps': queries / fresh_time
+    }
+
+def create_open_rooms(size, seed=0, room_size=8):
+    """
+    Create a grid of open rooms separated by walls, with one random door per wall.
+
+    Start and end sit in opposite corners.
+    """
+    rng = random.Random(seed)
+    cells = bytearray(size * size)
+    lines = range(room_size, size - 1, room_size)
+    for line in lines:
+        cells[line * size:(line + 1) * size] = bytes([WALL]) * size  # Horizontal wall
+        cells[line::size] = bytes([WALL]) * size  # Vertical wall
+
+    # Open one door in every wall segment between two crossings
+    bounds = [0, *lines, size]
+    for line in lines:
+        for low, high in zip(bounds, bounds[1:]):
+            low = low + 1 if low else 0
+            if low < high:
+                door = rng.randrange(low, high)
+                cells[line * size + door] = OPEN
+                cells[door * size + line] = OPEN
+
+    return Maze.from_cells(cells, size, size, (0, 0), (size - 1, size - 1))
+
+def create_spiral(size):
+    """
+    Create a single corridor spiralling inwards from the top-left corner.
+
+    The end is at the centre of the spiral, so the only path visits almost a
+    quarter of all cells and the straight-line heuristic is badly misleading.
+    """
+    cells = bytearray([WALL]) * (size * size)
+    x = y = 0
+    cells[0] = OPEN
+    steps = ((1, 0), (0, 1), (-1, 0), (0, -1))
+    lengths = [size - 1] * 3
+    length = size - 3
+    while length > 0:
+        lengths += [length, length]
+        length -= 2
+
+    for turn, length in enumerate(lengths):
+        dx, dy = steps[turn % 4]
+        for _ in range(length):
+            x += dx
+            y += dy
+            cells[y * size + x] = OPEN
+
+    return Maze.from_cells(cells, size, size, (0, 0), (x, y))
+
+def create_unsolvable(size, seed=0):
+    """
+    Create a random grid cut in two by a solid wall, so no solver can finish.
+
+    Solvers have to exhaust the start's half of the grid before giving up.
+    """
+    maze = random_noise(size, size, 0.2, seed)
+    cells = bytearray(maze.cells)
+    cells[size // 2::size] = bytes([WALL]) * size
+    return Maze.from_cells(cells, size, size, maze.start, maze.end)
+
+# Maze shapes for the benchmark suite: name -> function(size, seed) returning a Maze
+TOPOLOGIES = {
+    'perfect': lambda size, seed: recursive_backtracker(size | 1, size | 1, seed),
+    'rooms': create_open_rooms,
+    'spiral': lambda size, seed: create_spiral(size),
+    'unsolvable': create_unsolvable
+}
+
+def measure_solver(solver, maze, repeat=3):
+    """
+    Time one solver on one maze and measure its peak memory.
+
+    The wall time is the best of `repeat` runs. Peak memory is taken from
+    separate runs under tracemalloc, because tracing slows allocation down.
+
+    Returns:
+        dict: seconds, peak_bytes, nodes_expanded and path_length
+    """
+    # Incremental solvers (D* Lite) would answer repeats from their last
+    # search, so they are made to start over before every run
+    reset = getattr(solver, 'detach', lambda: None)
+    seconds = float('inf')
+    for _ in range(repeat):
+        reset()
+        started = time.perf_counter()
+        path = solver.solve(maze)
+        seconds = min(seconds, time.perf_counter() - started)
+
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+    # The first traced run also pays for allocator warm-up, so keep the lower peak of two
+    peak = None
+    for _ in range(2):
+        reset()
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        solver.solve(maze)
+        run_peak = tracemalloc.get_traced_memory()[1] - before
+        peak = run_peak if peak is None else min(peak, run_peak)
+    if not tracing:
+        tracemalloc.stop()
+
+    return {
+        'seconds': seconds,
+        'peak_bytes': peak,
+        'nodes_expanded': solver.nodes_expanded,
+        'path_length': len(path)
+    }
+
+def run_suite(sizes=(51, 101, 201), topologies=None, solvers=None, seed=0, repeat=3):
+    """
+    Run every solver over every maze shape and size.
+
+    Each maze's neighbor index is built before any solver runs, so no solver
+    is charged for that shared one-off work.
+
+    Args:
+        sizes (tuple): Side lengths of the square mazes
+        topologies (list): Keys into TOPOLOGIES (defaults to all of them)
+        solvers (list): Keys into solver.SOLVERS (defaults to all of them)
+        seed (int): Random seed for the generated mazes
+        repeat (int): Runs per measurement; the fastest is kept
+
+    Returns:
+        dict: Run metadata and one result row per (solver, topology, size)
+    """
+    topologies = topologies or list(TOPOLOGIES)
+    solvers = solvers or list(SOLVERS)
+    results = []
+
+    for topology in topologies:
+        for size in sizes:
+            maze = TOPOLOGIES[topology](size, seed)
+            maze.neighbor_index()
+            for name in solvers:
+                row = {'solver': name, 'topology': topology, 'size': size}
+                row.update(measure_solver(SOLVERS[name](), maze, repeat))
+                results.append(row)
+
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'seed': seed,
+        'repeat': repeat,
+        'results': results
+    }
+
+def compare_runs(baseline, current, threshold=0.10, min_seconds=0.001):
+    """
+    Compare two suite runs and list the measurements that got worse.
+
+    Args:
+        baseline (dict): Earlier run_suite result
+        current (dict): Later run_suite result
+        threshold (float): Relative increase that counts as a regression
+        min_seconds (float): Timings below this in both runs are too noisy to compare
+
+    Returns:
+        list: One dict per regression with the solver, topology, size, metric,
+            both values and the relative change; a changed path length is
+            always reported, since it means a solver's answer changed
+    """
+    def key(row):
+        return row['solver'], row['topology'], row['size']
+
+    previous = {key(row): row for row in baseline['results']}
+    regressions = []
+    for row in current['results']:
+        old = previous.get(key(row))
+        if old is None:
+            continue
+
+        for metric in ('seconds', 'peak_bytes', 'nodes_expanded', 'path_length'):
+            before, after = old[metric], row[metric]
+            if metric == 'path_length':
+                worse = before != after
+            elif metric == 'seconds' and max(before, after) < min_seconds:
+                worse = False
+            else:
+                worse = after > before * (1 + threshold)
+            if worse:
+                regressions.append({
+                    'solver': row['solver'], 'topology': row['topology'], 'size': row['size'],
+                    'metric': metric, 'baseline': before, 'current': after,
+                    'change': (after - before) / before if before else float('inf')
+                })
+
+    return regressions
+
+def print_suite(run):
+    """Print a suite run as a table."""
+    print(f"{'Topology':<11} {'Size':>5} {'Solver':<20} {'Time (ms)':>10} {'Peak KiB':>9} {'Expanded':>9} {'Path':>6}")
+    for row in run['results']:
+        print(f"{row['topology']:<11} {row['size']:>5} {row['solver']:<20} {row['seconds'] * 1000:>10.2f} "
+              f"{row['peak_bytes'] / 1024:>9.1f} {row['nodes_expanded']:>9} {row['path_length']:>6}")
+
+def print_comparisons():
+    """Print the solver comparisons."""
+    rows = compare_bidirectional()
+    names = list(rows[0]['expanded'])
+
+    print("NODES EXPANDED (random grids, 20% walls, corner to corner)")
+    print(f"{'Size':>10} {'Path':>6} " + " ".join(f"{name:>9}" for name in names))
+    for row in rows:
+        size = f"{row['size']}x{row['size']}"
+        counts = " ".join(f"{row['expanded'][name]:>9}" for name in names)
+        print(f"{size:>10} {row['path_length']:>6} {counts}")
+
+    print("\nNODES EXPANDED (300x300 open grids, corner to corner)")
+    print(f"{'Walls':>10} {'Path':>6} {'A*':>9} {'JPS':>9}")
+    for row in compare_jump_points():
+        walls = f"{row['wall_density']:.0%}"
+        print(f"{walls:>10} {row['path_length']:>6} {row['expanded']['A*']:>9} {row['expanded']['JPS']:>9}")
+
+    result = benchmark_queries()
+    print(f"\nQUERY THROUGHPUT ({result['queries']} queries from {result['sources']} sources, "
+          f"{result['size']}x{result['size']} grid)")
+    print(f"  Reused search trees: {result['service_seconds']:.1f}s ({result['service_qps']:.0f} queries/s)")
+    print(f"  One BFS per query:   {result['fresh_bfs_seconds']:.1f}s ({result['fresh_bfs_qps']:.1f} queries/s, extrapolated)")
+
+def main(argv=None):
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark the maze solvers.")
+    commands = parser.add_subparsers(dest='command')
+
+    suite = commands.add_parser('suite', help="Time every solver across maze sizes and shapes")
+    suite.add_argument('--output', help="Write the results to this JSON file")
+    suite.add_argument('--sizes', type=int, nargs='+', default=[51, 101, 201])
+    suite.add_argument('--topologies', nargs='+', choices=sorted(TOPOLOGIES))
+    suite.add_argument('--solvers', nargs='+', choices=sorted(SOLVERS))
+    suite.add_argument('--seed', type=int, default=0)
+    suite.add_argument('--repeat', type=int, default=3, help="Runs per measurement; the fastest is kept")
+
+    compare = commands.add_parser('compare', help="Flag regressions between two suite runs")
+    compare.add_argument('baseline', help="JSON file from an earlier run")
+    compare.add_argument('current', help="JSON file from a later run")
+    compare.add_argument('--threshold', type=float, default=0.10, help="Relative increase that counts as a regression")
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'suite':
+        run = run_suite(args.sizes, args.topologies, args.solvers, args.seed, args.repeat)
+        print_suite(run)
+        if args.output:
+            with open(args.output, 'w') as f:
+                json.dump(run, f, indent=2)
+    elif args.command == 'compare':
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        with open(args.current) as f:
+            current = json.load(f)
+        regressions = compare_runs(baseline, current, args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression['solver']} on {regression['topology']} {regression['size']}: "
+                  f"{regression['metric']} {regression['baseline']} -> {regression['current']} "
+                  f"({regression['change']:+.0%})")
+        print(f"{len(regressions)} regression(s)")
+        sys.exit(1 if regressions else 0)
+    else:
+        print_comparisons()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+from collections import OrderedDict
+import hashlib
+import json
+import os
+import threading
+import time
+from maze import Maze
+from solver import MazeSolver
+
+
+def solve_key(maze: Maze, solver: MazeSolver):
+    """
+    Build the cache key for solving a maze with a solver.
+
+    The key combines the maze content hash with the solver class and its
+    parameters, so equal mazes solved by equally configured solvers share it.
+    """
+    solver_class = type(solver)
+    parameters = sorted((name, repr(value)) for name, value in solver.parameters().items())
+    description = f"{solver_class.__module__}.{solver_class.__qualname__}:{parameters}:{maze.content_hash()}"
+    return hashlib.blake2b(description.encode(), digest_size=16).hexdigest()
+
+
+class SolveCache:
+    """Bounded LRU cache of solved paths with an optional on-disk tier."""
+
+    def __init__(self, max_entries=1024, ttl=None, directory=None):
+        """
+        Args:
+            max_entries (int): Most paths kept in memory before the least
+                recently used one is evicted
+            ttl (float): Seconds an entry stays valid, or None to keep it until evicted
+            directory (str): Optional directory where paths are also written as
+                JSON files, so they survive restarts and can be shared
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.directory = directory
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()  # key -> (expires_at, path tuple)
+        self._lock = threading.Lock()
+
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        """
+        Look up a path by key.
+
+        Returns:
+            list: A copy of the cached path, or None on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, path = entry
+                if expires_at is None or expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return list(path)
+                del self._entries[key]
+
+        path = self._read_disk(key)
+        with self._lock:
+            if path is None:
+                self.misses += 1
+                return None
+            self.disk_hits += 1
+            self._store(key, path)
+            return list(path)
+
+    def put(self, key, path):
+        """Store a path under a key, evicting the least recently used entry if full."""
+        path = tuple(path)
+        with self._lock:
+            self._store(key, path)
+        self._write_disk(key, path)
+
+    def solve(self, solver: MazeSolver, maze: Maze):
+        """Return the solver's path for the maze, solving only on a cache miss."""
+        key = solve_key(maze, solver)
+        path = self.get(key)
+        if path is None:
+            path = solver.solve(maze)
+            self.put(key, path)
+        return path
+
+    def clear(self):
+        """Drop every in-memory entry (files in the disk tier are kept)."""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self):
+        """Get hit/miss counters for the cache."""
+        lookups = self.hits + self.disk_hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'hits': self.hits,
+            'disk_hits': self.disk_hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': ((self.hits + self.disk_hits) / lookups) * 100 if lookups else 0.0
+        }
+
+    def _store(self, key, path):
+        """Insert an entry; the caller must hold the lock."""
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        self._entries[key] = (expires_at, path)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def _disk_path(self, key):
+        return os.path.join(self.directory, f"{key}.json")
+
+    def _read_disk(self, key):
+        """Load a path from the disk tier, honouring the TTL through the file age."""
+        if self.directory is None:
+            return None
+
+        file_path = self._disk_path(key)
+        try:
+            if self.ttl is not None and os.path.getmtime(file_path) + self.ttl <= time.time():
+                os.remove(file_path)
+                return None
+            with open(file_path) as f:
+                return tuple(tuple(position) for position in json.load(f))
+        except (OSError, ValueError):
+            return None
+
+    def _write_disk(self, key, path):
+        if self.directory is None:
+            return
+
+        # Write to a temporary file first so readers never see a partial path
+        file_path = self._disk_path(key)
+        temp_path = f"{file_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp_path, 'w') as f:
+            json.dump(path, f)
+        os.replace(temp_path, file_path)
+
+
+class CachedSolver(MazeSolver):
+    """Drop-in solver that memoizes another solver through a SolveCache."""
+
+    def __init__(self, solver: MazeSolver, cache: SolveCache = None):
+        self.solver = solver
+        self.cache = cache if cache is not None else default_cache
+
+    def solve(self, maze: Maze):
+        """Solve the maze with the wrapped solver, reusing cached paths."""
+        return self.cache.solve(self.solver, maze)
+
+
+# Shared by every Game so identical mazes are solved once per process
+default_cache = SolveCache()
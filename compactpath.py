@@ -0,0 +1,234 @@
+"""
+Compact path encoding for Maze Solver.
+
+A solved path is a list of (x, y) tuples, roughly 100 bytes per step once
+the tuples and ints are counted. A CompactPath keeps only the start cell and
+one 2-bit direction code per step, four steps to a byte. With run-length
+encoding each byte instead holds a direction and a run of up to 64 steps,
+so a long corridor costs a single byte.
+
+Positions are decoded lazily while iterating, the length is stored, and a
+path can be checked against a maze by walking cell indices directly.
+to_bytes()/from_bytes() give a self-contained form for storage or transfer.
+"""
+
+import math
+import struct
+from maze import Maze, DIRECTIONS, WALL
+
+PATH_MAGIC = b'PATH'
+# Magic, run-length flag, complete flag, start x/y, end x/y, number of
+# positions, suboptimality bound (NaN when not reported)
+PATH_HEADER = struct.Struct('<4sBB2xiiiiId')
+
+# Direction code of each (dx, dy) step: 0 up, 1 down, 2 left, 3 right, as in DIRECTIONS
+_CODES = {(dx, dy): code for code, (dx, dy, _) in enumerate(DIRECTIONS)}
+_STEPS = tuple((dx, dy) for dx, dy, _ in DIRECTIONS)
+
+# The four codes packed into every byte value, first step in the low bits
+_UNPACKED = tuple(tuple((value >> shift) & 3 for shift in (0, 2, 4, 6)) for value in range(256))
+
+# Longest run one run-length byte can hold
+_MAX_RUN = 64
+
+
+class CompactPath:
+    """A path stored as its start cell plus 2-bit direction codes."""
+
+    def __init__(self, start, end, length, data, run_length=False, complete=True, bound=None):
+        """
+        Args:
+            start (tuple): First position (None for an empty path)
+            end (tuple): Last position (None for an empty path)
+            length (int): Number of positions, counting the start
+            data (bytes): Packed direction codes, or run-length bytes
+            run_length (bool): True if ``data`` is run-length encoded
+            complete (bool): False for a partial path from a budget-cut solve
+            bound (float): Suboptimality bound of a budgeted solve (see
+                solver.SolvePath), or None if the solver reports none
+        """
+        self.start = start
+        self.end = end
+        self.length = length
+        self.data = data
+        self.run_length = run_length
+        self.complete = complete
+        self.bound = bound
+
+    @classmethod
+    def from_positions(cls, positions, run_length=False):
+        """
+        Encode a path given as positions.
+
+        The ``complete`` and ``bound`` of a solver.SolvePath are kept.
+
+        Args:
+            positions (iterable): (x, y) positions, each next to the one before
+            run_length (bool): Encode runs of one direction instead of single steps
+
+        Returns:
+            CompactPath: The encoded path
+
+        Raises:
+            ValueError: If two consecutive positions are not adjacent
+        """
+        complete = getattr(positions, 'complete', True)
+        bound = getattr(positions, 'bound', None)
+        positions = iter(positions)
+        start = next(positions, None)
+        if start is None:
+            return cls(None, None, 0, b'', run_length, complete, bound)
+
+        start = x, y = tuple(start)
+        codes = bytearray()
+        for step, (next_x, next_y) in enumerate(positions):
+            code = _CODES.get((next_x - x, next_y - y))
+            if code is None:
+                raise ValueError(f"Non-adjacent positions at step {step}")
+            codes.append(code)
+            x, y = next_x, next_y
+        length = len(codes) + 1
+
+        if run_length:
+            data = bytearray()
+            run_code, run = None, 0
+            for code in codes:
+                if code == run_code and run < _MAX_RUN:
+                    run += 1
+                    continue
+                if run:
+                    data.append(run_code | (run - 1) << 2)
+                run_code, run = code, 1
+            if run:
+                data.append(run_code | (run - 1) << 2)
+        else:
+            codes.extend(bytes(-len(codes) % 4))  # Pad to whole bytes with (ignored) zero codes
+            data = bytearray(
+                codes[i] | codes[i + 1] << 2 | codes[i + 2] << 4 | codes[i + 3] << 6
+                for i in range(0, len(codes), 4)
+            )
+        return cls(start, (x, y), length, bytes(data), run_length, complete, bound)
+
+    def codes(self):
+        """Yield the direction code of every step, in order."""
+        if self.run_length:
+            for value in self.data:
+                code = value & 3
+                for _ in range((value >> 2) + 1):
+                    yield code
+            return
+
+        remaining = self.length - 1
+        for value in self.data:
+            for code in _UNPACKED[value][:remaining]:
+                yield code
+            remaining -= 4
+
+    def _walk(self):
+        """Follow every code from the start, returning (steps taken, final position)."""
+        x, y = self.start
+        steps = 0
+        for code in self.codes():
+            dx, dy = _STEPS[code]
+            x += dx
+            y += dy
+            steps += 1
+        return steps, (x, y)
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        if not self.length:
+            return
+        x, y = self.start
+        yield (x, y)
+        for code in self.codes():
+            dx, dy = _STEPS[code]
+            x += dx
+            y += dy
+            yield (x, y)
+
+    def __eq__(self, other):
+        if not isinstance(other, (CompactPath, list, tuple)):
+            return NotImplemented
+        return len(self) == len(other) and all(a == tuple(b) for a, b in zip(self, other))
+
+    __hash__ = None
+
+    def __repr__(self):
+        encoding = "run-length" if self.run_length else "packed"
+        partial = "" if self.complete else ", partial"
+        return (f"CompactPath(start={self.start}, end={self.end}, length={self.length}, {encoding}, "
+                f"{len(self.data)} bytes{partial})")
+
+    def validate(self, maze: Maze):
+        """
+        Validate the path against a maze without decoding it into positions.
+
+        Steps are always between adjacent cells, so only the ends, the maze
+        bounds and the walls are checked; the walk must also take
+        ``length - 1`` steps and finish on the end.
+
+        Returns:
+            dict: The same result Maze.validate_path gives for the decoded path
+        """
+        if not self.length:
+            return {'valid': False, 'error': 'Empty path'}
+        if self.start != maze.start:
+            return {'valid': False, 'error': 'Path does not start at start position'}
+        if self.end != maze.end:
+            return {'valid': False, 'error': 'Path does not end at end position'}
+
+        cells = maze.cells
+        width = maze.width
+        height = maze.height
+        x, y = self.start
+        steps = 0
+        for code in self.codes():
+            dx, dy = _STEPS[code]
+            x += dx
+            y += dy
+            steps += 1
+            if not (0 <= x < width and 0 <= y < height) or cells[y * width + x] == WALL:
+                return {'valid': False, 'error': f'Path goes through wall at {(x, y)}'}
+        if steps != self.length - 1 or (x, y) != maze.end:
+            return {'valid': False, 'error': 'Path does not end at end position'}
+        return {'valid': True, 'length': self.length}
+
+    def to_bytes(self):
+        """Serialize the path into a fixed header followed by its code bytes."""
+        start = self.start or (0, 0)
+        end = self.end or (0, 0)
+        bound = math.nan if self.bound is None else self.bound
+        header = PATH_HEADER.pack(PATH_MAGIC, self.run_length, self.complete, *start, *end, self.length, bound)
+        return header + self.data
+
+    @classmethod
+    def from_bytes(cls, data):
+        """
+        Rebuild a path serialized by to_bytes().
+
+        Raises:
+            ValueError: If the data is not a serialized path, or its codes do
+                not cover exactly ``length - 1`` steps ending at ``end``
+        """
+        if len(data) < PATH_HEADER.size:
+            raise ValueError("Data too short for a path header")
+        magic, run_length, complete, start_x, start_y, end_x, end_y, length, bound = PATH_HEADER.unpack_from(data)
+        if magic != PATH_MAGIC:
+            raise ValueError("Not a serialized path")
+        flags = (bool(run_length), bool(complete), None if math.isnan(bound) else bound)
+        if not length:
+            return cls(None, None, 0, b'', *flags)
+
+        body = bytes(data[PATH_HEADER.size:])
+        if not flags[0] and len(body) != -(-(length - 1) // 4):
+            raise ValueError(f"Path body holds {len(body)} bytes, expected {-(-(length - 1) // 4)}")
+        path = cls((start_x, start_y), (end_x, end_y), length, body, *flags)
+        steps, end = path._walk()
+        if steps != length - 1:
+            raise ValueError(f"Path body holds {steps} steps, expected {length - 1}")
+        if end != path.end:
+            raise ValueError(f"Path ends at {end}, not at the recorded end {path.end}")
+        return path
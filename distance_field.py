@@ -0,0 +1,335 @@
+from array import array
+import heapq
+from maze import Maze, CELL_COSTS, DIRECTIONS, UP, DOWN, LEFT, RIGHT
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is an optional extra
+    np = None
+
+HAVE_NUMPY = np is not None
+
+# Player.move direction name and (dx, dy) step for each direction bit
+_MOVE_NAMES = {UP: 'up', DOWN: 'down', LEFT: 'left', RIGHT: 'right'}
+_MOVE_STEPS = {bit: (dx, dy) for dx, dy, bit in DIRECTIONS}
+
+# Direction bit of every open neighbor for each of the 16 neighbor masks, in
+# the same order as the neighbor index offsets
+_MASK_BITS = tuple(tuple(bit for _, _, bit in DIRECTIONS if mask & bit) for mask in range(16))
+_OPPOSITE = {UP: DOWN, DOWN: UP, LEFT: RIGHT, RIGHT: LEFT}
+
+# Frontiers narrower than this are expanded in Python; per-call NumPy overhead
+# outweighs the vectorization gain on corridor-like levels.
+_VECTORIZE_MIN_FRONTIER = 64
+
+
+class DistanceField:
+    """Step distances from one source cell to every cell of a maze."""
+
+    def __init__(self, maze: Maze, source, values):
+        """
+        Args:
+            maze (Maze): The maze the field was computed on
+            source (tuple): The position distances are measured from
+            values: Flat row-major distances, -1 for walls and unreachable cells
+                (a NumPy array when the NumPy engine produced the field)
+        """
+        self.maze = maze
+        self.source = source
+        self.values = values
+
+    def distance_to(self, position):
+        """Return the number of steps from the source to a position, or -1 if unreachable."""
+        if not self.maze.is_valid_position(position):
+            return -1
+        return int(self.values[self.maze.to_index(position)])
+
+    def is_reachable(self, position):
+        """Check if a position can be reached from the source."""
+        return self.distance_to(position) >= 0
+
+    def max_distance(self):
+        """Return the distance to the farthest reachable cell."""
+        if HAVE_NUMPY and isinstance(self.values, np.ndarray):
+            return int(self.values.max())
+        return max(self.values)
+
+    def reached_count(self):
+        """Return how many cells can be reached from the source (including itself)."""
+        if HAVE_NUMPY and isinstance(self.values, np.ndarray):
+            return int(np.count_nonzero(self.values >= 0))
+        return len(self.values) - self.values.count(-1)
+
+    def path_to(self, target):
+        """
+        Extract a shortest path from the source to a target by gradient descent.
+
+        Starting at the target, each step moves to the first neighbor (in
+        get_neighbors order) whose distance is one less, until the source.
+
+        Args:
+            target (tuple): The position to reach
+
+        Returns:
+            list: Positions from source to target, or [] if unreachable
+        """
+        distance = self.distance_to(target)
+        if distance < 0:
+            return []
+
+        maze = self.maze
+        values = self.values
+        masks, offsets = maze.neighbor_index()
+        current = maze.to_index(target)
+        path = [current]
+
+        while distance > 0:
+            distance -= 1
+            for offset in offsets[masks[current]]:
+                if values[current + offset] == distance:
+                    current += offset
+                    break
+            path.append(current)
+
+        return [maze.to_position(index) for index in reversed(path)]
+
+
+def compute_distance_field(maze: Maze, source=None, use_numpy=None):
+    """
+    Compute the step distance from a source to every cell of the maze.
+
+    Weighted cells count as a single step; use DijkstraMazeSolver for costs.
+
+    Args:
+        maze (Maze): The maze to measure
+        source (tuple): Position to measure from (defaults to maze.start)
+        use_numpy (bool): Force the NumPy engine on or off; by default it is
+            used whenever NumPy is installed
+
+    Returns:
+        DistanceField: Distances from the source to every cell
+    """
+    if source is None:
+        source = maze.start
+    if use_numpy is None:
+        use_numpy = HAVE_NUMPY
+    elif use_numpy and not HAVE_NUMPY:
+        raise ImportError("The NumPy distance field engine requires numpy to be installed")
+
+    if maze.is_wall(source):
+        values = array('i', [-1]) * (maze.width * maze.height)
+    elif use_numpy:
+        values = _numpy_wavefront(maze, source)
+    else:
+        values = _python_wavefront(maze, source)
+
+    return DistanceField(maze, source, values)
+
+
+def _python_wavefront(maze, source):
+    """Level-by-level BFS over the neighbor index."""
+    masks, offsets = maze.neighbor_index()
+    distances = array('i', [-1]) * (maze.width * maze.height)
+    start = maze.to_index(source)
+    distances[start] = 0
+    frontier = [start]
+    step = 0
+
+    while frontier:
+        step += 1
+        next_frontier = []
+        for current in frontier:
+            for offset in offsets[masks[current]]:
+                neighbor = current + offset
+                if distances[neighbor] < 0:
+                    distances[neighbor] = step
+                    next_frontier.append(neighbor)
+        frontier = next_frontier
+
+    return distances
+
+
+def _numpy_wavefront(maze, source):
+    """
+    Level-by-level BFS that expands wide frontiers with vectorized NumPy steps.
+
+    A wide level is expanded in one pass per direction: the frontier's
+    direction masks select which cells have an open neighbor that way, the
+    shifted indices are gathered, and the unseen ones become the next level.
+    Narrow levels (corridors) are cheaper to expand in plain Python, so both
+    paths share the same distance buffer and each level picks whichever fits.
+    """
+    masks, offsets = maze.neighbor_index()
+    mask_view = np.frombuffer(masks, dtype=np.uint8)
+    distances = array('i', [-1]) * (maze.width * maze.height)
+    distance_view = np.frombuffer(distances, dtype=np.int32)
+    steps = tuple(zip((UP, DOWN, LEFT, RIGHT), offsets[UP | DOWN | LEFT | RIGHT]))
+
+    start = maze.to_index(source)
+    distances[start] = 0
+    frontier = [start]
+    step = 0
+
+    while len(frontier):
+        step += 1
+        if len(frontier) < _VECTORIZE_MIN_FRONTIER:
+            if not isinstance(frontier, list):
+                frontier = frontier.tolist()
+            next_frontier = []
+            for current in frontier:
+                for offset in offsets[masks[current]]:
+                    neighbor = current + offset
+                    if distances[neighbor] < 0:
+                        distances[neighbor] = step
+                        next_frontier.append(neighbor)
+            frontier = next_frontier
+        else:
+            frontier = np.asarray(frontier, dtype=np.intp)
+            frontier_masks = mask_view[frontier]
+            candidates = np.concatenate([
+                frontier[(frontier_masks & bit) != 0] + offset for bit, offset in steps
+            ])
+            candidates = candidates[distance_view[candidates] < 0]
+            distance_view[candidates] = step
+            frontier = np.unique(candidates)  # Cells reached from two sides appear twice
+
+    return distance_view
+
+
+class FlowField:
+    """
+    The next step towards one goal from every cell of a maze.
+
+    Built by a single search outwards from the goal, it serves any number
+    of agents: each reads its next move in O(1) and its whole path by
+    following the arrows.
+    """
+
+    def __init__(self, maze: Maze, goal, directions, distances):
+        """
+        Args:
+            maze (Maze): The maze the field was computed on
+            goal (tuple): The position every arrow leads to
+            directions (bytearray): Direction bit (UP, DOWN, LEFT or RIGHT) of
+                the next step from each cell; 0 at the goal, walls and cells
+                that cannot reach it
+            distances (array): Cost from each cell to the goal, -1 if unreachable
+        """
+        self.maze = maze
+        self.goal = goal
+        self.directions = directions
+        self.distances = distances
+
+    def distance_from(self, position):
+        """Return the cost of the path from a position to the goal, or -1 if there is none."""
+        if not self.maze.is_valid_position(position):
+            return -1
+        return self.distances[self.maze.to_index(position)]
+
+    def next_position(self, position):
+        """Return the cell to step into from a position, or None at the goal or without a path."""
+        if not self.maze.is_valid_position(position):
+            return None
+        direction = self.directions[self.maze.to_index(position)]
+        if not direction:
+            return None
+        dx, dy = _MOVE_STEPS[direction]
+        return (position[0] + dx, position[1] + dy)
+
+    def next_move(self, position):
+        """Return the next move from a position as a Player.move direction ('up', ...), or None."""
+        if not self.maze.is_valid_position(position):
+            return None
+        return _MOVE_NAMES.get(self.directions[self.maze.to_index(position)])
+
+    def path_from(self, position):
+        """
+        Follow the arrows from a position to the goal.
+
+        Returns:
+            list: Positions from ``position`` to the goal, or [] if there is no path
+        """
+        if self.distance_from(position) < 0:
+            return []
+
+        maze = self.maze
+        directions = self.directions
+        width = maze.width
+        steps = {bit: dy * width + dx for bit, (dx, dy) in _MOVE_STEPS.items()}
+        current = maze.to_index(position)
+        path = [current]
+        while directions[current]:
+            current += steps[directions[current]]
+            path.append(current)
+        return [maze.to_position(index) for index in path]
+
+
+def compute_flow_field(maze: Maze, goal=None, weighted=None):
+    """
+    Compute the next step towards a goal from every cell, searching outwards from the goal.
+
+    Maze.flow_field() caches the result until the maze is edited; call that
+    instead to share it between agents.
+
+    Args:
+        maze (Maze): The maze to cover
+        goal (tuple): The position to lead to (defaults to maze.end)
+        weighted (bool): Minimize cell costs with Dijkstra's algorithm instead
+            of steps with a BFS; defaults to whether the maze has weighted cells
+
+    Returns:
+        FlowField: Directions and distances towards the goal
+    """
+    if goal is None:
+        goal = maze.end
+    if weighted is None:
+        weighted = maze.is_weighted()
+
+    masks, offsets = maze.neighbor_index()
+    size = maze.width * maze.height
+    distances = array('q', [-1]) * size
+    directions = bytearray(size)
+    if maze.is_wall(goal):
+        return FlowField(maze, goal, directions, distances)
+
+    # A cell reached from ``current`` through direction ``bit`` steps back the opposite way
+    moves = tuple(
+        tuple(zip(offsets[mask], [_OPPOSITE[bit] for bit in _MASK_BITS[mask]])) for mask in range(16)
+    )
+    start = maze.to_index(goal)
+    distances[start] = 0
+
+    if not weighted:
+        frontier = [start]
+        step = 0
+        while frontier:
+            step += 1
+            next_frontier = []
+            for current in frontier:
+                for offset, back in moves[masks[current]]:
+                    neighbor = current + offset
+                    if distances[neighbor] < 0:
+                        distances[neighbor] = step
+                        directions[neighbor] = back
+                        next_frontier.append(neighbor)
+            frontier = next_frontier
+        return FlowField(maze, goal, directions, distances)
+
+    # Stepping from a neighbor into ``current`` costs current's cell
+    cells = maze.cells
+    settled = bytearray(size)
+    queue = [(0, start)]
+    while queue:
+        distance, current = heapq.heappop(queue)
+        if settled[current]:
+            continue
+        settled[current] = 1
+        distance += CELL_COSTS[cells[current]]
+        for offset, back in moves[masks[current]]:
+            neighbor = current + offset
+            best = distances[neighbor]
+            if not settled[neighbor] and (best < 0 or distance < best):
+                distances[neighbor] = distance
+                directions[neighbor] = back
+                heapq.heappush(queue, (distance, neighbor))
+    return FlowField(maze, goal, directions, distances)
@@ -1,46 +1,70 @@
 from maze import Maze
-from solver import MazeSolver, DFSMazeSolver, BFSMazeSolver, AStarMazeSolver, DijkstraMazeSolver
+from solver import (MazeSolver, DFSMazeSolver, BFSMazeSolver, AStarMazeSolver, DijkstraMazeSolver,
+                    BidirectionalBFSMazeSolver, BidirectionalAStarMazeSolver, DStarLiteMazeSolver)
 from player import Player
-import os
+from cache import SolveCache, default_cache
+from renderer import TerminalRenderer
 
 class Game:
-    def __init__(self, maze: Maze, solver: MazeSolver = None):
+    def __init__(self, maze: Maze, solver: MazeSolver = None, cache: SolveCache = None, renderer: TerminalRenderer = None):
         self.maze = maze
         self.solver = solver or DFSMazeSolver()
+        self.cache = cache if cache is not None else default_cache
         self.player = Player(maze.start)
-        self.path = self.solver.solve(maze)
+        self.path = self.cache.solve(self.solver, maze)
+        self.optimal_moves = len(self.path) - 1 if self.path else None
         self.moves = 0
         self.show_path = True
+        self.message = ""
+        self.renderer = renderer or TerminalRenderer(maze)
         self.available_solvers = {
             '1': DFSMazeSolver(),
             '2': BFSMazeSolver(),
             '3': AStarMazeSolver(),
-            '4': DijkstraMazeSolver()
+            '4': DijkstraMazeSolver(),
+            '5': BidirectionalBFSMazeSolver(),
+            '6': BidirectionalAStarMazeSolver(),
+            '7': DStarLiteMazeSolver()
         }
 
-    def clear_screen(self):
-        """Clear the console screen."""
-        os.system('cls' if os.name == 'nt' else 'clear')
+    def menu_lines(self):
+        """Return the lines of the main menu."""
+        return [
+            "",
+            "="*50,
+            "           MAZE SOLVER GAME",
+            "="*50,
+            f"Moves: {self.moves}",
+            f"Current Solver: {self.solver.__class__.__name__}",
+            f"Path Length: {len(self.path) if self.path else 'No path found'}",
+            "-"*50
+        ]
+
+    def controls_lines(self):
+        """Return the lines of the controls help."""
+        return [
+            "",
+            "Controls:",
+            "  W/A/S/D - Move (Up/Left/Down/Right)",
+            "  H - Toggle path hint",
+            "  S - Switch solver algorithm",
+            "  R - Reset to start position",
+            "  Q - Quit game",
+            "-"*50
+        ]
 
     def show_menu(self):
         """Display the main menu."""
-        print("\n" + "="*50)
-        print("           MAZE SOLVER GAME")
-        print("="*50)
-        print(f"Moves: {self.moves}")
-        print(f"Current Solver: {self.solver.__class__.__name__}")
-        print(f"Path Length: {len(self.path) if self.path else 'No path found'}")
-        print("-"*50)
+        print("\n".join(self.menu_lines()))
 
     def show_controls(self):
         """Display the controls help."""
-        print("\nControls:")
-        print("  W/A/S/D - Move (Up/Left/Down/Right)")
-        print("  H - Toggle path hint")
-        print("  S - Switch solver algorithm")
-        print("  R - Reset to start position")
-        print("  Q - Quit game")
-        print("-"*50)
+        print("\n".join(self.controls_lines()))
+
+    def draw(self):
+        """Draw the menu, controls, latest message and maze, updating only what changed on screen."""
+        header = self.menu_lines() + self.controls_lines() + [self.message]
+        self.renderer.draw(header, self.player.position, self.path if self.show_path else None)
 
     def switch_solver(self):
         """Allow user to switch between different solver algorithms."""
@@ -49,20 +73,32 @@ class Game:
         print("2. BFS (Breadth-First Search)")
         print("3. A* (A-Star)")
         print("4. Dijkstra")
+        print("5. Bidirectional BFS")
+        print("6. Bidirectional A*")
+        print("7. D* Lite (replans from your position)")
         
-        choice = input("Select solver (1-4): ").strip()
+        choice = input("Select solver (1-7): ").strip()
         if choice in self.available_solvers:
             self.solver = self.available_solvers[choice]
-            self.path = self.solver.solve(self.maze)
-            print(f"Switched to {self.solver.__class__.__name__}")
+            self.path = self.cache.solve(self.solver, self.maze)
+            self.optimal_moves = len(self.path) - 1 if self.path else None
+            self.update_path()
+            self.message = f"Switched to {self.solver.__class__.__name__}"
         else:
-            print("Invalid choice. Keeping current solver.")
+            self.message = "Invalid choice. Keeping current solver."
+        self.renderer.invalidate()  # The solver list scrolled the screen
+
+    def update_path(self):
+        """Replan the hint path from the player's position, for solvers that can."""
+        if isinstance(self.solver, DStarLiteMazeSolver):
+            self.path = self.solver.replan(self.maze, self.player.position)
 
     def reset_game(self):
         """Reset the player to the start position."""
         self.player.position = self.maze.start
         self.moves = 0
-        print("Game reset to start position.")
+        self.update_path()
+        self.message = "Game reset to start position."
 
     def run(self):
         """Main game loop."""
@@ -70,18 +106,14 @@ class Game:
         print("Navigate from S (Start) to E (End)")
         
         while True:
-            self.clear_screen()
-            self.show_menu()
-            self.show_controls()
-            
-            # Display the maze
-            self.maze.display(self.player.position, self.path if self.show_path else None)
+            self.draw()
+            self.message = ""
             
             # Check win condition
             if self.player.position == self.maze.end:
                 print(f"\n🎉 Congratulations! You've reached the end in {self.moves} moves!")
-                if self.path:
-                    optimal_moves = len(self.path) - 1
+                if self.optimal_moves is not None:
+                    optimal_moves = self.optimal_moves
                     if self.moves == optimal_moves:
                         print("🏆 Perfect! You found the optimal path!")
                     elif self.moves <= optimal_moves * 1.5:
@@ -92,6 +124,7 @@ class Game:
                 play_again = input("\nPlay again? (y/n): ").lower().strip()
                 if play_again == 'y':
                     self.reset_game()
+                    self.renderer.invalidate()
                     continue
                 else:
                     print("Thanks for playing!")
@@ -105,7 +138,7 @@ class Game:
                 break
             elif move == 'h':
                 self.show_path = not self.show_path
-                print(f"Path hint {'enabled' if self.show_path else 'disabled'}")
+                self.message = f"Path hint {'enabled' if self.show_path else 'disabled'}"
             elif move == 's':
                 self.switch_solver()
             elif move == 'r':
@@ -120,7 +153,8 @@ class Game:
                 
                 if self.player.move(direction_map[move], self.maze):
                     self.moves += 1
+                    self.update_path()
                 else:
-                    print("Invalid move! You can't move through walls.")
+                    self.message = "Invalid move! You can't move through walls."
             else:
-                print("Invalid input! Use W/A/S/D to move, H for hint, S for solver, R to reset, or Q to quit.") 
\ No newline at end of file
+                self.message = "Invalid input! Use W/A/S/D to move, H for hint, S for solver, R to reset, or Q to quit." 
\ No newline at end of file
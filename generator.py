@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Maze generators for Maze Solver
+Builds seedable mazes straight into a packed cell buffer, for benchmarks and
+load-test corpora.
+
+The perfect-maze algorithms (every cell reachable by exactly one path) carve
+rooms at odd coordinates of a grid that starts out solid, knocking out the
+wall cell between two rooms to join them. Start is the top-left room and end
+the bottom-right one. Rooms are addressed directly by their cell index, so a
+room's neighbors are two cells away horizontally or two rows away vertically.
+"""
+
+import argparse
+from array import array
+import os
+import random
+from maze import Maze, WALL, OPEN
+from mazefile import save_maze
+
+def _solid(width, height):
+    """Return an all-wall cell buffer for a perfect maze to be carved into."""
+    if width < 3 or height < 3:
+        raise ValueError("Perfect mazes need a width and height of at least 3")
+    return bytearray([WALL]) * (width * height)
+
+def _room_neighbors(room, width, height):
+    """List the rooms next to a room (two cells away in each direction)."""
+    y, x = divmod(room, width)
+    neighbors = []
+    if y >= 3:
+        neighbors.append(room - 2 * width)
+    if y + 2 <= height - 2:
+        neighbors.append(room + 2 * width)
+    if x >= 3:
+        neighbors.append(room - 2)
+    if x + 2 <= width - 2:
+        neighbors.append(room + 2)
+    return neighbors
+
+def _finish(cells, width, height):
+    """Wrap carved cells into a Maze with start and end in opposite corner rooms."""
+    end = (width - 2 if width % 2 else width - 3, height - 2 if height % 2 else height - 3)
+    return Maze.from_cells(cells, width, height, (1, 1), end)
+
+def _rooms(width, height):
+    """Iterate the cell index of every room, row by row."""
+    for y in range(1, height - 1, 2):
+        yield from range(y * width + 1, y * width + width - 1, 2)
+
+def recursive_backtracker(width, height, seed=None):
+    """
+    Generate a perfect maze with a depth-first backtracker on an explicit stack.
+
+    Long winding corridors with few branches; the hardest case for DFS-like
+    solvers and the easiest for corridor contraction.
+    """
+    rng = random.Random(seed)
+    cells = _solid(width, height)
+    start = width + 1
+    cells[start] = OPEN
+    stack = [start]
+
+    while stack:
+        room = stack[-1]
+        options = [neighbor for neighbor in _room_neighbors(room, width, height) if cells[neighbor] == WALL]
+        if not options:
+            stack.pop()
+            continue
+
+        neighbor = options[rng.randrange(len(options))] if len(options) > 1 else options[0]
+        cells[(room + neighbor) // 2] = OPEN  # Knock out the wall between them
+        cells[neighbor] = OPEN
+        stack.append(neighbor)
+
+    return _finish(cells, width, height)
+
+def kruskal(width, height, seed=None):
+    """
+    Generate a perfect maze with randomized Kruskal's algorithm.
+
+    Every wall between two rooms is visited in random order and removed when
+    the rooms are not yet connected, tracked with a union-find over rooms.
+    Produces many short dead ends.
+    """
+    rng = random.Random(seed)
+    cells = _solid(width, height)
+    parents = array('i', range(width * height))
+
+    def find(room):
+        while parents[room] != room:
+            parents[room] = parents[parents[room]]  # Path halving
+            room = parents[room]
+        return room
+
+    # Each wall cell between two rooms stands for that edge
+    walls = []
+    for room in _rooms(width, height):
+        y, x = divmod(room, width)
+        if x + 2 <= width - 2:
+            walls.append(room + 1)
+        if y + 2 <= height - 2:
+            walls.append(room + width)
+        cells[room] = OPEN
+    rng.shuffle(walls)
+
+    for wall in walls:
+        if (wall // width) % 2:
+            first, second = wall - 1, wall + 1  # Wall between horizontal neighbors
+        else:
+            first, second = wall - width, wall + width
+        first_root, second_root = find(first), find(second)
+        if first_root != second_root:
+            parents[first_root] = second_root
+            cells[wall] = OPEN
+
+    return _finish(cells, width, height)
+
+def prim(width, height, seed=None):
+    """
+    Generate a perfect maze with randomized Prim's algorithm.
+
+    The maze grows outward from the start by joining a random frontier room to
+    a random room already in the maze. Produces short, branching corridors.
+    """
+    rng = random.Random(seed)
+    cells = _solid(width, height)
+    in_frontier = bytearray(width * height)
+    start = width + 1
+    cells[start] = OPEN
+    frontier = []
+    for neighbor in _room_neighbors(start, width, height):
+        in_frontier[neighbor] = 1
+        frontier.append(neighbor)
+
+    while frontier:
+        # Swap-remove a random frontier room
+        position = rng.randrange(len(frontier))
+        room = frontier[position]
+        frontier[position] = frontier[-1]
+        frontier.pop()
+
+        carved = []
+        for neighbor in _room_neighbors(room, width, height):
+            if cells[neighbor] == OPEN:
+                carved.append(neighbor)
+            elif not in_frontier[neighbor]:
+                in_frontier[neighbor] = 1
+                frontier.append(neighbor)
+
+        neighbor = carved[rng.randrange(len(carved))]
+        cells[(room + neighbor) // 2] = OPEN
+        cells[room] = OPEN
+
+    return _finish(cells, width, height)
+
+def wilson(width, height, seed=None):
+    """
+    Generate a perfect maze with Wilson's algorithm (loop-erased random walks).
+
+    Samples uniformly from all perfect mazes, so it has no directional bias,
+    at the cost of long random walks while the maze is still small.
+    """
+    rng = random.Random(seed)
+    cells = _solid(width, height)
+    # exits[room] is the neighbor a walk last left that room towards;
+    # overwriting it on revisits erases the loop
+    exits = array('i', [0]) * (width * height)
+    cells[width + 1] = OPEN
+
+    for start in _rooms(width, height):
+        if cells[start] == OPEN:
+            continue
+
+        room = start
+        while cells[room] == WALL:
+            neighbors = _room_neighbors(room, width, height)
+            exits[room] = neighbors[rng.randrange(len(neighbors))]
+            room = exits[room]
+
+        room = start
+        while cells[room] == WALL:
+            cells[room] = OPEN
+            cells[(room + exits[room]) // 2] = OPEN
+            room = exits[room]
+
+    return _finish(cells, width, height)
+
+def random_noise(width, height, wall_density=0.3, seed=None):
+    """
+    Generate an imperfect maze where each cell is a wall with a fixed probability.
+
+    Start and end sit in opposite corners and are always open; the maze may
+    have no solution when the density is high.
+
+    Args:
+        width (int): Number of columns
+        height (int): Number of rows
+        wall_density (float): Probability that a cell is a wall (0.0 - 1.0)
+        seed (int): Random seed
+    """
+    if width * height < 2:
+        raise ValueError("A maze needs room for a start and an end")
+
+    # Random bytes below the threshold become walls, in one translate call
+    rng = random.Random(seed)
+    threshold = round(wall_density * 256)
+    table = bytes(WALL if value < threshold else OPEN for value in range(256))
+    cells = bytearray(rng.randbytes(width * height).translate(table))
+    cells[0] = OPEN
+    cells[-1] = OPEN
+    return Maze.from_cells(cells, width, height, (0, 0), (width - 1, height - 1))
+
+# Command-line names for every generator
+GENERATORS = {
+    'backtracker': recursive_backtracker,
+    'kruskal': kruskal,
+    'prim': prim,
+    'wilson': wilson,
+    'noise': random_noise
+}
+
+def generate_maze(width, height, algorithm='backtracker', seed=None, **options):
+    """
+    Generate a maze with a named algorithm.
+
+    Args:
+        width (int): Number of columns
+        height (int): Number of rows
+        algorithm (str): Key into GENERATORS
+        seed (int): Random seed; the same seed always gives the same maze
+        options: Extra settings for the algorithm (e.g. wall_density for 'noise')
+
+    Returns:
+        Maze: The generated maze
+    """
+    if algorithm not in GENERATORS:
+        raise ValueError(f"Unknown maze generator: {algorithm}")
+    return GENERATORS[algorithm](width, height, seed=seed, **options)
+
+def main(argv=None):
+    """Command-line entry point: write a reproducible corpus of .maze files."""
+    parser = argparse.ArgumentParser(description="Generate a corpus of mazes.")
+    parser.add_argument('output', help="Directory to write .maze files into")
+    parser.add_argument('--algorithm', default='backtracker', choices=sorted(GENERATORS))
+    parser.add_argument('--width', type=int, default=101)
+    parser.add_argument('--height', type=int, default=101)
+    parser.add_argument('--count', type=int, default=1, help="Number of mazes")
+    parser.add_argument('--seed', type=int, default=0, help="Seed of the first maze; later ones count up")
+    parser.add_argument('--wall-density', type=float, default=0.3, help="Wall probability for 'noise'")
+    args = parser.parse_args(argv)
+
+    options = {'wall_density': args.wall_density} if args.algorithm == 'noise' else {}
+    os.makedirs(args.output, exist_ok=True)
+    for seed in range(args.seed, args.seed + args.count):
+        maze = generate_maze(args.width, args.height, args.algorithm, seed, **options)
+        save_maze(maze, os.path.join(args.output, f"{args.algorithm}-{args.width}x{args.height}-{seed}.maze"))
+
+if __name__ == "__main__":
+    main()
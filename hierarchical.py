@@ -0,0 +1,230 @@
+"""
+Hierarchical pathfinding (HPA*) abstraction for Maze Solver.
+
+The maze is split into square clusters. Wherever two neighboring clusters
+share a run of open cells along their border (an entrance), one or two
+transitions are placed across it; the cells on either side become abstract
+nodes. Inside each cluster the cheapest cost between every pair of its nodes
+is precomputed with a search confined to the cluster. A query then searches
+this small abstract graph and refines each abstract edge back into cells.
+
+Entrances depend only on the cells beside a border, and the intra-cluster
+costs only on the cells of one cluster, so an edit rebuilds just the
+clusters (and borders) it touches.
+"""
+
+import heapq
+from maze import Maze, CELL_COSTS, WALL
+
+# Entrances at least this wide get a transition at each end instead of one in the middle
+_WIDE_ENTRANCE = 6
+
+
+class Hierarchy:
+    """Clusters, entrances and intra-cluster costs of one maze at one cluster size."""
+
+    def __init__(self, maze: Maze, cluster_size=16):
+        """
+        Args:
+            maze (Maze): The maze to abstract
+            cluster_size (int): Width and height of a cluster in cells; larger
+                clusters mean fewer abstract nodes but costlier refinement
+        """
+        if cluster_size < 2:
+            raise ValueError("Clusters must be at least 2 cells wide")
+
+        self.maze = maze
+        self.cluster_size = cluster_size
+        self.columns = -(-maze.width // cluster_size)
+        self.rows = -(-maze.height // cluster_size)
+        self.borders = {}  # (cluster, right or lower neighbor) -> [(cell, neighbor cell), ...]
+        self.edges = {}  # cluster -> {node: [(node, cost), ...]}
+        self.clusters_rebuilt = 0
+
+        count = self.columns * self.rows
+        self._dirty_clusters = set(range(count))
+        self._dirty_borders = set()
+        for cluster in range(count):
+            if cluster % self.columns < self.columns - 1:
+                self._dirty_borders.add((cluster, cluster + 1))
+            if cluster + self.columns < count:
+                self._dirty_borders.add((cluster, cluster + self.columns))
+
+    def cluster_of(self, index):
+        """Return the cluster holding a cell index."""
+        y, x = divmod(index, self.maze.width)
+        return (y // self.cluster_size) * self.columns + x // self.cluster_size
+
+    def bounds(self, cluster):
+        """Return the (x0, y0, x1, y1) cell bounds of a cluster, exclusive at the far side."""
+        row, column = divmod(cluster, self.columns)
+        x0 = column * self.cluster_size
+        y0 = row * self.cluster_size
+        return x0, y0, min(x0 + self.cluster_size, self.maze.width), min(y0 + self.cluster_size, self.maze.height)
+
+    def cells_changed(self, indices):
+        """Mark the clusters and borders holding edited cells for rebuilding on next use."""
+        width = self.maze.width
+        for index in indices:
+            cluster = self.cluster_of(index)
+            self._dirty_clusters.add(cluster)
+            y, x = divmod(index, width)
+            x0, y0, x1, y1 = self.bounds(cluster)
+            if x == x0 and x0 > 0:
+                self._dirty_borders.add((cluster - 1, cluster))
+            if x == x1 - 1 and x1 < width:
+                self._dirty_borders.add((cluster, cluster + 1))
+            if y == y0 and y0 > 0:
+                self._dirty_borders.add((cluster - self.columns, cluster))
+            if y == y1 - 1 and y1 < self.maze.height:
+                self._dirty_borders.add((cluster, cluster + self.columns))
+
+    def refresh(self):
+        """
+        Rebuild every border and cluster marked dirty since the last refresh.
+
+        A changed border changes the nodes of the clusters on both sides, so
+        both are rebuilt too.
+
+        Returns:
+            int: Number of clusters rebuilt
+        """
+        for border in self._dirty_borders:
+            self.borders[border] = self._find_transitions(*border)
+            self._dirty_clusters.update(border)
+
+        for cluster in self._dirty_clusters:
+            self.edges[cluster] = self._connect(cluster)
+
+        rebuilt = len(self._dirty_clusters)
+        self.clusters_rebuilt += rebuilt
+        self._dirty_borders = set()
+        self._dirty_clusters = set()
+        return rebuilt
+
+    @property
+    def node_count(self):
+        """Number of abstract nodes."""
+        return sum(len(nodes) for nodes in self.edges.values())
+
+    def _find_transitions(self, cluster, neighbor):
+        """Place transitions across the entrances on the border between two clusters."""
+        cells = self.maze.cells
+        width = self.maze.width
+        x0, y0, x1, y1 = self.bounds(cluster)
+        if neighbor - cluster == 1 and self.columns > 1:
+            # Vertical border: the cluster's last column against the next one's first
+            sides = [(y * width + x1 - 1, y * width + x1) for y in range(y0, y1)]
+        else:
+            sides = [((y1 - 1) * width + x, y1 * width + x) for x in range(x0, x1)]
+
+        transitions = []
+        run = []
+        for pair in sides + [None]:
+            if pair is not None and cells[pair[0]] != WALL and cells[pair[1]] != WALL:
+                run.append(pair)
+                continue
+            if len(run) >= _WIDE_ENTRANCE:
+                transitions += (run[0], run[-1])
+            elif run:
+                transitions.append(run[len(run) // 2])
+            run = []
+        return transitions
+
+    def _connect(self, cluster):
+        """Collect a cluster's nodes and link them to each other and across borders."""
+        cells = self.maze.cells
+        edges = {}
+        for border in ((cluster - 1, cluster), (cluster, cluster + 1),
+                       (cluster - self.columns, cluster), (cluster, cluster + self.columns)):
+            for first, second in self.borders.get(border, ()):
+                node, other = (first, second) if border[0] == cluster else (second, first)
+                edges.setdefault(node, []).append((other, CELL_COSTS[cells[other]]))
+
+        # One search covers both directions of every pair: reversing a path
+        # swaps which of its two end cells is paid for
+        nodes = list(edges)
+        for position, node in enumerate(nodes[:-1]):
+            others = nodes[position + 1:]
+            costs = self.search(cluster, node, others)[0]
+            for other in others:
+                if other in costs:
+                    edges[node].append((other, costs[other]))
+                    edges[other].append((node, costs[other] - CELL_COSTS[cells[other]] + CELL_COSTS[cells[node]]))
+        return edges
+
+    def search(self, cluster, source, targets=()):
+        """
+        Find the cheapest costs from one cell to the others of its cluster.
+
+        The search never leaves the cluster. It is a BFS when the cluster has
+        no weighted cells and Dijkstra's algorithm otherwise.
+
+        Args:
+            cluster (int): The cluster to stay inside
+            source (int): Cell index to search from
+            targets (iterable): Cell indices to stop at once all are reached;
+                empty to search the whole cluster
+
+        Returns:
+            tuple: (costs, parents, cells expanded), costs and parents being
+            dicts keyed by cell index
+        """
+        maze = self.maze
+        masks, offsets = maze.neighbor_index()
+        cells = maze.cells
+        width = maze.width
+        x0, y0, x1, y1 = self.bounds(cluster)
+        costs = {source: 0}
+        parents = {source: source}
+        remaining = set(targets)
+        remaining.discard(source)
+        expanded = 0
+
+        weighted = any(
+            max(cells[y * width + x0:y * width + x1]) > WALL for y in range(y0, y1)
+        )
+        if not weighted:
+            frontier = [source]
+            while frontier and (remaining or not targets):
+                next_frontier = []
+                for current in frontier:
+                    expanded += 1
+                    cost = costs[current] + 1
+                    for offset in offsets[masks[current]]:
+                        neighbor = current + offset
+                        if neighbor in costs:
+                            continue
+                        y, x = divmod(neighbor, width)
+                        if x0 <= x < x1 and y0 <= y < y1:
+                            costs[neighbor] = cost
+                            parents[neighbor] = current
+                            next_frontier.append(neighbor)
+                            remaining.discard(neighbor)
+                frontier = next_frontier
+            return costs, parents, expanded
+
+        settled = set()
+        queue = [(0, source)]
+        while queue and (remaining or not targets):
+            cost, current = heapq.heappop(queue)
+            if current in settled:
+                continue
+            settled.add(current)
+            remaining.discard(current)
+            expanded += 1
+
+            for offset in offsets[masks[current]]:
+                neighbor = current + offset
+                y, x = divmod(neighbor, width)
+                if not (x0 <= x < x1 and y0 <= y < y1) or neighbor in settled:
+                    continue
+                new_cost = cost + CELL_COSTS[cells[neighbor]]
+                best = costs.get(neighbor)
+                if best is None or new_cost < best:
+                    costs[neighbor] = new_cost
+                    parents[neighbor] = current
+                    heapq.heappush(queue, (new_cost, neighbor))
+
+        # Costs of cells still queued are only upper bounds
+        return {cell: costs[cell] for cell in settled}, parents, expanded
@@ -1,5 +1,6 @@
 from maze import Maze
-from solver import DFSMazeSolver, BFSMazeSolver, AStarMazeSolver, DijkstraMazeSolver
+from solver import (DFSMazeSolver, BFSMazeSolver, AStarMazeSolver, DijkstraMazeSolver,
+                    BidirectionalBFSMazeSolver, BidirectionalAStarMazeSolver, DStarLiteMazeSolver)
 from game import Game
 
 def create_simple_maze():
@@ -83,10 +84,13 @@ def select_solver():
     print("2. BFS (Breadth-First Search)")
     print("3. A* (A-Star)")
     print("4. Dijkstra")
+    print("5. Bidirectional BFS")
+    print("6. Bidirectional A*")
+    print("7. D* Lite (replans from your position)")
     print("-"*50)
     
     while True:
-        choice = input("Select solver (1-4): ").strip()
+        choice = input("Select solver (1-7): ").strip()
         if choice == '1':
             return DFSMazeSolver(), "DFS"
         elif choice == '2':
@@ -95,8 +99,14 @@ def select_solver():
             return AStarMazeSolver(), "A*"
         elif choice == '4':
             return DijkstraMazeSolver(), "Dijkstra"
+        elif choice == '5':
+            return BidirectionalBFSMazeSolver(), "Bidirectional BFS"
+        elif choice == '6':
+            return BidirectionalAStarMazeSolver(), "Bidirectional A*"
+        elif choice == '7':
+            return DStarLiteMazeSolver(), "D* Lite"
         else:
-            print("Invalid choice. Please select 1-4.")
+            print("Invalid choice. Please select 1-7.")
 
 def main():
     """Main function to run the maze solver game."""
@@ -1,44 +1,542 @@
+from array import array
+import hashlib
+import struct
+
+WALL = 1
+OPEN = 0
+MAX_COST = 255
+
+# Cost of stepping into a cell, indexed by its byte value. OPEN cells cost 1
+# and values 2-255 are weighted cells costing their own value.
+CELL_COSTS = tuple(1 if value == OPEN else value for value in range(MAX_COST + 1))
+
+_OPEN_TABLE = bytes(0 if value == WALL else 1 for value in range(256))
+_WALL_TABLE = bytes(1 if value == WALL else 0 for value in range(256))
+
+# Display character of every cell value, for str.translate on latin-1 decoded rows
+_DISPLAY_TABLE = {
+    value: "█" if value == WALL else " " if value == OPEN else str(value) if value < 10 else "+"
+    for value in range(256)
+}
+
+# Starting labels for component_labels as signed bytes: -1 walls, -2 open cells not labeled yet
+_UNLABELED = -2
+_UNLABELED_TABLE = bytes((-1 if value == WALL else _UNLABELED) & 0xFF for value in range(256))
+
+# Serialized maze header: magic, bits per cell (1 = bit-packed walls,
+# 8 = one byte per cell), width, height, start x/y, end x/y
+MAZE_MAGIC = b'MAZE'
+MAZE_HEADER = struct.Struct('<4sB3xIIIIII')
+
+# Open-direction bits stored per cell by the neighbor index, in the order
+# get_neighbors reports them.
+UP, DOWN, LEFT, RIGHT = 1, 2, 4, 8
+DIRECTIONS = ((0, -1, UP), (0, 1, DOWN), (-1, 0, LEFT), (1, 0, RIGHT))
+
+# Direction bit pointing back the other way, e.g. a cell's UP neighbor sees it as DOWN
+_OPPOSITE = {UP: DOWN, DOWN: UP, LEFT: RIGHT, RIGHT: LEFT}
+
+# (dx, dy) steps for each of the 16 possible direction masks
+_MASK_STEPS = tuple(
+    tuple((dx, dy) for dx, dy, bit in DIRECTIONS if mask & bit) for mask in range(16)
+)
+
+
+
+def pack_walls(cells):
+    """
+    Pack cells into one bit per cell (set = wall), least significant bit first.
+    
+    Each group of eight cells becomes one byte. Instead of looping per cell,
+    the k-th cell of every group is gathered with an extended slice and
+    shifted into bit k of one big integer, so packing runs at C speed.
+    """
+    walls = bytes(cells).translate(_WALL_TABLE)
+    walls += bytes(-len(walls) % 8)  # Pad to whole bytes
+    packed = 0
+    for bit in range(8):
+        packed |= int.from_bytes(walls[bit::8], 'little') << bit
+    return packed.to_bytes(len(walls) // 8, 'little')
+
+
+def unpack_walls(data, size):
+    """Expand bit-packed walls from pack_walls back into a bytearray of WALL/OPEN cells."""
+    byte_count = (size + 7) // 8
+    packed = int.from_bytes(data[:byte_count], 'little')
+    ones = int.from_bytes(b'\x01' * byte_count, 'little')
+    cells = bytearray(byte_count * 8)
+    for bit in range(8):
+        cells[bit::8] = ((packed >> bit) & ones).to_bytes(byte_count, 'little')
+    del cells[size:]
+    return cells
+
+
+def parse_header(data):
+    """
+    Read and check the header of a serialized maze (Maze.to_bytes or a .maze file).
+
+    The body length is checked against the dimensions before anything is
+    decoded, so a forged header cannot force a huge allocation.
+
+    Args:
+        data: bytes-like object holding the header and body
+
+    Returns:
+        tuple: (cell bits, width, height, start, end, body as a memoryview)
+
+    Raises:
+        ValueError: If the data is not a maze, uses an unknown cell size, is
+            truncated, or puts the start or end outside the grid
+    """
+    if len(data) < MAZE_HEADER.size:
+        raise ValueError("Data is too short for a maze header")
+    magic, cell_bits, width, height, start_x, start_y, end_x, end_y = MAZE_HEADER.unpack_from(data)
+    if magic != MAZE_MAGIC:
+        raise ValueError("Data is not a serialized maze")
+    if cell_bits not in (1, 8):
+        raise ValueError(f"Unsupported cell size: {cell_bits} bits")
+    if not (start_x < width and start_y < height and end_x < width and end_y < height):
+        raise ValueError("Start or end lies outside the maze")
+
+    size = width * height
+    body = memoryview(data)[MAZE_HEADER.size:]
+    if len(body) < (size if cell_bits == 8 else (size + 7) // 8):
+        raise ValueError("Maze data is truncated")
+    return cell_bits, width, height, (start_x, start_y), (end_x, end_y), body
+
+
 class Maze:
     def __init__(self, grid):
-        self.grid = grid
+        self.height = len(grid)
+        self.width = len(grid[0])
+        self.cells = bytearray(self.width * self.height)
         self.start = None
         self.end = None
-        self.find_special_cells()
+        self.version = 0
+        self._listeners = []
+        self._reset_caches()
+        self.find_special_cells(grid)
 
-    def find_special_cells(self):
-        """Find and set the start ('S') and end ('E') positions in the maze."""
-        for y, row in enumerate(self.grid):
-            for x, cell in enumerate(row):
-                if cell == 'S':
-                    self.start = (x, y)
-                elif cell == 'E':
-                    self.end = (x, y)
+    @classmethod
+    def from_cells(cls, cells, width, height, start, end):
+        """
+        Build a maze directly from a packed cell buffer.
+
+        Args:
+            cells (bytearray): Row-major buffer of ``width * height`` cells
+                (WALL, OPEN or a traversal cost from 2 to MAX_COST); any
+                sequence of ints with ``count`` and ``bytes()`` support works,
+                such as the memory-mapped cells from mazefile.load_maze
+            width (int): Number of columns
+            height (int): Number of rows
+            start (tuple): Start position
+            end (tuple): End position
+
+        Returns:
+            Maze: A maze backed by ``cells`` without copying it
+        """
+        if len(cells) != width * height:
+            raise ValueError("Cell buffer size does not match maze dimensions")
+
+        maze = cls.__new__(cls)
+        maze.width = width
+        maze.height = height
+        maze.cells = cells
+        maze.start = start
+        maze.end = end
+        maze.version = 0
+        maze._listeners = []
+        maze._reset_caches()
+        return maze
+
+    def _reset_caches(self):
+        """Drop everything derived from ``cells`` so it is rebuilt on next use."""
+        self._neighbor_masks = None
+        self._neighbor_offsets = None
+        self._cells_digest = None
+        self._component_labels = None
+        self._reduction = None
+        self._hierarchies = {}
+        self._flow_fields = {}
+        self._stats = None
+        self._weighted = None
+
+    def _cells_changed(self, indices):
+        """Bring derived data up to date after the cells at ``indices`` were edited."""
+        self._cells_digest = None
+        self._component_labels = None  # Edits can join or split regions
+        self._reduction = None
+        self._flow_fields = {}
+        self._stats = None
+        self._weighted = None
+        if self._neighbor_masks is not None:
+            for index in indices:
+                self._update_neighbor_masks(index)
+        for hierarchy in self._hierarchies.values():
+            hierarchy.cells_changed(indices)  # Rebuilt cluster by cluster on next use
+
+    def content_hash(self):
+        """
+        Return a hex digest identifying the maze layout, start and end.
+        
+        The digest of the cell buffer is computed once and reused; start and
+        end are mixed in on every call so moving them changes the hash.
+        """
+        if self._cells_digest is None:
+            cells = self.cells if isinstance(self.cells, (bytes, bytearray)) else bytes(self.cells)
+            self._cells_digest = hashlib.blake2b(cells, digest_size=16).digest()
+        
+        header = f"{self.width}x{self.height}:{self.start}:{self.end}".encode()
+        return hashlib.blake2b(header + self._cells_digest, digest_size=16).hexdigest()
+
+    def to_bytes(self):
+        """
+        Serialize the maze into a compact header plus cell body.
+        
+        Unweighted mazes are stored with one bit per cell (set = wall);
+        weighted mazes keep one byte per cell so costs survive.
+        
+        Returns:
+            bytes: The serialized maze, readable by Maze.from_bytes
+        """
+        cell_bits = 8 if self.is_weighted() else 1
+        header = MAZE_HEADER.pack(MAZE_MAGIC, cell_bits, self.width, self.height, *self.start, *self.end)
+        body = bytes(self.cells) if cell_bits == 8 else pack_walls(self.cells)
+        return header + body
+
+    @classmethod
+    def from_bytes(cls, data):
+        """
+        Rebuild a maze serialized by to_bytes.
+        
+        Args:
+            data (bytes): Header followed by the cell body
+            
+        Returns:
+            Maze: The deserialized maze
+            
+        Raises:
+            ValueError: If the data is not a maze, is truncated, or puts the
+                start or end outside the grid
+        """
+        cell_bits, width, height, start, end, body = parse_header(data)
+        size = width * height
+        if cell_bits == 8:
+            cells = bytearray(body[:size])
+        else:
+            cells = unpack_walls(body, size)
+        
+        return cls.from_cells(cells, width, height, start, end)
+
+    def find_special_cells(self, grid):
+        """Pack the grid into the cell buffer and set the start ('S') and end ('E') positions."""
+        width = self.width
+        for y, row in enumerate(grid):
+            if len(row) != width:
+                raise ValueError(f"Row {y} has {len(row)} cells, expected {width}")
+
+            try:
+                packed = bytearray(row)
+            except (TypeError, ValueError):
+                # Rows holding 'S'/'E' (or out-of-byte values) take the slow path
+                packed = bytearray(self._cell_value(cell) for cell in row)
+                for x, cell in enumerate(row):
+                    if cell == 'S':
+                        self.start = (x, y)
+                    elif cell == 'E':
+                        self.end = (x, y)
+
+            self.cells[y * width:(y + 1) * width] = packed
         
         if self.start is None:
             raise ValueError("No start position ('S') found in maze")
         if self.end is None:
             raise ValueError("No end position ('E') found in maze")
 
+    @staticmethod
+    def _cell_value(cell):
+        """Map a grid entry to its packed byte: WALL, OPEN or a traversal cost."""
+        if cell == 1:
+            return WALL
+        if isinstance(cell, int) and 2 <= cell <= MAX_COST:
+            return cell
+        return OPEN
+
+    @property
+    def grid(self):
+        """
+        Rebuild the maze as a list of lists (1 = wall, 0 = path, 2+ = weighted path, 'S'/'E').
+
+        This is a compatibility view that allocates a new grid on every access;
+        use ``cells`` with ``to_index`` in performance-sensitive code.
+        """
+        width = self.width
+        grid = [list(self.cells[y * width:(y + 1) * width]) for y in range(self.height)]
+        grid[self.start[1]][self.start[0]] = 'S'
+        grid[self.end[1]][self.end[0]] = 'E'
+        return grid
+
+    def to_index(self, position):
+        """Convert an (x, y) position into an index into ``cells``."""
+        return position[1] * self.width + position[0]
+
+    def to_position(self, index):
+        """Convert an index into ``cells`` back into an (x, y) position."""
+        y, x = divmod(index, self.width)
+        return (x, y)
+
+    def neighbor_index(self):
+        """
+        Return the precomputed neighbor index, building it on first use.
+
+        The index holds one 4-bit open-direction mask per cell (UP, DOWN, LEFT,
+        RIGHT) and a table mapping each mask to the index offsets of the open
+        neighbors, in get_neighbors order. Solvers working on flat indices
+        expand a node with ``for offset in offsets[masks[index]]``.
+
+        Returns:
+            tuple: (masks, offsets) where masks is a bytearray with one entry per
+            cell and offsets is a 16-entry tuple of offset tuples
+        """
+        if self._neighbor_masks is None:
+            width = self.width
+            size = width * self.height
+            row_shift = width * 8
+
+            # Each cell is one byte (1 = open), so shifting the whole buffer as
+            # a big integer lines every cell up with its neighbor in one step.
+            open_cells = int.from_bytes(bytes(self.cells).translate(_OPEN_TABLE), 'little')
+            all_cells = (1 << (size * 8)) - 1
+            not_first_col = int.from_bytes((b'\x00' + b'\x01' * (width - 1)) * self.height, 'little')
+            not_last_col = int.from_bytes((b'\x01' * (width - 1) + b'\x00') * self.height, 'little')
+
+            up = (open_cells << row_shift) & all_cells
+            down = open_cells >> row_shift
+            left = (open_cells << 8) & not_first_col
+            right = (open_cells >> 8) & not_last_col
+            masks = up | (down << 1) | (left << 2) | (right << 3)
+
+            self._neighbor_masks = bytearray(masks.to_bytes(size, 'little'))
+            self._neighbor_offsets = tuple(
+                tuple(dy * width + dx for dx, dy in steps) for steps in _MASK_STEPS
+            )
+
+        return self._neighbor_masks, self._neighbor_offsets
+
+    def component_labels(self):
+        """
+        Return the connected-region label of every cell, building it on first use.
+
+        Open cells share a label exactly when one can reach the other; walls
+        are -1. Labeling is one flood fill per region over the neighbor index,
+        with the next unlabeled cell found by a C-level ``index`` scan.
+
+        Returns:
+            array: One int label per cell, numbered from 0 in row-major order
+        """
+        if self._component_labels is None:
+            masks, offsets = self.neighbor_index()
+            labels = array('i', array('b', bytes(self.cells).translate(_UNLABELED_TABLE)))
+            label = 0
+            start = 0
+            while True:
+                try:
+                    start = labels.index(_UNLABELED, start)
+                except ValueError:
+                    break
+
+                labels[start] = label
+                frontier = [start]
+                while frontier:
+                    next_frontier = []
+                    for current in frontier:
+                        for offset in offsets[masks[current]]:
+                            neighbor = current + offset
+                            if labels[neighbor] == _UNLABELED:
+                                labels[neighbor] = label
+                                next_frontier.append(neighbor)
+                    frontier = next_frontier
+                label += 1
+
+            self._component_labels = labels
+
+        return self._component_labels
+
+    def is_reachable(self, source, target):
+        """
+        Check if a path exists between two positions, in O(1) once labeled.
+
+        Returns:
+            bool: True if both positions are open and in the same region
+        """
+        if not self.is_valid_position(source) or not self.is_valid_position(target):
+            return False
+        labels = self.component_labels()
+        label = labels[self.to_index(source)]
+        return label >= 0 and label == labels[self.to_index(target)]
+
+    def is_known_unreachable(self, source, target):
+        """
+        Check whether region labels already built prove there is no path.
+
+        Never labels the maze itself, so it costs O(1) whether or not labels
+        exist: solvers call it before searching and only skip the search when
+        an earlier is_reachable() (since the last edit) has done the work.
+
+        Returns:
+            bool: True if the cached labels put the positions in different regions
+        """
+        if self._component_labels is None:
+            return False
+        return not self.is_reachable(source, target)
+
+    def reduction(self):
+        """
+        Return the maze with dead ends filled and corridors contracted, building it on first use.
+
+        Returns:
+            ReducedMaze: The pruned maze and its junction graph (see reduction.py)
+        """
+        if self._reduction is None:
+            from reduction import reduce_maze
+            self._reduction = reduce_maze(self)
+        return self._reduction
+
+    def hierarchy(self, cluster_size=16):
+        """
+        Return the HPA* abstraction for a cluster size, building or repairing it first.
+
+        One abstraction is kept per cluster size. After edits, only the
+        clusters holding changed cells (and their neighbors across a changed
+        border) are rebuilt.
+
+        Returns:
+            Hierarchy: Clusters, entrances and intra-cluster costs (see hierarchical.py)
+        """
+        hierarchy = self._hierarchies.get(cluster_size)
+        if hierarchy is None:
+            from hierarchical import Hierarchy
+            hierarchy = self._hierarchies[cluster_size] = Hierarchy(self, cluster_size)
+        hierarchy.refresh()
+        return hierarchy
+
+    def _update_neighbor_masks(self, index):
+        """Point the neighbors of one edited cell towards it, or away if it is now a wall."""
+        masks = self._neighbor_masks
+        is_open = self.cells[index] != WALL
+        x, y = self.to_position(index)
+        for dx, dy, bit in DIRECTIONS:
+            if 0 <= x + dx < self.width and 0 <= y + dy < self.height:
+                neighbor = index + dy * self.width + dx
+                if is_open:
+                    masks[neighbor] |= _OPPOSITE[bit]
+                else:
+                    masks[neighbor] &= ~_OPPOSITE[bit]
+
+    def set_wall(self, position, wall=True):
+        """
+        Close a cell with a wall, or open it.
+
+        Returns:
+            bool: True if the cell changed
+        """
+        return bool(self.set_walls([(position, wall)]))
+
+    def set_walls(self, changes):
+        """
+        Close or open several cells, then notify listeners once.
+
+        Opening a weighted cell leaves its cost in place. The first edit of a
+        read-only buffer (such as a memory-mapped maze file) copies it into a
+        bytearray, so the file itself is never written.
+
+        Args:
+            changes (iterable): (position, wall) pairs
+
+        Returns:
+            list: Positions that actually changed
+        """
+        # Check every change before writing any, so a bad one leaves the maze untouched
+        changes = list(changes)
+        for position, wall in changes:
+            if not self.is_valid_position(position):
+                raise ValueError(f"Position {position} is outside the maze")
+            if wall and position in (self.start, self.end):
+                raise ValueError("The start and end cannot be walls")
+
+        changed = []
+        for position, wall in changes:
+            index = self.to_index(position)
+            if (self.cells[index] == WALL) == bool(wall):
+                continue
+            if not isinstance(self.cells, bytearray):
+                self.cells = bytearray(self.cells)
+            self.cells[index] = WALL if wall else OPEN
+            changed.append(position)
+
+        if changed:
+            self._cells_changed([self.to_index(position) for position in changed])
+            self.version += 1
+            for listener in list(self._listeners):
+                listener(self, changed)
+        return changed
+
+    def add_listener(self, listener):
+        """
+        Call ``listener(maze, positions)`` after every set_wall/set_walls edit.
+
+        Args:
+            listener (callable): Receives the maze and the list of changed positions
+        """
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener):
+        """Stop notifying a listener added with add_listener."""
+        self._listeners.remove(listener)
+
     def is_wall(self, position):
         """Return True if the position is a wall (1) or out of bounds."""
         x, y = position
         
         # Check if position is out of bounds
-        if y < 0 or y >= len(self.grid) or x < 0 or x >= len(self.grid[0]):
+        if y < 0 or y >= self.height or x < 0 or x >= self.width:
             return True
         
-        # Check if the cell is a wall (1) or start/end positions
-        cell = self.grid[y][x]
-        return cell == 1
+        # Start and end are stored as OPEN cells
+        return self.cells[y * self.width + x] == WALL
+
+    def get_cost(self, position):
+        """Return the cost of stepping into a position (infinite for walls)."""
+        if self.is_wall(position):
+            return float('inf')
+        
+        x, y = position
+        return CELL_COSTS[self.cells[y * self.width + x]]
+
+    def is_weighted(self):
+        """Check if any cell costs more than 1 to traverse (scanned once per edit)."""
+        if self._weighted is None:
+            self._weighted = self.cells.count(WALL) + self.cells.count(OPEN) < len(self.cells)
+        return self._weighted
+
+    def get_path_cost(self, path):
+        """Total cost of walking a path, counting every cell after the first."""
+        return sum(self.get_cost(position) for position in path[1:])
 
     def is_valid_position(self, position):
         """Check if a position is within the maze bounds."""
         x, y = position
-        return 0 <= y < len(self.grid) and 0 <= x < len(self.grid[0])
+        return 0 <= y < self.height and 0 <= x < self.width
 
     def get_neighbors(self, position):
         """Get valid neighboring positions (up, down, left, right)."""
         x, y = position
+        
+        if 0 <= x < self.width and 0 <= y < self.height:
+            masks = self.neighbor_index()[0]
+            return [(x + dx, y + dy) for dx, dy in _MASK_STEPS[masks[y * self.width + x]]]
+        
+        # Positions outside the maze fall back to a bounds-checked scan
         neighbors = []
         
         # Check all four directions
@@ -53,22 +551,43 @@ class Maze:
         
         return neighbors
 
-    def get_maze_stats(self):
-        """Get statistics about the maze."""
-        total_cells = len(self.grid) * len(self.grid[0])
-        wall_cells = sum(row.count(1) for row in self.grid)
-        path_cells = total_cells - wall_cells - 2  # Subtract start and end
-        
-        return {
-            'width': len(self.grid[0]),
-            'height': len(self.grid),
-            'total_cells': total_cells,
-            'wall_cells': wall_cells,
-            'path_cells': path_cells,
-            'wall_percentage': (wall_cells / total_cells) * 100,
-            'start': self.start,
-            'end': self.end
-        }
+    def get_maze_stats(self, include_reduction=False):
+        """
+        Get statistics about the maze.
+        
+        The grid is only scanned on the first call after it changes; later
+        calls reuse the counts. The junction graph fields ('dead_end_cells',
+        'junction_nodes', 'corridor_edges' and 'reduction_ratio') are added
+        when reduction() is already cached, or when asked for, since building
+        it takes a full pass of dead-end filling.
+        
+        Args:
+            include_reduction (bool): Build the reduction if needed so its
+                fields are always included
+        """
+        if self._stats is None:
+            total_cells = self.width * self.height
+            wall_cells = self.cells.count(WALL)
+            self._stats = {
+                'width': self.width,
+                'height': self.height,
+                'total_cells': total_cells,
+                'wall_cells': wall_cells,
+                'path_cells': total_cells - wall_cells - 2,  # Subtract start and end
+                'weighted_cells': total_cells - wall_cells - self.cells.count(OPEN),
+                'wall_percentage': (wall_cells / total_cells) * 100
+            }
+        
+        stats = dict(self._stats, start=self.start, end=self.end)
+        if include_reduction or self._reduction is not None:
+            reduced = self.reduction()
+            stats.update(
+                dead_end_cells=reduced.dead_end_cells,
+                junction_nodes=reduced.node_count,
+                corridor_edges=reduced.edge_count,
+                reduction_ratio=reduced.reduction_ratio()
+            )
+        return stats
 
     def validate_path(self, path):
         """
@@ -107,45 +626,125 @@ class Maze:
         
         return {'valid': True, 'length': len(path)}
 
-    def get_shortest_path_length(self):
-        """Calculate the Manhattan distance between start and end (minimum possible path length)."""
+    def validate_paths(self, paths, use_numpy=None):
+        """
+        Validate many paths at once (see validation.py).
+        
+        Much faster than calling validate_path in a loop: the adjacency and
+        wall checks run over every step of every path as array operations.
+        
+        Args:
+            paths (iterable): Paths, each a list of positions
+            use_numpy (bool): Force the NumPy engine on or off; by default it
+                is used whenever NumPy is installed
+            
+        Returns:
+            list: One validate_path result per path, in order
+        """
+        from validation import validate_paths
+        return validate_paths(self, paths, use_numpy)
+
+    def flow_field(self, goal=None, weighted=None):
+        """
+        Return the next step towards a goal from every cell, building it on first use.
+
+        Fields are cached per goal until the maze is edited, so any number
+        of agents heading for the same goal share one search.
+
+        Args:
+            goal (tuple): The position to lead to (defaults to the end)
+            weighted (bool): Minimize cell costs instead of steps; defaults to
+                whether the maze has weighted cells
+
+        Returns:
+            FlowField: Directions and distances towards the goal (see distance_field.py)
+        """
+        key = (goal or self.end, self.is_weighted() if weighted is None else weighted)
+        if key not in self._flow_fields:
+            from distance_field import compute_flow_field
+            self._flow_fields[key] = compute_flow_field(self, *key)
+        return self._flow_fields[key]
+
+    def get_shortest_path_length(self, exact=False):
+        """
+        Calculate the minimum possible path length between start and end.
+        
+        Args:
+            exact (bool): Measure the real step distance through the maze
+                instead of the Manhattan distance lower bound
+            
+        Returns:
+            int: Number of steps, or -1 if exact is set and the end is unreachable
+        """
+        if exact:
+            from distance_field import compute_distance_field
+            return compute_distance_field(self, self.start).distance_to(self.end)
+        
         return abs(self.start[0] - self.end[0]) + abs(self.start[1] - self.end[1])
 
+    def render_lines(self, player_pos=None, path=None, viewport=None):
+        """
+        Draw the maze (or part of it) as text lines, framed by border rows.
+
+        Cells are drawn a row at a time by translating the row's bytes, then
+        the start, end, path and player are laid over them from a position
+        lookup, so the cost per frame does not grow with path length times
+        maze size.
+
+        Args:
+            player_pos (tuple): Optional position of the player
+            path (list): Optional path to highlight
+            viewport (tuple): Optional (x, y, width, height) window to draw
+                instead of the whole maze
+
+        Returns:
+            list: Lines of text, without newlines
+        """
+        x0, y0, width, height = viewport or (0, 0, self.width, self.height)
+        x1 = x0 + width
+
+        # Later entries win: path over start/end, player over everything
+        overlay = {self.start: "S", self.end: "E"}
+        if path:
+            overlay.update(dict.fromkeys(path, "·"))
+            overlay[path[0]] = "S"  # Start of path
+            overlay[path[-1]] = "E"  # End of path
+        if player_pos is not None:
+            overlay[player_pos] = "P"
+        rows = {}
+        for (x, y), char in overlay.items():
+            if x0 <= x < x1:
+                rows.setdefault(y, []).append((x - x0, char))
+
+        border = "=" * (width * 2 + 1)
+        lines = [border]
+        for y in range(y0, y0 + height):
+            row_offset = y * self.width
+            chars = list(bytes(self.cells[row_offset + x0:row_offset + x1]).decode('latin-1').translate(_DISPLAY_TABLE))
+            for x, char in rows.get(y, ()):
+                chars[x] = char
+            lines.append("|" + "|".join(chars) + "|")
+        lines.append(border)
+        return lines
+
+    def legend(self):
+        """Return the legend line explaining the characters render_lines draws."""
+        return "Legend: P=Player, S=Start, E=End, ·=Path, █=Wall" + (", 2-9/+=Cost" if self.is_weighted() else "")
+
     def display(self, player_pos=None, path=None):
         """Display the maze with optional player position and solution path."""
-        print("\n" + "=" * (len(self.grid[0]) * 2 + 1))
-        
-        for y, row in enumerate(self.grid):
-            print("|", end="")
-            for x, cell in enumerate(row):
-                current_pos = (x, y)
-                
-                if player_pos == current_pos:
-                    print("P", end="")  # Player
-                elif path and current_pos in path:
-                    if current_pos == path[0]:
-                        print("S", end="")  # Start of path
-                    elif current_pos == path[-1]:
-                        print("E", end="")  # End of path
-                    else:
-                        print("·", end="")  # Path marker
-                elif cell == 'S':
-                    print("S", end="")  # Start
-                elif cell == 'E':
-                    print("E", end="")  # End
-                elif cell == 1:
-                    print("█", end="")  # Wall
-                else:
-                    print(" ", end="")  # Empty space
-                print("|", end="")
-            print()
-        
-        print("=" * (len(self.grid[0]) * 2 + 1))
-        print("Legend: P=Player, S=Start, E=End, ·=Path, █=Wall")
-        print()
+        print("\n" + "\n".join(self.render_lines(player_pos, path)) + "\n" + self.legend() + "\n")
 
-    def display_with_stats(self, player_pos=None, path=None):
-        """Display the maze with statistics."""
+    def display_with_stats(self, player_pos=None, path=None, solve_stats=None):
+        """
+        Display the maze with statistics.
+
+        Args:
+            player_pos (tuple): Optional position of the player
+            path (list): Optional path to highlight and evaluate
+            solve_stats (SolveStats): Optional search figures from the solve
+                that produced the path (e.g. solver.last_stats)
+        """
         self.display(player_pos, path)
         
         # Display maze statistics
@@ -153,6 +752,8 @@ class Maze:
         print(f"Maze Size: {stats['width']}x{stats['height']}")
         print(f"Wall Coverage: {stats['wall_percentage']:.1f}%")
         print(f"Path Cells: {stats['path_cells']}")
+        if 'junction_nodes' in stats:
+            print(f"Junction Nodes: {stats['junction_nodes']} ({stats['reduction_ratio']:.0%} of open cells contracted)")
         
         if path:
             path_validation = self.validate_path(path)
@@ -160,9 +761,19 @@ class Maze:
                 shortest_possible = self.get_shortest_path_length()
                 efficiency = (shortest_possible / len(path)) * 100
                 print(f"Path Length: {len(path)}")
+                if self.is_weighted():
+                    print(f"Path Cost: {self.get_path_cost(path)}")
                 print(f"Shortest Possible: {shortest_possible}")
                 print(f"Path Efficiency: {efficiency:.1f}%")
             else:
                 print(f"Path Error: {path_validation['error']}")
         
+        if solve_stats is not None:
+            print(f"Nodes Expanded: {solve_stats.nodes_expanded}")
+            print(f"Nodes Pushed: {solve_stats.nodes_pushed}")
+            print(f"Max Frontier: {solve_stats.max_frontier}")
+            print(f"Revisits: {solve_stats.revisits}")
+            phases = ", ".join(f"{phase} {seconds * 1000:.2f}ms" for phase, seconds in solve_stats.phase_times.items())
+            print(f"Solve Time: {solve_stats.elapsed * 1000:.2f}ms ({phases})")
+        
         print() 
\ No newline at end of file
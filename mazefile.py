@@ -0,0 +1,190 @@
+"""
+Maze file formats.
+
+Binary ``.maze`` files hold the same bytes as Maze.to_bytes(): a fixed
+header (magic, bits per cell, width, height, start, end) followed by the
+cell body, bit-packed walls for plain mazes or one byte per cell for
+weighted ones. load_maze memory-maps the body so large mazes are used in
+place instead of being parsed.
+
+Text files draw the maze with one character per cell: '#' wall, '.' path,
+'S' start, 'E' end and '2'-'9' for weighted cells. They are read and
+written one row at a time.
+"""
+
+import mmap
+from maze import Maze, WALL, OPEN, parse_header, unpack_walls
+
+# Cells are counted in slices of this many bytes to bound temporary copies
+_CHUNK_SIZE = 1 << 20
+
+_TEXT_TO_CELL = bytes(
+    WALL if char == ord('#') else
+    char - ord('0') if ord('2') <= char <= ord('9') else
+    OPEN
+    for char in range(256)
+)
+_CELL_TO_TEXT = bytes(
+    ord('#') if value == WALL else
+    ord('.') if value == OPEN else
+    ord('0') + value if value <= 9 else
+    ord('?')
+    for value in range(256)
+)
+
+
+class MappedCells:
+    """
+    Read-only cell sequence backed by a memory-mapped maze body.
+
+    Supports what Maze needs from its cell buffer: indexing, slicing, len,
+    count and bytes(). Bit-packed bodies are decoded one cell at a time on
+    access, so nothing is expanded up front.
+    """
+
+    def __init__(self, body, size, cell_bits):
+        """
+        Args:
+            body (memoryview): The cell body, right after the header
+            size (int): Number of cells
+            cell_bits (int): 1 for bit-packed walls, 8 for one byte per cell
+        """
+        self._body = body
+        self._size = size
+        self._cell_bits = cell_bits
+
+    def __len__(self):
+        return self._size
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._size)
+            if self._cell_bits == 8:
+                return self._body[start:stop:step].tobytes()
+            # Decode only the bytes covering the slice
+            first_byte = start >> 3
+            cells = unpack_walls(self._body[first_byte:(stop + 7) >> 3], stop - first_byte * 8)
+            return bytes(cells[start - first_byte * 8::step])
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("cell index out of range")
+        if self._cell_bits == 8:
+            return self._body[index]
+        return (self._body[index >> 3] >> (index & 7)) & 1
+
+    def __iter__(self):
+        return iter(bytes(self))
+
+    def __bytes__(self):
+        if self._cell_bits == 8:
+            return self._body[:self._size].tobytes()
+        return bytes(unpack_walls(self._body, self._size))
+
+    def count(self, value):
+        """Count cells holding a value."""
+        if self._cell_bits == 8:
+            body = self._body[:self._size]
+            return sum(
+                body[offset:offset + _CHUNK_SIZE].tobytes().count(value)
+                for offset in range(0, self._size, _CHUNK_SIZE)
+            )
+
+        # Padding bits after the last cell are always clear
+        walls = sum(
+            int.from_bytes(self._body[offset:offset + _CHUNK_SIZE], 'little').bit_count()
+            for offset in range(0, len(self._body), _CHUNK_SIZE)
+        )
+        if value == WALL:
+            return walls
+        return self._size - walls if value == OPEN else 0
+
+
+def save_maze(maze: Maze, path):
+    """Write a maze to a binary .maze file."""
+    with open(path, 'wb') as f:
+        f.write(maze.to_bytes())
+
+
+def load_maze(path, use_mmap=True):
+    """
+    Load a binary .maze file.
+
+    Args:
+        path (str): File to read
+        use_mmap (bool): Memory-map the body and use it in place (read-only);
+            otherwise read it into a regular, mutable Maze
+
+    Returns:
+        Maze: The loaded maze
+    """
+    with open(path, 'rb') as f:
+        if not use_mmap:
+            return Maze.from_bytes(f.read())
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    try:
+        cell_bits, width, height, start, end, body = parse_header(mapped)
+    except ValueError as error:
+        raise ValueError(f"{path}: {error}") from None
+    size = width * height
+
+    cells = MappedCells(body, size, cell_bits)
+    return Maze.from_cells(cells, width, height, start, end)
+
+
+def read_text(path):
+    """
+    Read a text maze one row at a time.
+
+    Returns:
+        Maze: The maze drawn in the file
+    """
+    cells = bytearray()
+    start = end = None
+    width = None
+    height = 0
+
+    with open(path, 'rb') as f:
+        for line in f:
+            row = line.rstrip(b'\r\n')
+            if not row:
+                continue
+            if width is None:
+                width = len(row)
+            elif len(row) != width:
+                raise ValueError(f"Row {height} has {len(row)} cells, expected {width}")
+
+            x = row.find(b'S')
+            if x >= 0:
+                start = (x, height)
+            x = row.find(b'E')
+            if x >= 0:
+                end = (x, height)
+
+            cells += row.translate(_TEXT_TO_CELL)
+            height += 1
+
+    if width is None:
+        raise ValueError(f"{path} contains no maze")
+    if start is None:
+        raise ValueError("No start position ('S') found in maze")
+    if end is None:
+        raise ValueError("No end position ('E') found in maze")
+
+    return Maze.from_cells(cells, width, height, start, end)
+
+
+def write_text(maze: Maze, path):
+    """Write a maze as text, one row at a time."""
+    width = maze.width
+    with open(path, 'wb') as f:
+        for y in range(maze.height):
+            row = bytearray(bytes(maze.cells[y * width:(y + 1) * width]).translate(_CELL_TO_TEXT))
+            if b'?' in row:
+                raise ValueError(f"Row {y} has cells costing more than 9, which text cannot hold")
+            if maze.start[1] == y:
+                row[maze.start[0]] = ord('S')
+            if maze.end[1] == y:
+                row[maze.end[0]] = ord('E')
+            f.write(row + b'\n')
@@ -97,6 +97,20 @@ class Player:
         """
         return abs(self.position[0] - goal_pos[0]) + abs(self.position[1] - goal_pos[1])
 
+    def next_move(self, maze, goal=None):
+        """
+        Get the next move towards a goal from the maze's shared flow field.
+        
+        Args:
+            maze (Maze): The maze the player is in
+            goal (tuple): The position to head for (defaults to maze.end)
+            
+        Returns:
+            str: Direction for move() ('up', 'down', 'left' or 'right'), or
+            None at the goal or when it cannot be reached
+        """
+        return maze.flow_field(goal).next_move(self.position)
+
     def get_last_move(self):
         """Get the last move made by the player."""
         if self.move_history:
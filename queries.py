@@ -0,0 +1,172 @@
+from array import array
+from collections import OrderedDict, deque
+from maze import Maze
+
+
+class SearchTree:
+    """
+    A breadth-first search tree from one source that grows only as far as queries need.
+
+    Cells are settled in BFS order, so every cell already in the tree has its
+    shortest distance and a parent on a shortest path back to the source. A
+    later query resumes the search from the saved frontier instead of
+    starting again.
+    """
+
+    def __init__(self, maze: Maze, source):
+        self.maze = maze
+        self.source = source
+        size = maze.width * maze.height
+        start = maze.to_index(source)
+        self.parents = array('i', [-1]) * size
+        self.depths = array('i', [-1]) * size
+        self.parents[start] = start
+        self.depths[start] = 0
+        self.frontier = deque([start])
+        self.cells_expanded = 0
+
+    def is_complete(self):
+        """Check if every cell reachable from the source is in the tree."""
+        return not self.frontier
+
+    def grow_until(self, targets):
+        """
+        Expand the search until every target index is reached or the search is exhausted.
+
+        Args:
+            targets (set): Cell indices still wanted; reached ones are removed
+        """
+        masks, offsets = self.maze.neighbor_index()
+        parents, depths, frontier = self.parents, self.depths, self.frontier
+        targets.difference_update([index for index in targets if parents[index] >= 0])
+        expanded = 0
+
+        while targets and frontier:
+            current = frontier.popleft()
+            expanded += 1
+            depth = depths[current] + 1
+            for offset in offsets[masks[current]]:
+                neighbor = current + offset
+                if parents[neighbor] < 0:
+                    parents[neighbor] = current
+                    depths[neighbor] = depth
+                    frontier.append(neighbor)
+                    targets.discard(neighbor)
+
+        self.cells_expanded += expanded
+
+    def path_to(self, index):
+        """Return the path from the source to a cell already in the tree (or [])."""
+        parents = self.parents
+        if parents[index] < 0:
+            return []
+
+        maze = self.maze
+        path = [maze.to_position(index)]
+        while parents[index] != index:
+            index = parents[index]
+            path.append(maze.to_position(index))
+        return path[::-1]
+
+
+class PathQueryService:
+    """
+    Answer shortest-path queries between arbitrary cells of one maze.
+
+    A search tree is kept per source in a bounded LRU, so repeated queries
+    from the same source reuse the work already done. Because moves are
+    reversible, a query can also be answered from the target's tree.
+    Weighted cells count as a single step. Trees are dropped once the maze
+    is edited.
+    """
+
+    def __init__(self, maze: Maze, max_trees=16):
+        """
+        Args:
+            maze (Maze): The maze to answer queries on
+            max_trees (int): Most search trees kept before the least recently
+                used one is dropped
+        """
+        self.maze = maze
+        self.max_trees = max_trees
+        self.queries = 0
+        self.trees_built = 0
+        self._trees = OrderedDict()  # source position -> SearchTree
+        self._version = maze.version  # Maze version the trees were grown on
+
+    def shortest_path(self, source, target):
+        """
+        Find a shortest path between two positions.
+
+        Returns:
+            list: Positions from source to target, or [] if there is no path
+        """
+        self.queries += 1
+        if self.maze.is_wall(source) or self.maze.is_wall(target):
+            return []
+        self._drop_stale_trees()
+
+        reverse_tree = self._trees.get(target)
+        if reverse_tree is not None and source not in self._trees:
+            index = self.maze.to_index(source)
+            reverse_tree.grow_until({index})
+            self._trees.move_to_end(target)
+            return reverse_tree.path_to(index)[::-1]
+
+        index = self.maze.to_index(target)
+        tree = self._tree_for(source)
+        tree.grow_until({index})
+        return tree.path_to(index)
+
+    def distance(self, source, target):
+        """Return the number of steps between two positions, or -1 if unreachable."""
+        path = self.shortest_path(source, target)
+        return len(path) - 1 if path else -1
+
+    def shortest_paths(self, source, targets):
+        """
+        Find shortest paths from one source to many targets in a single search.
+
+        Returns:
+            dict: Target position -> path ([] for walls and unreachable targets)
+        """
+        self.queries += len(targets)
+        if self.maze.is_wall(source):
+            return {target: [] for target in targets}
+        self._drop_stale_trees()
+
+        tree = self._tree_for(source)
+        wanted = {self.maze.to_index(target) for target in targets if not self.maze.is_wall(target)}
+        tree.grow_until(wanted)
+        return {
+            target: [] if self.maze.is_wall(target) else tree.path_to(self.maze.to_index(target))
+            for target in targets
+        }
+
+    def get_stats(self):
+        """Get statistics about the work done and reused."""
+        return {
+            'queries': self.queries,
+            'trees_built': self.trees_built,
+            'trees_cached': len(self._trees),
+            'cells_expanded': sum(tree.cells_expanded for tree in self._trees.values())
+        }
+
+    def _drop_stale_trees(self):
+        """Forget every search tree if the maze was edited since they were grown."""
+        if self._version != self.maze.version:
+            self._trees.clear()
+            self._version = self.maze.version
+
+    def _tree_for(self, source):
+        """Return the cached search tree for a source, creating it if needed."""
+        tree = self._trees.get(source)
+        if tree is None:
+            tree = SearchTree(self.maze, source)
+            self._trees[source] = tree
+            self.trees_built += 1
+            while len(self._trees) > self.max_trees:
+                self._trees.popitem(last=False)
+        else:
+            self._trees.move_to_end(source)
+        return tree
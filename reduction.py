@@ -0,0 +1,183 @@
+"""
+Maze reduction for Maze Solver.
+
+Two preprocessing steps shrink what a search has to visit:
+
+* Dead-end filling walls up every open cell with at most one open neighbor,
+  repeatedly, until only cells that can lie on a path between start and end
+  (plus loops) remain. No shortest path ever enters a dead end, so any solver
+  finds the same path cost on the pruned maze.
+* Corridor contraction turns the pruned maze into a junction graph: nodes
+  are the start, the end and every cell that does not have exactly two open
+  neighbors, and each one-wide corridor between two nodes becomes a single
+  weighted edge. An edge remembers its first step, so a path through the
+  graph can be walked back out into cells.
+"""
+
+from maze import Maze, CELL_COSTS, WALL, UP, DOWN, LEFT, RIGHT
+
+# Number of open neighbors for every 4-bit neighbor mask
+_DEGREES = bytes(bin(mask).count('1') for mask in range(256))
+
+
+class ReducedMaze:
+    """A maze with its dead ends filled and its corridors contracted into a junction graph."""
+
+    def __init__(self, maze: Maze, pruned: Maze, edges, dead_end_cells):
+        """
+        Args:
+            maze (Maze): The original maze
+            pruned (Maze): The same maze with its dead ends walled up
+            edges (dict): Junction node index -> list of (node, cost, first
+                step offset) for every corridor leaving it
+            dead_end_cells (int): Number of open cells that were filled
+        """
+        self.maze = maze
+        self.pruned = pruned
+        self.edges = edges
+        self.dead_end_cells = dead_end_cells
+
+    @property
+    def node_count(self):
+        """Number of junction nodes."""
+        return len(self.edges)
+
+    @property
+    def edge_count(self):
+        """Number of corridors (each counted once, not once per direction)."""
+        return sum(len(edges) for edges in self.edges.values()) // 2
+
+    def reduction_ratio(self):
+        """Return the fraction of the open cells that a junction-graph search skips."""
+        open_cells = self.maze.width * self.maze.height - self.maze.cells.count(WALL)
+        return 1 - self.node_count / open_cells if open_cells else 0.0
+
+    def walk(self, node, offset):
+        """
+        Follow a corridor from a node to the node at its far end.
+
+        Args:
+            node (int): Cell index of the node the corridor leaves from
+            offset (int): Index offset of the corridor's first step
+
+        Returns:
+            list: Cell indices after ``node`` up to and including the far node
+        """
+        masks, offsets = self.pruned.neighbor_index()
+        edges = self.edges
+        previous, current = node, node + offset
+        cells = [current]
+        while current not in edges:
+            for step in offsets[masks[current]]:
+                if current + step != previous:
+                    break
+            previous, current = current, current + step
+            cells.append(current)
+        return cells
+
+    def expand(self, steps):
+        """
+        Expand a route through the junction graph into a full cell path.
+
+        Args:
+            steps (list): (node, first step offset) of every edge taken, in
+                order from the start; empty when the start is the end
+
+        Returns:
+            list: Positions of every cell from the start to the end
+        """
+        maze = self.maze
+        path = [steps[0][0] if steps else maze.to_index(maze.start)]
+        for node, offset in steps:
+            path.extend(self.walk(node, offset))
+        return [maze.to_position(index) for index in path]
+
+
+def fill_dead_ends(maze: Maze):
+    """
+    Wall up dead ends until every remaining open cell has two or more open neighbors.
+
+    The start and end are never filled. Weighted cells keep their cost.
+
+    Args:
+        maze (Maze): The maze to prune (left unchanged)
+
+    Returns:
+        tuple: (pruned Maze, number of cells filled, open-neighbor count of
+        every cell in the pruned maze as a bytearray)
+    """
+    masks, offsets = maze.neighbor_index()
+    cells = bytearray(maze.cells)
+    degrees = bytearray(bytes(masks).translate(_DEGREES))
+    keep = (maze.to_index(maze.start), maze.to_index(maze.end))
+    stack = [
+        index for index in range(len(cells))
+        if degrees[index] <= 1 and cells[index] != WALL and index not in keep
+    ]
+    filled = 0
+
+    while stack:
+        current = stack.pop()
+        cells[current] = WALL
+        filled += 1
+        for offset in offsets[masks[current]]:
+            neighbor = current + offset
+            if cells[neighbor] != WALL:
+                degrees[neighbor] -= 1
+                # Cells only lose neighbors here, so each one is pushed at most once
+                if degrees[neighbor] == 1 and neighbor not in keep:
+                    stack.append(neighbor)
+
+    pruned = Maze.from_cells(cells, maze.width, maze.height, maze.start, maze.end)
+    return pruned, filled, degrees
+
+
+def reduce_maze(maze: Maze):
+    """
+    Fill a maze's dead ends and contract its corridors into a junction graph.
+
+    Maze.reduction() caches the result until the maze is edited; call that
+    instead to reuse it.
+
+    Returns:
+        ReducedMaze: The pruned maze and its junction graph
+    """
+    pruned, filled, degrees = fill_dead_ends(maze)
+    cells = pruned.cells
+    masks, offsets = pruned.neighbor_index()
+    keep = (maze.to_index(maze.start), maze.to_index(maze.end))
+    edges = {
+        index: [] for index in range(len(cells))
+        if cells[index] != WALL and (degrees[index] != 2 or index in keep)
+    }
+
+    # walked[node] holds the direction bits of corridors already recorded
+    # from that node, so each corridor is walked once for both directions
+    width = maze.width
+    bits = {-width: UP, width: DOWN, -1: LEFT, 1: RIGHT}
+    walked = bytearray(len(cells))
+
+    for node, node_edges in edges.items():
+        for offset in offsets[masks[node]]:
+            if walked[node] & bits[offset]:
+                continue
+            walked[node] |= bits[offset]
+
+            previous, current = node, node + offset
+            cost = CELL_COSTS[cells[current]]
+            while current not in edges:
+                for step in offsets[masks[current]]:
+                    if current + step != previous:
+                        break
+                previous, current = current, current + step
+                cost += CELL_COSTS[cells[current]]
+
+            if current == node:
+                walked[node] |= bits[previous - node]  # A loop back to itself never helps
+                continue
+            back = previous - current
+            walked[current] |= bits[back]
+            node_edges.append((current, cost, offset))
+            edges[current].append((node, cost - CELL_COSTS[cells[current]] + CELL_COSTS[cells[node]], back))
+
+    return ReducedMaze(maze, pruned, edges, filled)
@@ -0,0 +1,145 @@
+"""
+Terminal renderer for Maze Solver.
+
+Each frame is built as a list of text lines and compared with the frame
+already on screen; only the characters that changed are sent, each run of
+them preceded by an ANSI cursor move. The maze is drawn through a viewport
+that scrolls with the player, so mazes larger than the terminal stay
+playable and a move costs a handful of writes rather than a full redraw.
+"""
+
+import shutil
+import sys
+from maze import Maze
+
+CLEAR_SCREEN = "\x1b[H\x1b[2J"
+CLEAR_BELOW = "\x1b[J"
+CLEAR_LINE_END = "\x1b[K"
+
+# Lines kept free under the frame for the input prompt and messages
+_PROMPT_LINES = 3
+
+
+def move_cursor(row, column):
+    """Return the ANSI sequence moving the cursor to a 0-based row and column."""
+    return f"\x1b[{row + 1};{column + 1}H"
+
+
+class TerminalRenderer:
+    """Draws game frames to a terminal, sending only what changed since the last one."""
+
+    def __init__(self, maze: Maze, stream=None, view_size=None):
+        """
+        Args:
+            maze (Maze): The maze to draw
+            stream: Text stream to write to (defaults to sys.stdout)
+            view_size (tuple): (columns, rows) of cells to show; by default the
+                viewport is fitted to the terminal on every frame
+        """
+        self.maze = maze
+        self.stream = stream if stream is not None else sys.stdout
+        self.view_size = view_size
+        self.origin = (0, 0)
+        self._lines = None
+
+    def invalidate(self):
+        """Forget what is on screen, so the next frame is drawn in full (e.g. after other output)."""
+        self._lines = None
+
+    def viewport(self, focus, header_lines=0):
+        """
+        Return the (x, y, width, height) window of cells to draw around a position.
+
+        The window stays put while the focus is away from its edges and
+        scrolls once it comes within a quarter of the window of one.
+
+        Args:
+            focus (tuple): Position to keep in view (usually the player's)
+            header_lines (int): Terminal lines used above the maze
+        """
+        maze = self.maze
+        if self.view_size is not None:
+            columns, rows = self.view_size
+        else:
+            terminal = shutil.get_terminal_size()
+            columns = (terminal.columns - 1) // 2
+            rows = terminal.lines - header_lines - 3 - _PROMPT_LINES  # Two borders and the legend
+        width = max(1, min(columns, maze.width))
+        height = max(1, min(rows, maze.height))
+
+        origin = []
+        for start, position, size, total in zip(self.origin, focus, (width, height), (maze.width, maze.height)):
+            margin = size // 4
+            if position < start + margin:
+                start = position - margin
+            elif position >= start + size - margin:
+                start = position - size + margin + 1
+            origin.append(max(0, min(start, total - size)))
+        self.origin = tuple(origin)
+        return self.origin + (width, height)
+
+    def frame(self, header=(), player_pos=None, path=None):
+        """
+        Build the lines of one frame: the header, the maze viewport and the legend.
+
+        Args:
+            header (list): Lines to show above the maze
+            player_pos (tuple): Position of the player, which the viewport follows
+            path (list): Optional path to highlight
+        """
+        focus = player_pos if player_pos is not None else self.maze.start
+        viewport = self.viewport(focus, len(header))
+        legend = self.maze.legend()
+        x, y, width, height = viewport
+        if (width, height) != (self.maze.width, self.maze.height):
+            legend += f"  [cells {x}-{x + width - 1}, {y}-{y + height - 1} of {self.maze.width}x{self.maze.height}]"
+        return list(header) + self.maze.render_lines(player_pos, path, viewport) + [legend]
+
+    def draw(self, header=(), player_pos=None, path=None):
+        """
+        Draw a frame, rewriting only the characters that differ from the last one.
+
+        The cursor is left on the line below the frame, with everything under
+        it cleared, ready for a prompt.
+
+        Returns:
+            int: Number of characters written
+        """
+        lines = self.frame(header, player_pos, path)
+        previous = self._lines
+        if previous is None or len(previous) != len(lines):
+            output = [CLEAR_SCREEN, "\n".join(lines), "\n"]
+        else:
+            output = []
+            for row, (line, old) in enumerate(zip(lines, previous)):
+                if line == old:
+                    continue
+                if len(line) != len(old):
+                    output += (move_cursor(row, 0), line, CLEAR_LINE_END)
+                    continue
+                output += _changed_runs(row, line, old)
+            output.append(move_cursor(len(lines), 0))
+        output.append(CLEAR_BELOW)
+
+        text = "".join(output)
+        self.stream.write(text)
+        self.stream.flush()
+        self._lines = lines
+        return len(text)
+
+
+def _changed_runs(row, line, old):
+    """List cursor moves and text rewriting each run of changed characters in a line."""
+    output = []
+    column = 0
+    length = len(line)
+    while column < length:
+        if line[column] == old[column]:
+            column += 1
+            continue
+        end = column + 1
+        while end < length and line[end] != old[end]:
+            end += 1
+        output += (move_cursor(row, column), line[column:end])
+        column = end
+    return output
@@ -0,0 +1,325 @@
+#!/usr/bin/env python3
+"""
+Solve server for Maze Solver
+Serves maze solving to other processes as newline-delimited JSON over TCP or
+a Unix socket.
+
+Every request line is a JSON object:
+
+    {"id": 1, "solver": "astar", "grid": [["S", 0, 1], [1, 0, "E"]]}
+    {"id": 2, "solver": "bfs", "maze": "<base64 of Maze.to_bytes()>"}
+    {"id": 3, "op": "stats"}
+
+and is answered with one line carrying the same id: ``path``, ``length``
+and ``solved`` for a solve, the server statistics for ``stats``, or
+``error``. Requests on one connection may be pipelined; answers are sent
+as solves finish, so they can arrive out of order.
+
+Solves run on an executor (worker processes by default), off the event
+loop; decoding and hashing each request's maze run on the loop's default
+thread pool. Identical requests in flight at the same time share one solve, and
+once ``queue_limit`` requests are pending the server stops reading from
+connections until one finishes, so clients are slowed down instead of
+queueing without bound. Idle connections hold no queue slot. Lines longer
+than ``line_limit`` or that are not JSON are answered with an error (with
+the request's id when it can be found).
+"""
+
+import argparse
+import asyncio
+import base64
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+import json
+import math
+import re
+import time
+from cache import SolveCache, solve_key
+from maze import Maze
+from solver import SOLVERS
+
+def _solve_one(solver_name, data):
+    """Worker entry point: solve one serialized maze, returning the path as JSON-ready lists."""
+    path = SOLVERS[solver_name]().solve(Maze.from_bytes(data))
+    return [list(position) for position in path]
+
+def _prepare(solver_name, request):
+    """Decode a request's maze and compute its cache key (O(cells), so run off the event loop)."""
+    if 'maze' in request:
+        data = base64.b64decode(request['maze'], validate=True)
+        maze = Maze.from_bytes(data)
+    elif 'grid' in request:
+        maze = Maze(request['grid'])
+        data = maze.to_bytes()
+    else:
+        raise ValueError("Request needs a 'grid' or a 'maze'")
+    return solve_key(maze, SOLVERS[solver_name]()), data
+
+# An "id" member near the start of a line that is too long or not valid JSON
+_ID_PATTERN = re.compile(rb'"id"\s*:\s*(-?\d+(?:\.\d+)?|"(?:[^"\\]|\\.)*"|null|true|false)')
+
+def _request_id(data):
+    """Recover the id of a request that could not be decoded, or None."""
+    match = _ID_PATTERN.search(data)
+    if match is None:
+        return None
+    try:
+        return json.loads(match.group(1))
+    except ValueError:
+        return None
+
+def percentile(values, fraction):
+    """Return the nearest-rank percentile of a sorted list (None if empty)."""
+    if not values:
+        return None
+    return values[max(1, math.ceil(len(values) * fraction)) - 1]
+
+class SolveServer:
+    """Answers solve requests, coalescing duplicates and bounding the work queued."""
+
+    def __init__(self, executor=None, workers=None, queue_limit=64, cache: SolveCache = None,
+                 latency_window=10000, line_limit=1 << 26):
+        """
+        Args:
+            executor: concurrent.futures executor to run solves on; by default
+                a process pool with ``workers`` processes is created (and shut
+                down by close())
+            workers (int): Worker processes for the default executor
+            queue_limit (int): Most requests pending at once; reading from
+                connections pauses while the limit is reached
+            cache (SolveCache): Optional cache consulted before solving
+            latency_window (int): Number of recent request latencies kept
+                for the percentiles
+            line_limit (int): Longest request line accepted, in bytes; longer
+                ones are answered with an error
+        """
+        self._owns_executor = executor is None
+        self.executor = executor if executor is not None else ProcessPoolExecutor(max_workers=workers)
+        self.queue_limit = queue_limit
+        self.line_limit = line_limit
+        self.cache = cache
+        self.requests = 0
+        self.solves = 0
+        self.coalesced = 0
+        self.errors = 0
+        self.pending = 0
+        self.peak_pending = 0
+        self.latencies = deque(maxlen=latency_window)
+        self._in_flight = {}  # solve key -> Future shared by identical requests
+        self._slots = None
+        self._servers = []
+        self._connections = {}  # connection task -> its writer
+
+    async def handle(self, request):
+        """
+        Answer one decoded request.
+
+        Returns:
+            dict: The response, carrying the request's id
+        """
+        started = time.perf_counter()
+        self.requests += 1
+        response = {'id': request.get('id')} if isinstance(request, dict) else {'id': None}
+        try:
+            if not isinstance(request, dict):
+                raise ValueError("Requests must be JSON objects")
+            if request.get('op') == 'stats':
+                response.update(self.get_stats())
+            else:
+                path = await self._solve(request)
+                response.update({'solved': bool(path), 'length': len(path), 'path': path})
+        except Exception as error:  # Any bad request gets an error answer, never silence
+            self.errors += 1
+            response['error'] = str(error) or type(error).__name__
+        self.latencies.append(time.perf_counter() - started)
+        return response
+
+    async def _solve(self, request):
+        """Solve a request's maze, joining an identical solve already in flight."""
+        solver_name = request.get('solver', 'bfs')
+        if solver_name not in SOLVERS:
+            raise ValueError(f"Unknown solver: {solver_name}")
+
+        loop = asyncio.get_running_loop()
+        key, data = await loop.run_in_executor(None, _prepare, solver_name, request)
+        future = self._in_flight.get(key)
+        if future is not None:
+            self.coalesced += 1
+            return await asyncio.shield(future)
+
+        if self.cache is not None:
+            path = self.cache.get(key)
+            if path is not None:
+                return path
+
+        future = self._in_flight[key] = loop.run_in_executor(self.executor, _solve_one, solver_name, data)
+        try:
+            path = await asyncio.shield(future)
+        finally:
+            del self._in_flight[key]
+        self.solves += 1
+        if self.cache is not None:
+            self.cache.put(key, path)
+        return path
+
+    async def _connection(self, reader, writer):
+        """Serve one client: read request lines and answer each as it finishes."""
+        connection = asyncio.current_task()
+        self._connections[connection] = writer
+        tasks = set()
+        try:
+            while True:
+                try:
+                    line = await reader.readuntil(b'\n')
+                except asyncio.IncompleteReadError as error:
+                    line = error.partial  # A last line without a newline
+                    if not line:
+                        break
+                except asyncio.LimitOverrunError:
+                    prefix = await self._skip_line(reader)
+                    await self._reject(writer, prefix, f"Request line longer than {self.line_limit} bytes")
+                    continue
+                if not line.strip():
+                    continue
+
+                # Take a queue slot before reading on: a full queue leaves the
+                # rest in the socket, which slows this client down (idle
+                # connections hold no slot)
+                await self._slots.acquire()
+                task = asyncio.ensure_future(self._answer(line, writer))
+                task.add_done_callback(self._release_slot)
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+
+            if tasks:
+                await asyncio.gather(*tasks)
+        except ConnectionError:
+            pass
+        finally:
+            for task in tasks:
+                task.cancel()
+            writer.close()
+            del self._connections[connection]
+
+    def _release_slot(self, task):
+        """Done callback freeing a request's queue slot, even if it was cancelled before starting."""
+        self._slots.release()
+
+    async def _skip_line(self, reader):
+        """Discard the rest of an over-long line, returning its first bytes (to find the id)."""
+        prefix = b''
+        while True:
+            try:
+                await reader.readuntil(b'\n')
+                return prefix
+            except asyncio.LimitOverrunError as error:
+                chunk = await reader.read(max(error.consumed, 1))
+                prefix = prefix or chunk[:4096]
+                if not chunk:
+                    return prefix
+            except asyncio.IncompleteReadError:
+                return prefix
+
+    async def _reject(self, writer, data, message):
+        """Answer a request line that could not be decoded."""
+        self.requests += 1
+        self.errors += 1
+        writer.write(json.dumps({'id': _request_id(data), 'error': message}).encode() + b'\n')
+        await writer.drain()
+
+    async def _answer(self, line, writer):
+        """Answer one request line on a connection (its queue slot is freed when done)."""
+        self.pending += 1
+        self.peak_pending = max(self.peak_pending, self.pending)
+        try:
+            try:
+                request = json.loads(line)
+            except ValueError as error:
+                await self._reject(writer, line, f"Invalid JSON: {error}")
+                return
+            response = await self.handle(request)
+            writer.write(json.dumps(response).encode() + b'\n')
+            await writer.drain()
+        finally:
+            self.pending -= 1
+
+    async def start(self, host='127.0.0.1', port=8765, path=None):
+        """
+        Start listening, on a Unix socket if ``path`` is given and TCP otherwise.
+
+        Returns:
+            asyncio.Server: The listening server (port 0 picks a free port)
+        """
+        self._slots = asyncio.Semaphore(self.queue_limit)
+        if path is not None:
+            server = await asyncio.start_unix_server(self._connection, path=path, limit=self.line_limit)
+        else:
+            server = await asyncio.start_server(self._connection, host, port, limit=self.line_limit)
+        self._servers.append(server)
+        return server
+
+    async def close(self):
+        """Stop listening, close open connections and shut down the executor if the server created it."""
+        for server in self._servers:
+            server.close()
+        # Closed connections read as ended, so their handlers finish on their own
+        connections = list(self._connections)
+        for writer in self._connections.values():
+            writer.close()
+        await asyncio.gather(*connections, return_exceptions=True)
+        for server in self._servers:
+            await server.wait_closed()
+        self._servers = []
+        if self._owns_executor:
+            self.executor.shutdown()
+
+    def get_stats(self):
+        """Get request counters and latency percentiles (in milliseconds)."""
+        latencies = sorted(self.latencies)
+        stats = {
+            'requests': self.requests,
+            'solves': self.solves,
+            'coalesced': self.coalesced,
+            'errors': self.errors,
+            'pending': self.pending,
+            'peak_pending': self.peak_pending,
+            'queue_limit': self.queue_limit
+        }
+        for name, fraction in (('p50', 0.5), ('p90', 0.9), ('p99', 0.99), ('max', 1.0)):
+            value = percentile(latencies, fraction)
+            stats[f'latency_{name}_ms'] = value * 1000 if value is not None else None
+        if self.cache is not None:
+            stats['cache'] = self.cache.get_stats()
+        return stats
+
+async def serve(host='127.0.0.1', port=8765, path=None, **options):
+    """Run a SolveServer until cancelled."""
+    server = SolveServer(**options)
+    listener = await server.start(host, port, path)
+    where = path or "{}:{}".format(*listener.sockets[0].getsockname()[:2])
+    print(f"Solving mazes on {where}")
+    try:
+        await listener.serve_forever()
+    finally:
+        await server.close()
+
+def main(argv=None):
+    """Command-line entry point: run the solve server."""
+    parser = argparse.ArgumentParser(description="Serve maze solving over JSON lines.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--unix', metavar='PATH', help="Listen on a Unix socket instead of TCP")
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument('--queue-limit', type=int, default=64, help="Most requests pending at once")
+    parser.add_argument('--cache-size', type=int, default=0, help="Paths kept in a result cache (0 disables it)")
+    args = parser.parse_args(argv)
+
+    cache = SolveCache(max_entries=args.cache_size) if args.cache_size else None
+    try:
+        asyncio.run(serve(args.host, args.port, args.unix, workers=args.workers,
+                          queue_limit=args.queue_limit, cache=cache))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
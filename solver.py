@@ -1,141 +1,1348 @@
 from abc import ABC, abstractmethod
+from array import array
 from collections import deque
 import heapq
-from maze import Maze
+from time import perf_counter
+from maze import Maze, CELL_COSTS, WALL
+from distance_field import compute_distance_field
+from compactpath import CompactPath
+
+# Phases a solve is timed in, in order
+PHASES = ('setup', 'search', 'path')
+
+class SolveStats:
+    """Figures describing the work done by one solve."""
+
+    __slots__ = ('nodes_expanded', 'nodes_pushed', 'max_frontier', 'revisits', 'phase_times')
+
+    def __init__(self, nodes_expanded=0, nodes_pushed=0, max_frontier=0, revisits=0, phase_times=None):
+        """
+        Args:
+            nodes_expanded (int): Cells whose neighbors were examined
+            nodes_pushed (int): Entries added to the frontier (queue, stack or heap)
+            max_frontier (int): Largest the frontier grew; most solvers only
+                measure it while an observer is attached, since it costs a
+                check per expansion
+            revisits (int): Frontier entries popped for cells that were already
+                expanded (stale heap entries)
+            phase_times (dict): Seconds spent per phase ('setup', 'search', 'path')
+        """
+        self.nodes_expanded = nodes_expanded
+        self.nodes_pushed = nodes_pushed
+        self.max_frontier = max_frontier
+        self.revisits = revisits
+        self.phase_times = phase_times if phase_times is not None else {}
+
+    @property
+    def elapsed(self):
+        """Total seconds across all phases."""
+        return sum(self.phase_times.values())
+
+    def as_dict(self):
+        """Return the stats as a plain dictionary."""
+        return {
+            'nodes_expanded': self.nodes_expanded,
+            'nodes_pushed': self.nodes_pushed,
+            'max_frontier': self.max_frontier,
+            'revisits': self.revisits,
+            'phase_times': dict(self.phase_times),
+            'elapsed': self.elapsed
+        }
+
+    def __repr__(self):
+        return f"SolveStats({self.as_dict()})"
+
+class SolveObserver:
+    """
+    Receives the stats of every solve made by the solvers it is attached to.
+
+    Attach one with ``solver.observer = observer``. Solvers count in local
+    variables while searching and report once at the end; the only per-node
+    work an observer adds is tracking the largest frontier.
+    """
+
+    def solve_finished(self, solver, maze, path, stats):
+        """Called after each solve with the returned path and its SolveStats."""
+
+class StatsCollector(SolveObserver):
+    """Observer that keeps the stats of recent solves, e.g. to find slow ones."""
+
+    def __init__(self, max_entries=1000):
+        self.history = deque(maxlen=max_entries)  # (solver class name, SolveStats)
+
+    def solve_finished(self, solver, maze, path, stats):
+        self.history.append((type(solver).__name__, stats))
+
+    def slowest(self, count=1):
+        """Return the slowest recorded solves, slowest first."""
+        return sorted(self.history, key=lambda entry: entry[1].elapsed, reverse=True)[:count]
+
+class SolvePath(list):
+    """
+    A path from a budgeted solve, saying whether it reaches the end.
+
+    It is a list of positions like any other solver's result. A solve cut off
+    by its budget before finding any path returns the most promising partial
+    path instead, marked ``complete = False``; it starts at maze.start but
+    stops short of maze.end.
+    """
+
+    def __init__(self, positions=(), complete=True, bound=1.0):
+        """
+        Args:
+            positions (iterable): The positions of the path
+            complete (bool): False if the search was cut off before reaching the end
+            bound (float): The path costs at most this many times the optimum
+                (infinite for partial paths)
+        """
+        super().__init__(positions)
+        self.complete = complete
+        self.bound = bound
+
+    def __repr__(self):
+        return f"SolvePath({list.__repr__(self)}, complete={self.complete}, bound={self.bound})"
 
 class MazeSolver(ABC):
+    # Number of cells whose neighbors were examined by the most recent solve
+    nodes_expanded = 0
+
+    # SolveStats of the most recent solve
+    last_stats = None
+
+    # Optional SolveObserver told about every solve
+    observer = None
+
+    # Instance attributes that do not change the solver's output
+    result_attributes = ('nodes_expanded', 'last_stats', 'observer')
+
     @abstractmethod
     def solve(self, maze: Maze):
         pass
 
+    def solve_compact(self, maze: Maze, run_length=False, **options):
+        """
+        Solve the maze and return the path as a CompactPath.
+        
+        A budgeted solve's ``complete`` and ``bound`` carry over, so a
+        partial path stays marked as one.
+        
+        Args:
+            maze (Maze): The maze to solve
+            run_length (bool): Run-length encode the path (best for long corridors)
+            **options: Passed on to solve(), e.g. time_limit for ARA*
+        """
+        return CompactPath.from_positions(self.solve(maze, **options), run_length)
+
+    def parameters(self):
+        """Return the settings that affect this solver's output (used in cache keys)."""
+        return {
+            name: value for name, value in vars(self).items()
+            if not name.startswith('_') and name not in self.result_attributes
+        }
+
+    def _finish(self, maze, path, stats, marks, phases=PHASES):
+        """
+        Record the stats of a finished solve, notify the observer and return the path.
+        
+        Args:
+            marks (list): perf_counter() readings at the start and at the end of
+                each phase
+            phases (tuple): Names of the timed phases, in order
+        """
+        stats.phase_times = {phase: end - begin for phase, begin, end in zip(phases, marks, marks[1:])}
+        self.nodes_expanded = stats.nodes_expanded
+        self.last_stats = stats
+        if self.observer is not None:
+            self.observer.solve_finished(self, maze, path, stats)
+        return path
+
+def _build_path(maze, parents, end):
+    """Follow parent pointers back from ``end`` and return the path as positions."""
+    path = [maze.to_position(end)]
+    current = end
+    while parents[current] != current:
+        current = parents[current]
+        path.append(maze.to_position(current))
+    
+    return path[::-1]  # Reverse to get start to end order
+
+def _join_paths(maze, forward_parents, backward_parents, forward_meet, backward_meet):
+    """Join the forward path up to ``forward_meet`` with the backward path from ``backward_meet``."""
+    path = _build_path(maze, forward_parents, forward_meet)
+    current = backward_meet
+    if current != forward_meet:
+        path.append(maze.to_position(current))
+    
+    while backward_parents[current] != current:
+        current = backward_parents[current]
+        path.append(maze.to_position(current))
+    
+    return path
+
 class DFSMazeSolver(MazeSolver):
     def solve(self, maze: Maze):
         """Solve the maze using Depth-First Search algorithm."""
-        visited = set()
+        started = perf_counter()
+        if maze.is_known_unreachable(maze.start, maze.end):
+            return self._finish(maze, [], SolveStats(), [started, perf_counter()])  # No path exists
         path = []
+        stats = SolveStats()
+        stats.nodes_expanded = stats.nodes_pushed = sum(1 for _ in self._walk(maze, path, stats))
+        return self._finish(maze, path, stats, [started, perf_counter()], ('search',))
+
+    def iter_visited(self, maze: Maze, path=None):
+        """
+        Yield positions in the order the search visits them.
         
-        def dfs(current_pos):
-            if current_pos == maze.end:
-                return True
-            
-            visited.add(current_pos)
+        Args:
+            maze (Maze): The maze to search
+            path (list): Optional list that receives the solution path once the
+                end is reached; it stays empty if there is no path
             
-            for neighbor in maze.get_neighbors(current_pos):
-                if neighbor not in visited:
-                    if dfs(neighbor):
-                        path.append(neighbor)
-                        return True
+        Yields:
+            tuple: Each visited position, ending with the end position if reached
+        """
+        for index in self._walk(maze, path if path is not None else []):
+            yield maze.to_position(index)
+
+    def _walk(self, maze, path, stats=None):
+        """
+        Iterative DFS over flat indices, yielding each cell as it is visited.
+        
+        The explicit stack holds the current branch, with one neighbor iterator
+        per level, so neighbors are tried in the same order as a recursive DFS
+        and the stack itself is the path once the end is reached. Every cell
+        is pushed once, as it is visited; with an observer attached the deepest
+        stack is written to ``stats`` when the walk ends.
+        """
+        masks, offsets = maze.neighbor_index()
+        start = maze.to_index(maze.start)
+        end = maze.to_index(maze.end)
+        visited = bytearray(maze.width * maze.height)
+        
+        stack = [start]
+        track = stats is not None and self.observer is not None
+        deepest = 1
+        if start != end:
+            visited[start] = 1
+            yield start
+            branches = [iter(offsets[masks[start]])]
             
-            return False
+            while stack:
+                current = stack[-1]
+                for offset in branches[-1]:
+                    neighbor = current + offset
+                    if not visited[neighbor]:
+                        break
+                else:
+                    # Every neighbor explored: backtrack
+                    stack.pop()
+                    branches.pop()
+                    continue
+                
+                stack.append(neighbor)
+                if track and len(stack) > deepest:
+                    deepest = len(stack)
+                if neighbor == end:
+                    break
+                
+                visited[neighbor] = 1
+                yield neighbor
+                branches.append(iter(offsets[masks[neighbor]]))
+            else:
+                if track:
+                    stats.max_frontier = deepest
+                return  # No path found
         
-        # Start DFS from the start position
-        if dfs(maze.start):
-            path.append(maze.start)
-            return path[::-1]  # Reverse to get start to end order
-        else:
-            return []  # No path found
+        if track:
+            stats.max_frontier = deepest
+        path.extend(maze.to_position(index) for index in stack)
+        yield end
 
 class BFSMazeSolver(MazeSolver):
     def solve(self, maze: Maze):
         """Solve the maze using Breadth-First Search algorithm."""
-        queue = deque([(maze.start, [maze.start])])
-        visited = set()
+        started = perf_counter()
+        if maze.is_known_unreachable(maze.start, maze.end):
+            return self._finish(maze, [], SolveStats(), [started, perf_counter()])  # No path exists
+        masks, offsets = maze.neighbor_index()
+        start = maze.to_index(maze.start)
+        end = maze.to_index(maze.end)
+        
+        # parents[i] is the cell we reached i from; -1 means not yet seen
+        parents = array('i', [-1]) * (maze.width * maze.height)
+        parents[start] = start
+        queue = deque([start])
+        expanded = 0
+        track = self.observer is not None
+        largest = 1
+        marks = [started, perf_counter()]
         
         while queue:
-            current_pos, path = queue.popleft()
-            
-            if current_pos == maze.end:
-                return path
+            current = queue.popleft()
             
-            if current_pos in visited:
-                continue
-                
-            visited.add(current_pos)
+            if current == end:
+                marks.append(perf_counter())
+                path = _build_path(maze, parents, end)
+                marks.append(perf_counter())
+                # Every cell pushed was expanded, is the end, or is still queued
+                stats = SolveStats(expanded, expanded + 1 + len(queue), largest)
+                return self._finish(maze, path, stats, marks)
             
-            for neighbor in maze.get_neighbors(current_pos):
-                if neighbor not in visited:
-                    new_path = path + [neighbor]
-                    queue.append((neighbor, new_path))
+            expanded += 1
+            for offset in offsets[masks[current]]:
+                neighbor = current + offset
+                if parents[neighbor] < 0:
+                    parents[neighbor] = current
+                    queue.append(neighbor)
+            if track and len(queue) > largest:
+                largest = len(queue)
+        
+        marks.append(perf_counter())
+        return self._finish(maze, [], SolveStats(expanded, expanded, largest), marks)  # No path found
+
+class DistanceFieldMazeSolver(MazeSolver):
+    def __init__(self, use_numpy=None):
+        """
+        Args:
+            use_numpy (bool): Force the NumPy wavefront engine on or off; by
+                default it is used when NumPy is installed, with the pure-Python
+                BFS wavefront as the fallback
+        """
+        self.use_numpy = use_numpy
+
+    def solve(self, maze: Maze):
+        """Solve the maze from a full distance field, descending it from the end."""
+        started = perf_counter()
+        if maze.is_known_unreachable(maze.start, maze.end):
+            return self._finish(maze, [], SolveStats(), [started, perf_counter()])  # No path exists
+        field = compute_distance_field(maze, maze.start, use_numpy=self.use_numpy)
+        searched = perf_counter()
+        path = field.path_to(maze.end)
         
-        return []  # No path found
+        # The wavefront expands every cell it reaches
+        reached = field.reached_count()
+        stats = SolveStats(reached, reached)
+        return self._finish(maze, path, stats, [started, searched, perf_counter()], ('search', 'path'))
 
 class AStarMazeSolver(MazeSolver):
     def solve(self, maze: Maze):
         """Solve the maze using A* algorithm with Manhattan distance heuristic."""
-        def manhattan_distance(pos1, pos2):
-            """Calculate Manhattan distance between two positions."""
-            return abs(pos1[0] - pos2[0]) + abs(pos1[1] - pos2[1])
+        started = perf_counter()
+        if maze.is_known_unreachable(maze.start, maze.end):
+            return self._finish(maze, [], SolveStats(), [started, perf_counter()])  # No path exists
+        masks, offsets = maze.neighbor_index()
+        width, height = maze.width, maze.height
+        end_x, end_y = maze.end
+        start = maze.to_index(maze.start)
+        end = maze.to_index(maze.end)
         
-        def heuristic(pos):
-            """Calculate heuristic value for A* (distance to goal)."""
-            return manhattan_distance(pos, maze.end)
+        parents = array('i', [-1]) * (width * height)
+        g_scores = array('i', [-1]) * (width * height)
+        closed = bytearray(width * height)
+        parents[start] = start
+        g_scores[start] = 0
         
-        # Priority queue: (f_score, current_pos, path)
-        open_set = [(0, maze.start, [maze.start])]
-        visited = set()
+        # Priority queue: (f_score, x * height + y). The second field orders
+        # ties by (x, y) so the search pops cells in the same order as it
+        # did when positions were stored as tuples.
+        start_x, start_y = maze.start
+        open_set = [(0, start_x * height + start_y)]
+        expanded = revisits = 0
+        track = self.observer is not None
+        largest = 1
+        marks = [started, perf_counter()]
         
         while open_set:
-            f_score, current_pos, path = heapq.heappop(open_set)
+            f_score, key = heapq.heappop(open_set)
+            x, y = divmod(key, height)
+            current = y * width + x
             
-            if current_pos == maze.end:
-                return path
+            if current == end:
+                marks.append(perf_counter())
+                path = _build_path(maze, parents, end)
+                marks.append(perf_counter())
+                # Every entry pushed was expanded, skipped, is the end, or is still queued
+                stats = SolveStats(expanded, expanded + revisits + 1 + len(open_set), largest, revisits)
+                return self._finish(maze, path, stats, marks)
             
-            if current_pos in visited:
+            if closed[current]:
+                revisits += 1
                 continue
+            
+            closed[current] = 1
+            expanded += 1
+            g_score = g_scores[current] + 1  # Cost from start to neighbor
+            
+            for offset in offsets[masks[current]]:
+                neighbor = current + offset
+                if closed[neighbor]:
+                    continue
                 
-            visited.add(current_pos)
-            
-            for neighbor in maze.get_neighbors(current_pos):
-                if neighbor not in visited:
-                    new_path = path + [neighbor]
-                    g_score = len(new_path) - 1  # Cost from start to neighbor
-                    h_score = heuristic(neighbor)  # Estimated cost from neighbor to goal
-                    f_score = g_score + h_score
+                best = g_scores[neighbor]
+                if best < 0 or g_score < best:
+                    g_scores[neighbor] = g_score
+                    parents[neighbor] = current
+                    neighbor_y, neighbor_x = divmod(neighbor, width)
+                    h_score = abs(neighbor_x - end_x) + abs(neighbor_y - end_y)
+                    heapq.heappush(open_set, (g_score + h_score, neighbor_x * height + neighbor_y))
+            if track and len(open_set) > largest:
+                largest = len(open_set)
+        
+        marks.append(perf_counter())
+        return self._finish(maze, [], SolveStats(expanded, expanded + revisits, largest, revisits), marks)  # No path found
+
+class BidirectionalBFSMazeSolver(MazeSolver):
+    def solve(self, maze: Maze):
+        """
+        Solve the maze with breadth-first searches from both ends that meet in the middle.
+        
+        Each round expands one whole level of the smaller frontier. Once a level
+        touches cells already reached from the other side, the best meeting cell
+        of that level gives a shortest path.
+        """
+        started = perf_counter()
+        if maze.is_known_unreachable(maze.start, maze.end):
+            return self._finish(maze, [], SolveStats(), [started, perf_counter()])  # No path exists
+        masks, offsets = maze.neighbor_index()
+        start = maze.to_index(maze.start)
+        end = maze.to_index(maze.end)
+        
+        if start == end:
+            return self._finish(maze, [maze.start], SolveStats(), [started, perf_counter()])
+        
+        size = maze.width * maze.height
+        forward_parents = array('i', [-1]) * size
+        backward_parents = array('i', [-1]) * size
+        forward_depths = array('i', [-1]) * size
+        backward_depths = array('i', [-1]) * size
+        forward_parents[start] = start
+        backward_parents[end] = end
+        forward_depths[start] = 0
+        backward_depths[end] = 0
+        
+        forward = [start]
+        backward = [end]
+        expanded = 0
+        pushed = largest = 2
+        marks = [started, perf_counter()]
+        
+        while forward and backward:
+            largest = max(largest, len(forward) + len(backward))
+            
+            if len(forward) <= len(backward):
+                frontier, parents, depths, other_depths = forward, forward_parents, forward_depths, backward_depths
+            else:
+                frontier, parents, depths, other_depths = backward, backward_parents, backward_depths, forward_depths
+            
+            best_length = -1
+            meet = -1
+            next_frontier = []
+            for current in frontier:
+                expanded += 1
+                depth = depths[current] + 1
+                for offset in offsets[masks[current]]:
+                    neighbor = current + offset
+                    if depths[neighbor] >= 0:
+                        continue
+                    
+                    depths[neighbor] = depth
+                    parents[neighbor] = current
+                    next_frontier.append(neighbor)
                     
-                    heapq.heappush(open_set, (f_score, neighbor, new_path))
+                    other_depth = other_depths[neighbor]
+                    if other_depth >= 0 and (meet < 0 or depth + other_depth < best_length):
+                        best_length = depth + other_depth
+                        meet = neighbor
+            
+            pushed += len(next_frontier)
+            if meet >= 0:
+                marks.append(perf_counter())
+                path = _join_paths(maze, forward_parents, backward_parents, meet, meet)
+                marks.append(perf_counter())
+                return self._finish(maze, path, SolveStats(expanded, pushed, largest), marks)
+            
+            if frontier is forward:
+                forward = next_frontier
+            else:
+                backward = next_frontier
+        
+        marks.append(perf_counter())
+        return self._finish(maze, [], SolveStats(expanded, pushed, largest), marks)  # No path found
+
+class BidirectionalAStarMazeSolver(MazeSolver):
+    def solve(self, maze: Maze):
+        """
+        Solve the maze with A* searches from both ends.
+        
+        Each step expands the side whose best f-score is lower. Every edge that
+        links the two searches is a candidate path; the search stops once the
+        best candidate costs no more than the smallest f-score left on either
+        side, since the Manhattan heuristics are consistent and no remaining
+        path can be cheaper.
+        """
+        started = perf_counter()
+        if maze.is_known_unreachable(maze.start, maze.end):
+            return self._finish(maze, [], SolveStats(), [started, perf_counter()])  # No path exists
+        masks, offsets = maze.neighbor_index()
+        width = maze.width
+        start = maze.to_index(maze.start)
+        end = maze.to_index(maze.end)
+        
+        if start == end:
+            return self._finish(maze, [maze.start], SolveStats(), [started, perf_counter()])
+        
+        size = width * maze.height
+        sides = []
+        for source, (target_x, target_y) in ((start, maze.end), (end, maze.start)):
+            parents = array('i', [-1]) * size
+            g_scores = array('i', [-1]) * size
+            parents[source] = source
+            g_scores[source] = 0
+            sides.append((parents, g_scores, bytearray(size), [(0, source)], target_x, target_y))
+        
+        forward, backward = sides
+        best_length = -1
+        meet = None  # (forward cell, backward cell) of the best linking edge
+        expanded = revisits = 0
+        track = self.observer is not None
+        largest = 2
+        marks = [started, perf_counter()]
+        
+        while forward[3] and backward[3]:
+            lowest_f = max(forward[3][0][0], backward[3][0][0])
+            if best_length >= 0 and best_length <= lowest_f:
+                break
+            
+            side, other = (forward, backward) if forward[3][0][0] <= backward[3][0][0] else (backward, forward)
+            parents, g_scores, closed, open_set, target_x, target_y = side
+            other_g_scores = other[1]
+            
+            f_score, current = heapq.heappop(open_set)
+            if closed[current]:
+                revisits += 1
+                continue
+            
+            closed[current] = 1
+            expanded += 1
+            g_score = g_scores[current] + 1
+            
+            for offset in offsets[masks[current]]:
+                neighbor = current + offset
+                
+                other_g = other_g_scores[neighbor]
+                if other_g >= 0 and (best_length < 0 or g_score + other_g < best_length):
+                    best_length = g_score + other_g
+                    meet = (current, neighbor) if side is forward else (neighbor, current)
+                
+                if closed[neighbor]:
+                    continue
+                
+                best = g_scores[neighbor]
+                if best < 0 or g_score < best:
+                    g_scores[neighbor] = g_score
+                    parents[neighbor] = current
+                    neighbor_y, neighbor_x = divmod(neighbor, width)
+                    h_score = abs(neighbor_x - target_x) + abs(neighbor_y - target_y)
+                    heapq.heappush(open_set, (g_score + h_score, neighbor))
+            if track and len(forward[3]) + len(backward[3]) > largest:
+                largest = len(forward[3]) + len(backward[3])
+        
+        # Every entry pushed was expanded, skipped, or is still queued
+        marks.append(perf_counter())
+        pushed = expanded + revisits + len(forward[3]) + len(backward[3])
+        stats = SolveStats(expanded, pushed, largest, revisits)
+        if meet is None:
+            return self._finish(maze, [], stats, marks)  # No path found
         
-        return []  # No path found
+        path = _join_paths(maze, forward[0], backward[0], meet[0], meet[1])
+        marks.append(perf_counter())
+        return self._finish(maze, path, stats, marks)
+
+class JPSMazeSolver(MazeSolver):
+    """
+    Jump Point Search for 4-connected grids.
+    
+    Straight runs are scanned without touching the heap: a horizontal jump only
+    stops where a wall ends beside it (a forced neighbor), and a vertical jump
+    stops where a horizontal scan from it would find such a point. Only those
+    jump points are pushed, so open rooms cost a handful of heap operations
+    instead of one per cell. Weighted cells are treated as cost 1.
+    """
+
+    def solve(self, maze: Maze):
+        """Solve the maze using Jump Point Search with Manhattan distance heuristic."""
+        started = perf_counter()
+        if maze.is_known_unreachable(maze.start, maze.end):
+            return self._finish(maze, [], SolveStats(), [started, perf_counter()])  # No path exists
+        cells = maze.cells
+        width, height = maze.width, maze.height
+        goal_x, goal_y = maze.end
+        start = maze.to_index(maze.start)
+        end = maze.to_index(maze.end)
+        
+        def jump_horizontal(x, y, dx):
+            """Scan along the row from (x, y) and return the next jump point or -1."""
+            row = y * width
+            above = row - width if y > 0 else -1
+            below = row + width if y < height - 1 else -1
+            while True:
+                x += dx
+                if x < 0 or x >= width or cells[row + x] == WALL:
+                    return -1
+                if x == goal_x and y == goal_y:
+                    return row + x
+                # A forced neighbor: open beside us, but walled beside the previous cell
+                if above >= 0 and cells[above + x] != WALL and cells[above + x - dx] == WALL:
+                    return row + x
+                if below >= 0 and cells[below + x] != WALL and cells[below + x - dx] == WALL:
+                    return row + x
+        
+        def jump_vertical(x, y, dy):
+            """Scan along the column from (x, y) and return the next jump point or -1."""
+            while True:
+                y += dy
+                if y < 0 or y >= height or cells[y * width + x] == WALL:
+                    return -1
+                if (x == goal_x and y == goal_y) or jump_horizontal(x, y, -1) >= 0 or jump_horizontal(x, y, 1) >= 0:
+                    return y * width + x
+        
+        parents = array('i', [-1]) * (width * height)
+        g_scores = array('i', [-1]) * (width * height)
+        closed = bytearray(width * height)
+        parents[start] = start
+        g_scores[start] = 0
+        
+        open_set = [(0, start)]
+        expanded = revisits = 0
+        track = self.observer is not None
+        largest = 1
+        marks = [started, perf_counter()]
+        
+        while open_set:
+            f_score, current = heapq.heappop(open_set)
+            
+            if current == end:
+                marks.append(perf_counter())
+                path = self._expand_jumps(maze, parents, end)
+                marks.append(perf_counter())
+                # Every entry pushed was expanded, skipped, is the end, or is still queued
+                stats = SolveStats(expanded, expanded + revisits + 1 + len(open_set), largest, revisits)
+                return self._finish(maze, path, stats, marks)
+            
+            if closed[current]:
+                revisits += 1
+                continue
+            
+            closed[current] = 1
+            expanded += 1
+            y, x = divmod(current, width)
+            parent_y, parent_x = divmod(parents[current], width)
+            
+            # Prune to the directions a canonical path could take from here
+            if current == start:
+                directions = ((0, -1), (0, 1), (-1, 0), (1, 0))
+            elif parent_x == x:
+                dy = 1 if y > parent_y else -1
+                directions = ((0, dy), (-1, 0), (1, 0))
+            else:
+                dx = 1 if x > parent_x else -1
+                directions = [(dx, 0)]
+                for dy in (-1, 1):
+                    beside = current + dy * width
+                    if 0 <= y + dy < height and cells[beside] != WALL and cells[beside - dx] == WALL:
+                        directions.append((0, dy))
+            
+            for dx, dy in directions:
+                if dx:
+                    jump_point = jump_horizontal(x, y, dx)
+                else:
+                    jump_point = jump_vertical(x, y, dy)
+                if jump_point < 0 or closed[jump_point]:
+                    continue
+                
+                jump_y, jump_x = divmod(jump_point, width)
+                g_score = g_scores[current] + abs(jump_x - x) + abs(jump_y - y)
+                best = g_scores[jump_point]
+                if best < 0 or g_score < best:
+                    g_scores[jump_point] = g_score
+                    parents[jump_point] = current
+                    h_score = abs(jump_x - goal_x) + abs(jump_y - goal_y)
+                    heapq.heappush(open_set, (g_score + h_score, jump_point))
+            if track and len(open_set) > largest:
+                largest = len(open_set)
+        
+        marks.append(perf_counter())
+        return self._finish(maze, [], SolveStats(expanded, expanded + revisits, largest, revisits), marks)  # No path found
+
+    def _expand_jumps(self, maze, parents, end):
+        """Rebuild the full cell path by filling in the straight runs between jump points."""
+        jump_points = _build_path(maze, parents, end)
+        path = [jump_points[0]]
+        for x, y in jump_points[1:]:
+            last_x, last_y = path[-1]
+            step_x = (x > last_x) - (x < last_x)
+            step_y = (y > last_y) - (y < last_y)
+            while (last_x, last_y) != (x, y):
+                last_x += step_x
+                last_y += step_y
+                path.append((last_x, last_y))
+        
+        return path
 
 class DijkstraMazeSolver(MazeSolver):
     def solve(self, maze: Maze):
-        """Solve the maze using Dijkstra's algorithm."""
-        distances = {maze.start: 0}
-        previous = {}
-        unvisited = set()
-        
-        # Initialize all positions as unvisited
-        for y in range(len(maze.grid)):
-            for x in range(len(maze.grid[0])):
-                pos = (x, y)
-                if not maze.is_wall(pos):
-                    unvisited.add(pos)
-                    if pos != maze.start:
-                        distances[pos] = float('inf')
-        
-        while unvisited:
-            # Find unvisited node with minimum distance
-            current = min(unvisited, key=lambda pos: distances[pos])
-            
-            if current == maze.end:
+        """Solve the maze using Dijkstra's algorithm, honouring weighted cells."""
+        started = perf_counter()
+        if maze.is_known_unreachable(maze.start, maze.end):
+            return self._finish(maze, [], SolveStats(), [started, perf_counter()])  # No path exists
+        masks, offsets = maze.neighbor_index()
+        cells = maze.cells
+        start = maze.to_index(maze.start)
+        end = maze.to_index(maze.end)
+        
+        # distances[i] is the best known cost to reach i; -1 means not yet seen
+        distances = array('q', [-1]) * (maze.width * maze.height)
+        parents = array('i', [-1]) * (maze.width * maze.height)
+        settled = bytearray(maze.width * maze.height)
+        distances[start] = 0
+        parents[start] = start
+        
+        # Priority queue: (distance, index). Entries superseded by a shorter
+        # distance are left in place and skipped when popped.
+        queue = [(0, start)]
+        expanded = revisits = 0
+        track = self.observer is not None
+        largest = 1
+        marks = [started, perf_counter()]
+        
+        while queue:
+            distance, current = heapq.heappop(queue)
+            
+            if settled[current]:
+                revisits += 1
+                continue
+            
+            if current == end:
+                marks.append(perf_counter())
+                path = _build_path(maze, parents, end)
+                marks.append(perf_counter())
+                # Every entry pushed was expanded, skipped, is the end, or is still queued
+                stats = SolveStats(expanded, expanded + revisits + 1 + len(queue), largest, revisits)
+                return self._finish(maze, path, stats, marks)
+            
+            settled[current] = 1
+            expanded += 1
+            
+            for offset in offsets[masks[current]]:
+                neighbor = current + offset
+                if settled[neighbor]:
+                    continue
+                
+                new_distance = distance + CELL_COSTS[cells[neighbor]]
+                best = distances[neighbor]
+                if best < 0 or new_distance < best:
+                    distances[neighbor] = new_distance
+                    parents[neighbor] = current
+                    heapq.heappush(queue, (new_distance, neighbor))
+            if track and len(queue) > largest:
+                largest = len(queue)
+        
+        marks.append(perf_counter())
+        return self._finish(maze, [], SolveStats(expanded, expanded + revisits, largest, revisits), marks)  # No path found
+
+class ARAStarMazeSolver(MazeSolver):
+    """
+    Anytime Repairing A* (ARA*): a quick inflated-heuristic path, improved while budget remains.
+    
+    Each iteration runs weighted A* (f = g + weight * h) with a smaller
+    weight, reusing the costs already found: cells that improve after being
+    expanded are remembered as inconsistent and requeued for the next
+    iteration instead of searching from scratch. The latest path costs at
+    most ``bound`` times the optimum, where the bound is measured from the
+    queue rather than taken on faith from the weight. Weighted cells cost
+    their value.
+    
+    A ``time_limit`` (seconds) and a ``node_limit`` (expansions, across all
+    iterations) can be set on the solver or passed to solve(). When either
+    runs out the best path so far is returned; if none was found yet, the
+    path to the expanded cell nearest the end comes back with
+    ``complete = False``. Both default to no limit, so the registered
+    solvers always return complete paths.
+    """
+
+    # Expansions between clock checks when a time limit is set
+    CHECK_INTERVAL = 64
+
+    def __init__(self, initial_weight=3.0, weight_step=0.5, time_limit=None, node_limit=None):
+        """
+        Args:
+            initial_weight (float): Heuristic weight of the first iteration
+            weight_step (float): How much the weight drops per iteration, down to 1
+            time_limit (float): Default seconds per solve, or None for no limit
+            node_limit (int): Default expansions per solve, or None for no limit
+        """
+        self.initial_weight = initial_weight
+        self.weight_step = weight_step
+        self.time_limit = time_limit
+        self.node_limit = node_limit
+
+    def _weights(self):
+        """Return the heuristic weight of every iteration, ending at 1."""
+        weights = [self.initial_weight]
+        while weights[-1] > 1:
+            weights.append(max(1.0, weights[-1] - self.weight_step))
+        return weights
+
+    def solve(self, maze: Maze, time_limit=None, node_limit=None):
+        """
+        Find a path, refining it while the budget lasts.
+        
+        Args:
+            maze (Maze): The maze to solve
+            time_limit (float): Seconds the solve may take (defaults to the solver's)
+            node_limit (int): Expansions the solve may make (defaults to the solver's)
+            
+        Returns:
+            SolvePath: The best path found, or a partial one if cut off first
+        """
+        started = perf_counter()
+        time_limit = self.time_limit if time_limit is None else time_limit
+        node_limit = self.node_limit if node_limit is None else node_limit
+        if maze.is_known_unreachable(maze.start, maze.end):
+            return self._finish(maze, SolvePath(), SolveStats(), [started, perf_counter()])  # No path exists
+        deadline = started + time_limit if time_limit is not None else None
+        masks, offsets = maze.neighbor_index()
+        cells = maze.cells
+        width = maze.width
+        end_x, end_y = maze.end
+        start = maze.to_index(maze.start)
+        end = maze.to_index(maze.end)
+        infinity = float('inf')
+        
+        def heuristic(index):
+            y, x = divmod(index, width)
+            return abs(x - end_x) + abs(y - end_y)
+        
+        g_scores = {start: 0}
+        parents = {start: start}
+        open_cells = {start}  # Cells queued this iteration; heap entries for others are stale
+        inconsistent = set()  # Improved after expansion; queued again next iteration
+        best_path = None
+        bound = infinity
+        nearest, nearest_h = start, heuristic(start)
+        expanded = pushed = revisits = 0
+        track = self.observer is not None
+        largest = 1
+        out_of_budget = False
+        marks = [started, perf_counter()]
+        
+        for weight in self._weights():
+            if best_path is not None and weight >= bound:
+                continue  # The current path is already as good as this weight promises
+            open_set = [(g_scores[cell] + weight * heuristic(cell), cell) for cell in open_cells | inconsistent]
+            heapq.heapify(open_set)
+            pushed += len(open_set)
+            open_cells |= inconsistent
+            inconsistent = set()
+            closed = set()
+            
+            while open_set:
+                f_score, current = open_set[0]
+                if current not in open_cells or f_score != g_scores[current] + weight * heuristic(current):
+                    heapq.heappop(open_set)
+                    revisits += 1
+                    continue
+                if g_scores.get(end, infinity) <= f_score:
+                    break  # Nothing left in the queue can improve the path to the end
+                if (node_limit is not None and expanded >= node_limit) or (
+                        deadline is not None and expanded % self.CHECK_INTERVAL == 0 and perf_counter() >= deadline):
+                    out_of_budget = True
+                    break
+                
+                heapq.heappop(open_set)
+                open_cells.discard(current)
+                closed.add(current)
+                expanded += 1
+                h_score = heuristic(current)
+                if h_score < nearest_h:
+                    nearest, nearest_h = current, h_score
+                g_score = g_scores[current]
+                
+                for offset in offsets[masks[current]]:
+                    neighbor = current + offset
+                    new_score = g_score + CELL_COSTS[cells[neighbor]]
+                    if new_score < g_scores.get(neighbor, infinity):
+                        g_scores[neighbor] = new_score
+                        parents[neighbor] = current
+                        if neighbor in closed:
+                            inconsistent.add(neighbor)
+                        else:
+                            open_cells.add(neighbor)
+                            heapq.heappush(open_set, (new_score + weight * heuristic(neighbor), neighbor))
+                            pushed += 1
+                if track and len(open_set) > largest:
+                    largest = len(open_set)
+            
+            if end in g_scores and not (out_of_budget and best_path is not None):
+                # Bound the new path by the cheapest cell still waiting anywhere
+                waiting = open_cells | inconsistent
+                lowest = min((g_scores[cell] + heuristic(cell) for cell in waiting), default=g_scores[end])
+                best_path = _build_path(maze, parents, end)
+                bound = min(weight, g_scores[end] / lowest) if lowest else 1.0
+                bound = max(bound, 1.0)
+            if out_of_budget or bound <= 1 or end not in g_scores:
+                break  # Out of budget, optimal, or searched everything without reaching the end
+        
+        marks.append(perf_counter())
+        if best_path is not None:
+            path = SolvePath(best_path, complete=True, bound=bound)
+        elif not out_of_budget:
+            path = SolvePath()  # Searched everything reachable: no path exists
+        else:
+            path = SolvePath(_build_path(maze, parents, nearest), complete=False, bound=infinity)
+        marks.append(perf_counter())
+        return self._finish(maze, path, SolveStats(expanded, pushed, largest, revisits), marks)
+
+class WeightedAStarMazeSolver(ARAStarMazeSolver):
+    """
+    Weighted A*: one search with the heuristic inflated by ``weight``.
+    
+    Expands far fewer cells than A* on open mazes, for a path costing at
+    most ``weight`` times the optimum. Takes the same budgets as ARA* but
+    stops at the first path instead of refining it.
+    """
+
+    def __init__(self, weight=2.0, time_limit=None, node_limit=None):
+        """
+        Args:
+            weight (float): Heuristic weight (1 is plain A*)
+            time_limit (float): Default seconds per solve, or None for no limit
+            node_limit (int): Default expansions per solve, or None for no limit
+        """
+        self.weight = weight
+        self.time_limit = time_limit
+        self.node_limit = node_limit
+
+    def _weights(self):
+        return [self.weight]
+
+class ReducedMazeSolver(MazeSolver):
+    """
+    Solve on the maze's reduced form: dead ends filled, corridors contracted.
+    
+    By default Dijkstra's algorithm runs over the junction graph, expanding
+    one junction per node instead of one cell, and the route found is walked
+    back out into cells. Any other solver can run on the pruned maze instead.
+    The reduction is cached on the maze until it is edited.
+    """
+
+    def __init__(self, inner=None):
+        """
+        Args:
+            inner (str): Key into SOLVERS of a solver to run on the pruned
+                maze, or None to search the junction graph
+        """
+        if inner is not None and inner not in SOLVERS:
+            raise ValueError(f"Unknown solver: {inner}")
+        self.inner = inner
+
+    def solve(self, maze: Maze):
+        """Solve the maze on its reduced form, returning a full cell path."""
+        started = perf_counter()
+        if maze.is_known_unreachable(maze.start, maze.end):
+            return self._finish(maze, [], SolveStats(), [started, perf_counter()])  # No path exists
+        reduced = maze.reduction()
+        marks = [started, perf_counter()]
+        
+        if self.inner is not None:
+            solver = SOLVERS[self.inner]()
+            path = solver.solve(reduced.pruned)
+            marks.append(perf_counter())
+            return self._finish(maze, path, solver.last_stats, marks, ('setup', 'search'))
+        
+        edges = reduced.edges
+        start = maze.to_index(maze.start)
+        end = maze.to_index(maze.end)
+        if start == end:
+            marks.append(perf_counter())
+            return self._finish(maze, [maze.start], SolveStats(), marks, ('setup', 'search'))
+        
+        # parents[node] is the node it was reached from and steps[node] the
+        # first step offset of the corridor taken; -1 distances are unseen
+        size = maze.width * maze.height
+        distances = array('q', [-1]) * size
+        parents = array('i', [-1]) * size
+        steps = array('i', [0]) * size
+        settled = bytearray(size)
+        distances[start] = 0
+        queue = [(0, start)]
+        expanded = revisits = 0
+        track = self.observer is not None
+        largest = 1
+        
+        while queue:
+            distance, current = heapq.heappop(queue)
+            
+            if settled[current]:
+                revisits += 1
+                continue
+            
+            if current == end:
+                marks.append(perf_counter())
+                route = []
+                while current != start:
+                    route.append((parents[current], steps[current]))
+                    current = parents[current]
+                path = reduced.expand(route[::-1])
+                marks.append(perf_counter())
+                stats = SolveStats(expanded, expanded + revisits + 1 + len(queue), largest, revisits)
+                return self._finish(maze, path, stats, marks)
+            
+            settled[current] = 1
+            expanded += 1
+            
+            for neighbor, cost, offset in edges[current]:
+                if settled[neighbor]:
+                    continue
+                
+                new_distance = distance + cost
+                best = distances[neighbor]
+                if best < 0 or new_distance < best:
+                    distances[neighbor] = new_distance
+                    parents[neighbor] = current
+                    steps[neighbor] = offset
+                    heapq.heappush(queue, (new_distance, neighbor))
+            if track and len(queue) > largest:
+                largest = len(queue)
+        
+        marks.append(perf_counter())
+        return self._finish(maze, [], SolveStats(expanded, expanded + revisits, largest, revisits), marks)  # No path found
+
+class HPAStarMazeSolver(MazeSolver):
+    """
+    Hierarchical A* (HPA*): plan over cluster entrances, then refine locally.
+    
+    The maze's cached Hierarchy (see hierarchical.py) supplies the abstract
+    graph. The start and end are linked into it by a search of their own
+    clusters, A* runs over the abstract nodes with the Manhattan heuristic,
+    and every abstract edge is refined into cells by a search confined to one
+    cluster. Paths are near-optimal rather than shortest: crossing a border
+    is only possible at the transitions picked for each entrance. Smaller
+    clusters cost more abstract nodes (and latency) but bend paths less.
+    """
+
+    def __init__(self, cluster_size=16):
+        """
+        Args:
+            cluster_size (int): Width and height of a cluster in cells
+        """
+        self.cluster_size = cluster_size
+
+    def solve(self, maze: Maze):
+        """Solve the maze with HPA*, honouring weighted cells."""
+        started = perf_counter()
+        if maze.is_known_unreachable(maze.start, maze.end):
+            return self._finish(maze, [], SolveStats(), [started, perf_counter()])  # No path exists
+        hierarchy = maze.hierarchy(self.cluster_size)
+        cells = maze.cells
+        width = maze.width
+        start = maze.to_index(maze.start)
+        end = maze.to_index(maze.end)
+        
+        if start == end:
+            return self._finish(maze, [maze.start], SolveStats(), [started, perf_counter()], ('setup',))
+        
+        # Link the start to the nodes of its cluster and those of the end's
+        # cluster to the end; a search from the end gives the reverse costs,
+        # which differ from the forward ones only by the two endpoint cells
+        start_cluster = hierarchy.cluster_of(start)
+        end_cluster = hierarchy.cluster_of(end)
+        start_costs, _, local = hierarchy.search(start_cluster, start)
+        end_costs, _, end_local = hierarchy.search(end_cluster, end)
+        local += end_local
+        links = {start: [(node, start_costs[node]) for node in hierarchy.edges[start_cluster] if node in start_costs]}
+        if start_cluster == end_cluster and end in start_costs:
+            links[start].append((end, start_costs[end]))
+        for node in hierarchy.edges[end_cluster]:
+            if node in end_costs and node != end:
+                cost = end_costs[node] - CELL_COSTS[cells[node]] + CELL_COSTS[cells[end]]
+                links.setdefault(node, []).append((end, cost))
+        
+        end_y, end_x = divmod(end, width)
+        start_y, start_x = divmod(start, width)
+        g_scores = {start: 0}
+        parents = {start: start}
+        closed = set()
+        open_set = [(abs(start_x - end_x) + abs(start_y - end_y), start)]
+        expanded = revisits = 0
+        track = self.observer is not None
+        largest = 1
+        marks = [started, perf_counter()]
+        
+        while open_set:
+            f_score, current = heapq.heappop(open_set)
+            if current == end:
                 break
+            if current in closed:
+                revisits += 1
+                continue
+            
+            closed.add(current)
+            expanded += 1
+            g_score = g_scores[current]
+            nodes = hierarchy.edges[hierarchy.cluster_of(current)].get(current, ())
+            for neighbor, cost in list(nodes) + links.get(current, []):
+                if neighbor in closed:
+                    continue
                 
-            unvisited.remove(current)
+                new_score = g_score + cost
+                best = g_scores.get(neighbor)
+                if best is None or new_score < best:
+                    g_scores[neighbor] = new_score
+                    parents[neighbor] = current
+                    neighbor_y, neighbor_x = divmod(neighbor, width)
+                    heapq.heappush(open_set, (new_score + abs(neighbor_x - end_x) + abs(neighbor_y - end_y), neighbor))
+            if track and len(open_set) > largest:
+                largest = len(open_set)
+        else:
+            marks.append(perf_counter())
+            stats = SolveStats(expanded + local, expanded + revisits + local, largest, revisits)
+            return self._finish(maze, [], stats, marks)  # No path found
+        
+        marks.append(perf_counter())
+        pushed = expanded + revisits + 1 + len(open_set)
+        route = [end]
+        while route[-1] != start:
+            route.append(parents[route[-1]])
+        route.reverse()
+        
+        # Refine: transitions are single steps, everything else a search inside one cluster
+        path = [maze.start]
+        for first, second in zip(route, route[1:]):
+            if abs(second - first) == width or (abs(second - first) == 1 and second // width == first // width):
+                path.append(maze.to_position(second))
+                continue
+            _, local_parents, cells_expanded = hierarchy.search(hierarchy.cluster_of(first), first, (second,))
+            local += cells_expanded
+            segment = [second]
+            while segment[-1] != first:
+                segment.append(local_parents[segment[-1]])
+            path.extend(maze.to_position(index) for index in reversed(segment[:-1]))
+        marks.append(perf_counter())
+        
+        stats = SolveStats(expanded + local, pushed + local, largest, revisits)
+        return self._finish(maze, path, stats, marks)
+
+class DStarLiteMazeSolver(MazeSolver):
+    """
+    D* Lite: an incremental search that repairs its last result instead of starting over.
+    
+    The search runs backwards from the end, so g[i] is the cost of getting
+    from cell i to the end and any start can read its path off g. The solver
+    listens for Maze.set_wall edits; on the next solve only the cells whose
+    costs the edits changed are re-expanded. Moving the start (e.g. to the
+    player's position) reuses the search too, by raising every queued key by
+    the distance moved (``km``) instead of re-sorting the queue. Weighted
+    cells cost their value.
+    """
+
+    # Cost of unreachable cells; larger than any real path
+    INFINITY = 1 << 60
+
+    def __init__(self):
+        self._maze = None
+        self._changed = []
+        self._neighbors = None
+
+    def solve(self, maze: Maze, start=None):
+        """
+        Find a cheapest path, reusing the previous search on the same maze.
+        
+        Args:
+            maze (Maze): The maze to solve
+            start (tuple): Position to plan from (defaults to maze.start)
             
-            for neighbor in maze.get_neighbors(current):
-                if neighbor in unvisited:
-                    distance = distances[current] + 1
-                    if distance < distances[neighbor]:
-                        distances[neighbor] = distance
-                        previous[neighbor] = current
+        Returns:
+            list: Positions from start to the end, or [] if there is no path
+        """
+        started = perf_counter()
+        if maze.is_known_unreachable(start if start is not None else maze.start, maze.end):
+            return self._finish(maze, [], SolveStats(), [started, perf_counter()])  # No path exists
+        attached = maze is not self._maze or self._goal != maze.to_index(maze.end)
+        if attached:
+            self._attach(maze)
+        
+        start = maze.to_index(start if start is not None else maze.start)
+        if start != self._start:
+            self._km += self._distance(self._start, start)
+            self._start = start
+        self._start_x, self._start_y = maze.to_position(start)
+        
+        # Re-examine the edited cells and the cells next to them
+        self._expanded = self._revisits = 0
+        self._pushed = 1 if attached else 0  # A fresh search starts with the end queued
+        self._neighbors = masks, offsets = maze.neighbor_index()
+        for index in self._changed:
+            self._update(index)
+            for offset in offsets[masks[index]]:
+                self._update(index + offset)
+        self._changed = []
+        self._largest = len(self._open)
+        marks = [started, perf_counter()]
         
-        # Reconstruct path
-        if maze.end not in previous and maze.end != maze.start:
-            return []
+        self._compute()
+        marks.append(perf_counter())
+        path = self._extract_path() if maze.cells[start] != WALL else []
+        marks.append(perf_counter())
+        
+        stats = SolveStats(self._expanded, self._pushed, self._largest, self._revisits)
+        return self._finish(maze, path, stats, marks)
+
+    def replan(self, maze: Maze, position):
+        """Find a cheapest path from ``position`` (e.g. after the player moved)."""
+        return self.solve(maze, position)
+
+    def detach(self):
+        """Stop listening to the current maze and drop the search state."""
+        if self._maze is not None:
+            self._maze.remove_listener(self._cells_changed)
+            self._maze = None
+
+    def _attach(self, maze):
+        """Start a fresh search on a maze and subscribe to its edits."""
+        self.detach()
+        self._maze = maze
+        maze.add_listener(self._cells_changed)
+        
+        size = maze.width * maze.height
+        self._goal = maze.to_index(maze.end)
+        self._start = maze.to_index(maze.start)
+        self._km = 0
+        self._start_x, self._start_y = maze.start
+        self._neighbors = maze.neighbor_index()
+        self._g = array('q', [self.INFINITY]) * size
+        self._rhs = array('q', [self.INFINITY]) * size
+        self._rhs[self._goal] = 0
+        self._keys = {self._goal: self._key(self._goal)}  # Queued cells -> current key
+        self._open = [(*self._keys[self._goal], self._goal)]
+        self._changed = []
+
+    def _cells_changed(self, maze, positions):
+        """Maze listener: queue edited cells until the next solve."""
+        self._changed.extend(maze.to_index(position) for position in positions)
+
+    def _distance(self, first, second):
+        """Manhattan distance between two cell indices."""
+        first_y, first_x = divmod(first, self._maze.width)
+        second_y, second_x = divmod(second, self._maze.width)
+        return abs(first_x - second_x) + abs(first_y - second_y)
+
+    def _key(self, index):
+        """Queue priority of a cell: estimated cost through it, then its own cost."""
+        g, rhs = self._g[index], self._rhs[index]
+        best = g if g < rhs else rhs
+        y, x = divmod(index, self._maze.width)
+        return (best + abs(x - self._start_x) + abs(y - self._start_y) + self._km, best)
+
+    def _update(self, index):
+        """Recompute a cell's one-step lookahead cost and (re)queue it if inconsistent."""
+        cells = self._maze.cells
+        g, rhs = self._g, self._rhs
+        if index != self._goal:
+            best = self.INFINITY
+            if cells[index] != WALL:
+                masks, offsets = self._neighbors
+                for offset in offsets[masks[index]]:
+                    neighbor = index + offset
+                    if g[neighbor] < best:
+                        cost = g[neighbor] + CELL_COSTS[cells[neighbor]]
+                        if cost < best:
+                            best = cost
+            rhs[index] = best
+        
+        if g[index] != rhs[index]:
+            key = self._key(index)
+            self._keys[index] = key
+            heapq.heappush(self._open, (*key, index))
+            self._pushed += 1
+        else:
+            self._keys.pop(index, None)
+
+    def _compute(self):
+        """Expand inconsistent cells until the start's cost is settled."""
+        masks, offsets = self._neighbors
+        g, rhs, keys, open_set = self._g, self._rhs, self._keys, self._open
+        start = self._start
+        track = self.observer is not None
+        
+        while open_set:
+            first, second, index = open_set[0]
+            if keys.get(index) != (first, second):
+                heapq.heappop(open_set)  # Superseded entry
+                self._revisits += 1
+                continue
+            if (first, second) >= self._key(start) and rhs[start] == g[start]:
+                break
             
-        path = []
-        current = maze.end
-        while current is not None:
-            path.append(current)
-            current = previous.get(current)
+            heapq.heappop(open_set)
+            key = self._key(index)
+            if (first, second) < key:
+                # The start moved since this cell was queued
+                keys[index] = key
+                heapq.heappush(open_set, (*key, index))
+                self._pushed += 1
+                continue
+            
+            self._expanded += 1
+            del keys[index]
+            if g[index] > rhs[index]:
+                g[index] = rhs[index]
+            else:
+                g[index] = self.INFINITY
+                self._update(index)
+            for offset in offsets[masks[index]]:
+                self._update(index + offset)
+            if track and len(open_set) > self._largest:
+                self._largest = len(open_set)
+
+    def _extract_path(self):
+        """Follow the cheapest neighbor from the start down to the end."""
+        maze = self._maze
+        cells = maze.cells
+        masks, offsets = self._neighbors
+        g = self._g
+        current = self._start
+        if g[current] >= self.INFINITY:
+            return []  # No path found
         
-        return path[::-1]  # Reverse to get start to end order 
\ No newline at end of file
+        path = [maze.to_position(current)]
+        while current != self._goal:
+            best = self.INFINITY
+            for offset in offsets[masks[current]]:
+                neighbor = current + offset
+                cost = g[neighbor] + CELL_COSTS[cells[neighbor]]
+                if cost < best:
+                    best = cost
+                    step = neighbor
+            current = step
+            path.append(maze.to_position(current))
+        
+        return path
+
+# Command-line and service names for every solver
+SOLVERS = {
+    'dfs': DFSMazeSolver,
+    'bfs': BFSMazeSolver,
+    'astar': AStarMazeSolver,
+    'dijkstra': DijkstraMazeSolver,
+    'distance-field': DistanceFieldMazeSolver,
+    'bidirectional-bfs': BidirectionalBFSMazeSolver,
+    'bidirectional-astar': BidirectionalAStarMazeSolver,
+    'jps': JPSMazeSolver,
+    'reduced': ReducedMazeSolver,
+    'hpa': HPAStarMazeSolver,
+    'weighted-astar': WeightedAStarMazeSolver,
+    'ara': ARAStarMazeSolver,
+    'dstar-lite': DStarLiteMazeSolver
+}
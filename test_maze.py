@@ -4,9 +4,34 @@ Test script for Maze Solver
 Demonstrates all solver algorithms and validates their functionality.
 """
 
+import asyncio
+import base64
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
+import heapq
+import io
+import json
+import os
+import sys
+import tempfile
 from maze import Maze
-from solver import DFSMazeSolver, BFSMazeSolver, AStarMazeSolver, DijkstraMazeSolver
+from solver import (DFSMazeSolver, BFSMazeSolver, AStarMazeSolver, DijkstraMazeSolver, DistanceFieldMazeSolver,
+                    BidirectionalBFSMazeSolver, BidirectionalAStarMazeSolver, JPSMazeSolver, DStarLiteMazeSolver,
+                    ReducedMazeSolver, HPAStarMazeSolver, ARAStarMazeSolver, WeightedAStarMazeSolver,
+                    SOLVERS, PHASES, StatsCollector)
+from distance_field import compute_distance_field, HAVE_NUMPY
 from player import Player
+from cache import SolveCache, solve_key
+from queries import PathQueryService
+from batch import solve_batch
+from mazefile import MappedCells, load_maze, save_maze, read_text, write_text
+from generator import GENERATORS, generate_maze
+from benchmark import TOPOLOGIES, run_suite, compare_runs
+from renderer import TerminalRenderer, CLEAR_SCREEN
+from game import Game
+from server import SolveServer
+from compactpath import CompactPath
 
 def test_simple_maze():
     """Test with a simple maze."""
@@ -132,6 +157,988 @@ def test_maze_validation():
     except ValueError as e:
         print(f"❌ Maze creation failed: {e}")
 
+def test_packed_grid():
+    """Test that the packed cell buffer mirrors the list-of-lists input."""
+    print("\n" + "="*60)
+    print("TESTING PACKED GRID")
+    print("="*60)
+    
+    grid = [
+        ['S', 0, 1],
+        [1, 0, 1],
+        [1, 0, 'E']
+    ]
+    
+    maze = Maze(grid)
+    assert (maze.width, maze.height) == (3, 3)
+    assert maze.cells == bytearray([0, 0, 1, 1, 0, 1, 1, 0, 0])
+    assert maze.grid == grid
+    assert maze.is_wall((2, 0)) and maze.is_wall((-1, 0)) and not maze.is_wall((1, 1))
+    assert maze.get_neighbors((1, 1)) == [(1, 0), (1, 2)]
+    assert maze.get_maze_stats()['wall_cells'] == 4
+    
+    packed = Maze.from_cells(bytearray(maze.cells), 3, 3, maze.start, maze.end)
+    assert packed.grid == grid
+    assert BFSMazeSolver().solve(packed) == [(0, 0), (1, 0), (1, 1), (1, 2), (2, 2)]
+    print("✅ Packed grid matches input")
+
+def test_neighbor_index():
+    """Test that the precomputed neighbor index agrees with get_neighbors."""
+    print("\n" + "="*60)
+    print("TESTING NEIGHBOR INDEX")
+    print("="*60)
+    
+    grid = [
+        ['S', 0, 0, 0, 0, 0, 0, 0, 0, 0],
+        [1, 1, 0, 1, 1, 1, 1, 1, 1, 0],
+        [0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+        [0, 1, 1, 1, 1, 1, 1, 1, 1, 0],
+        [0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+        [1, 1, 1, 1, 1, 1, 1, 1, 1, 0],
+        [0, 0, 0, 0, 0, 0, 0, 0, 0, 'E']
+    ]
+    
+    maze = Maze(grid)
+    masks, offsets = maze.neighbor_index()
+    assert maze.neighbor_index()[0] is masks  # Built once, then shared
+    
+    for y in range(maze.height):
+        for x in range(maze.width):
+            index = maze.to_index((x, y))
+            from_index = [maze.to_position(index + offset) for offset in offsets[masks[index]]]
+            assert from_index == maze.get_neighbors((x, y))
+    
+    assert maze.get_neighbors((-1, 0)) == [(0, 0)]
+    print("✅ Neighbor index matches get_neighbors")
+
+def _reference_bfs(maze):
+    """The original path-copying BFS, kept as a regression reference."""
+    queue = deque([(maze.start, [maze.start])])
+    visited = set()
+    
+    while queue:
+        current_pos, path = queue.popleft()
+        if current_pos == maze.end:
+            return path
+        if current_pos in visited:
+            continue
+        visited.add(current_pos)
+        for neighbor in maze.get_neighbors(current_pos):
+            if neighbor not in visited:
+                queue.append((neighbor, path + [neighbor]))
+    
+    return []
+
+def _reference_astar(maze):
+    """The original path-copying A*, kept as a regression reference."""
+    open_set = [(0, maze.start, [maze.start])]
+    visited = set()
+    
+    while open_set:
+        f_score, current_pos, path = heapq.heappop(open_set)
+        if current_pos == maze.end:
+            return path
+        if current_pos in visited:
+            continue
+        visited.add(current_pos)
+        for neighbor in maze.get_neighbors(current_pos):
+            if neighbor not in visited:
+                new_path = path + [neighbor]
+                h_score = abs(neighbor[0] - maze.end[0]) + abs(neighbor[1] - maze.end[1])
+                heapq.heappush(open_set, (len(new_path) - 1 + h_score, neighbor, new_path))
+    
+    return []
+
+def _corridor_grid(width, height):
+    """Build a serpentine maze where every open cell lies on the single path."""
+    grid = []
+    for y in range(height):
+        if y % 2 == 0:
+            grid.append([0] * width)
+        else:
+            row = [1] * width
+            row[width - 1 if y % 4 == 1 else 0] = 0  # Gap alternates sides
+            grid.append(row)
+    
+    grid[0][0] = 'S'
+    grid[height - 1][width - 1 if (height - 1) % 4 == 0 else 0] = 'E'
+    return grid
+
+def test_parent_pointer_solvers():
+    """Test parent-pointer BFS and A* against the original path-copying versions."""
+    print("\n" + "="*60)
+    print("TESTING PARENT-POINTER BFS AND A*")
+    print("="*60)
+    
+    grids = [
+        [
+            ['S', 0, 0, 0, 0, 0, 0, 0, 0, 0],
+            [1, 1, 0, 1, 1, 1, 1, 1, 1, 0],
+            [0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+            [0, 1, 1, 1, 1, 1, 1, 1, 1, 0],
+            [0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+            [1, 1, 1, 1, 1, 1, 1, 1, 1, 0],
+            [0, 0, 0, 0, 0, 0, 0, 0, 0, 'E']
+        ],
+        [
+            ['S', 1, 0, 0, 0, 0, 0, 0, 0, 0],
+            [0, 1, 0, 1, 1, 1, 1, 1, 1, 0],
+            [0, 1, 0, 0, 0, 0, 0, 0, 0, 0],
+            [0, 1, 1, 1, 1, 1, 1, 1, 1, 0],
+            [0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+            [1, 1, 1, 1, 1, 1, 1, 1, 1, 0],
+            [0, 0, 0, 0, 0, 0, 0, 0, 0, 'E']
+        ],
+        _corridor_grid(12, 9)
+    ]
+    
+    for grid in grids:
+        maze = Maze(grid)
+        assert BFSMazeSolver().solve(maze) == _reference_bfs(maze)
+        # A* may break equal-cost ties differently, but never finds a longer path
+        path = AStarMazeSolver().solve(maze)
+        assert len(path) == len(_reference_astar(maze)) and maze.validate_path(path)['valid']
+    
+    # A long corridor would have needed O(N * L) memory with copied paths
+    maze = Maze(_corridor_grid(301, 301))
+    open_cells = maze.width * maze.height - maze.get_maze_stats()['wall_cells']
+    for solver in (BFSMazeSolver(), AStarMazeSolver()):
+        path = solver.solve(maze)
+        assert maze.validate_path(path)['valid']
+        assert len(path) == open_cells
+    print("✅ Parent-pointer solvers match the reference paths")
+
+def test_weighted_dijkstra():
+    """Test that Dijkstra routes around expensive cells that BFS walks through."""
+    print("\n" + "="*60)
+    print("TESTING WEIGHTED DIJKSTRA")
+    print("="*60)
+    
+    grid = [
+        ['S', 9, 9, 'E'],
+        [0, 1, 1, 0],
+        [0, 0, 0, 0]
+    ]
+    
+    maze = Maze(grid)
+    assert maze.is_weighted()
+    assert maze.get_cost((1, 0)) == 9 and maze.get_cost((0, 2)) == 1
+    assert maze.get_maze_stats()['weighted_cells'] == 2
+    
+    bfs_path = BFSMazeSolver().solve(maze)
+    dijkstra_path = DijkstraMazeSolver().solve(maze)
+    assert maze.validate_path(dijkstra_path)['valid']
+    assert len(bfs_path) == 4 and maze.get_path_cost(bfs_path) == 19
+    assert dijkstra_path == [(0, 0), (0, 1), (0, 2), (1, 2), (2, 2), (3, 2), (3, 1), (3, 0)]
+    assert maze.get_path_cost(dijkstra_path) == 7
+    print("✅ Dijkstra found the cheaper weighted path")
+
+def test_iterative_dfs():
+    """Test that DFS handles paths far longer than the recursion limit."""
+    print("\n" + "="*60)
+    print("TESTING ITERATIVE DFS")
+    print("="*60)
+    
+    maze = Maze(_corridor_grid(101, 101))
+    solver = DFSMazeSolver()
+    path = solver.solve(maze)
+    assert len(path) > sys.getrecursionlimit()
+    assert maze.validate_path(path)['valid']
+    
+    streamed_path = []
+    visited = list(solver.iter_visited(maze, streamed_path))
+    assert streamed_path == path
+    assert visited[0] == maze.start and visited[-1] == maze.end
+    assert len(visited) == len(set(visited))
+    print(f"✅ DFS solved a {len(path)}-step corridor")
+
+def test_distance_field():
+    """Test the distance field engine with and without NumPy."""
+    print("\n" + "="*60)
+    print("TESTING DISTANCE FIELD")
+    print("="*60)
+    
+    maze = Maze(_corridor_grid(31, 31))
+    bfs_path = BFSMazeSolver().solve(maze)
+    engines = [False, True] if HAVE_NUMPY else [False]
+    
+    for use_numpy in engines:
+        field = compute_distance_field(maze, use_numpy=use_numpy)
+        assert field.distance_to(maze.end) == len(bfs_path) - 1
+        assert field.distance_to((1, 1)) == -1  # Wall
+        assert field.path_to(maze.end) == bfs_path
+        assert DistanceFieldMazeSolver(use_numpy=use_numpy).solve(maze) == bfs_path
+    
+    assert maze.get_shortest_path_length() == 30
+    assert maze.get_shortest_path_length(exact=True) == len(bfs_path) - 1
+    print(f"✅ Distance field agrees with BFS (NumPy available: {HAVE_NUMPY})")
+
+def test_bidirectional_solvers():
+    """Test that bidirectional BFS and A* find shortest paths."""
+    print("\n" + "="*60)
+    print("TESTING BIDIRECTIONAL SOLVERS")
+    print("="*60)
+    
+    grids = [
+        [
+            ['S', 0, 0, 0, 1, 0, 0, 0, 0, 0],
+            [1, 1, 0, 1, 1, 1, 1, 1, 1, 0],
+            [0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+            [0, 1, 1, 1, 1, 1, 1, 1, 1, 0],
+            [0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+            [1, 1, 1, 1, 1, 1, 1, 1, 1, 0],
+            [0, 0, 0, 0, 0, 0, 0, 0, 0, 'E']
+        ],
+        _corridor_grid(41, 41),
+        [['S', 0, 0, 0, 0, 0, 0, 0, 0, 'E']]
+    ]
+    
+    for grid in grids:
+        maze = Maze(grid)
+        expected = len(BFSMazeSolver().solve(maze))
+        for solver in (BidirectionalBFSMazeSolver(), BidirectionalAStarMazeSolver()):
+            path = solver.solve(maze)
+            assert len(path) == expected
+            assert maze.validate_path(path)['valid']
+            assert solver.nodes_expanded > 0
+    
+    unsolvable = Maze([['S', 1, 0, 'E']])
+    assert BidirectionalBFSMazeSolver().solve(unsolvable) == []
+    assert BidirectionalAStarMazeSolver().solve(unsolvable) == []
+    print("✅ Bidirectional solvers found shortest paths")
+
+def test_jump_point_search():
+    """Test that JPS matches BFS path lengths while expanding far fewer nodes."""
+    print("\n" + "="*60)
+    print("TESTING JUMP POINT SEARCH")
+    print("="*60)
+    
+    open_room = [[0] * 40 for _ in range(40)]
+    open_room[0][0] = 'S'
+    open_room[39][39] = 'E'
+    pillars = [row[:] for row in open_room]
+    for y in range(3, 37, 4):
+        for x in range(2, 38, 5):
+            pillars[y][x] = 1
+    
+    for grid in (open_room, pillars, _corridor_grid(21, 21)):
+        maze = Maze(grid)
+        solver = JPSMazeSolver()
+        path = solver.solve(maze)
+        assert maze.validate_path(path)['valid']
+        assert len(path) == len(BFSMazeSolver().solve(maze))
+    
+    astar = AStarMazeSolver()
+    jps = JPSMazeSolver()
+    astar.solve(Maze(open_room))
+    jps.solve(Maze(open_room))
+    assert jps.nodes_expanded * 10 <= astar.nodes_expanded
+    assert JPSMazeSolver().solve(Maze([['S', 1, 'E']])) == []
+    print(f"✅ JPS expanded {jps.nodes_expanded} nodes vs {astar.nodes_expanded} for A*")
+
+def test_solve_cache():
+    """Test that the solve cache reuses paths and tracks hits and misses."""
+    print("\n" + "="*60)
+    print("TESTING SOLVE CACHE")
+    print("="*60)
+    
+    grid = [
+        ['S', 0, 0, 0, 0, 0, 0, 0, 0, 0],
+        [1, 1, 0, 1, 1, 1, 1, 1, 1, 0],
+        [0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+        [0, 1, 1, 1, 1, 1, 1, 1, 1, 0],
+        [0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+        [1, 1, 1, 1, 1, 1, 1, 1, 1, 0],
+        [0, 0, 0, 0, 0, 0, 0, 0, 0, 'E']
+    ]
+    
+    with tempfile.TemporaryDirectory() as directory:
+        cache = SolveCache(max_entries=2, directory=directory)
+        path = cache.solve(BFSMazeSolver(), Maze(grid))
+        assert cache.solve(BFSMazeSolver(), Maze(grid)) == path  # Same content, new objects
+        assert cache.solve(DFSMazeSolver(), Maze(grid)) != path  # Solver is part of the key
+        assert solve_key(Maze(grid), DistanceFieldMazeSolver(use_numpy=False)) != \
+            solve_key(Maze(grid), DistanceFieldMazeSolver(use_numpy=None))
+        
+        cache.solve(AStarMazeSolver(), Maze(grid))
+        assert cache.get_stats()['evictions'] == 1
+        assert cache.get_stats()['hits'] == 1
+        
+        # Evicted from memory, but still on disk
+        fresh = SolveCache(directory=directory)
+        assert fresh.solve(BFSMazeSolver(), Maze(grid)) == path
+        assert fresh.get_stats()['disk_hits'] == 1
+    
+    expiring = SolveCache(ttl=0)
+    expiring.solve(BFSMazeSolver(), Maze(grid))
+    expiring.solve(BFSMazeSolver(), Maze(grid))
+    assert expiring.get_stats()['misses'] == 2
+    print("✅ Solve cache reused paths")
+
+def test_path_queries():
+    """Test shortest-path queries between arbitrary cells."""
+    print("\n" + "="*60)
+    print("TESTING PATH QUERIES")
+    print("="*60)
+    
+    grid = [
+        ['S', 0, 0, 0, 1, 0, 0, 0, 0, 0],
+        [1, 1, 0, 1, 1, 1, 1, 1, 1, 0],
+        [0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+        [0, 1, 1, 1, 1, 1, 1, 1, 1, 0],
+        [0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+        [1, 1, 1, 1, 1, 1, 1, 1, 1, 0],
+        [0, 0, 0, 0, 0, 0, 0, 0, 0, 'E']
+    ]
+    
+    maze = Maze(grid)
+    service = PathQueryService(maze, max_trees=2)
+    assert service.shortest_path(maze.start, maze.end) == BFSMazeSolver().solve(maze)
+    
+    path = service.shortest_path((0, 4), (5, 0))
+    assert path[0] == (0, 4) and path[-1] == (5, 0)
+    assert len(path) - 1 == compute_distance_field(maze, (0, 4)).distance_to((5, 0))
+    
+    # Answered from the cached tree rooted at (5, 0) without building a new one
+    built = service.get_stats()['trees_built']
+    assert service.shortest_path((5, 0), (0, 4)) == path[::-1]
+    assert service.get_stats()['trees_built'] == built
+    
+    paths = service.shortest_paths((0, 6), [(9, 0), (0, 2), (1, 1)])
+    assert len(paths[(9, 0)]) == 16 and len(paths[(0, 2)]) == 23
+    assert paths[(1, 1)] == []  # Wall
+    assert service.distance((0, 0), (1, 1)) == -1
+    
+    # Edits retire the cached trees instead of answering from the old maze
+    maze.set_wall((9, 3), True)
+    path = service.shortest_path((0, 6), (9, 0))
+    assert (9, 3) not in path and len(path) - 1 == compute_distance_field(maze, (0, 6)).distance_to((9, 0))
+    print("✅ Path queries match BFS distances")
+
+def test_batch_solving():
+    """Test serialization and the process-pool batch solver."""
+    print("\n" + "="*60)
+    print("TESTING BATCH SOLVING")
+    print("="*60)
+    
+    grids = [_corridor_grid(width, 9) for width in range(3, 15)]
+    grids.append([['S', 1, 'E']])
+    grids.append([['S', 3, 0], [0, 1, 'E']])  # Weighted cells keep a byte per cell
+    mazes = [Maze(grid) for grid in grids]
+    
+    for maze in mazes:
+        restored = Maze.from_bytes(maze.to_bytes())
+        assert restored.grid == maze.grid
+    assert len(mazes[-3].to_bytes()) < len(mazes[-3].cells) + 64
+    
+    # Truncated bodies, forged sizes and stray start/end positions are rejected
+    data = mazes[0].to_bytes()
+    forged = bytearray(data)
+    forged[8:12] = (1 << 30).to_bytes(4, 'little')  # Width
+    moved = bytearray(data)
+    moved[24:28] = (99).to_bytes(4, 'little')  # End x
+    for bad in (data[:32], data[:-1], data[:10], bytes(forged), bytes(moved)):
+        try:
+            Maze.from_bytes(bad)
+            assert False, "expected ValueError"
+        except ValueError:
+            pass
+    
+    expected = [BFSMazeSolver().solve(maze) for maze in mazes]
+    ordered = list(solve_batch(mazes, 'bfs', workers=2, chunksize=3))
+    assert ordered == list(enumerate(expected))
+    
+    unordered = sorted(solve_batch(iter(mazes), 'bfs', workers=2, chunksize=2, ordered=False))
+    assert unordered == list(enumerate(expected))
+    print(f"✅ Batch solved {len(mazes)} mazes")
+
+def test_maze_files():
+    """Test the binary and text maze file formats."""
+    print("\n" + "="*60)
+    print("TESTING MAZE FILES")
+    print("="*60)
+    
+    plain = Maze(_corridor_grid(21, 11))
+    weighted = Maze([['S', 3, 0], [0, 1, 9], [0, 0, 'E']])
+    
+    with tempfile.TemporaryDirectory() as directory:
+        for maze in (plain, weighted):
+            binary_path = os.path.join(directory, 'maze.maze')
+            save_maze(maze, binary_path)
+            for use_mmap in (True, False):
+                loaded = load_maze(binary_path, use_mmap=use_mmap)
+                assert loaded.grid == maze.grid
+                assert loaded.get_maze_stats() == maze.get_maze_stats()
+                assert DijkstraMazeSolver().solve(loaded) == DijkstraMazeSolver().solve(maze)
+            
+            text_path = os.path.join(directory, 'maze.txt')
+            write_text(maze, text_path)
+            assert read_text(text_path).grid == maze.grid
+        
+        assert isinstance(load_maze(binary_path).cells, MappedCells)
+        with open(text_path) as f:
+            assert f.read().splitlines() == ['S3.', '.#9', '..E']
+        
+        # Short or truncated files fail the same way with and without mmap
+        with open(binary_path, 'rb') as f:
+            data = f.read()
+        for damaged in (data[:20], data[:-1]):
+            with open(binary_path, 'wb') as f:
+                f.write(damaged)
+            for use_mmap in (True, False):
+                try:
+                    load_maze(binary_path, use_mmap=use_mmap)
+                    assert False, "expected ValueError"
+                except ValueError:
+                    pass
+    print("✅ Maze files round-trip")
+
+def test_generators():
+    """Test that generators are seeded and perfect mazes are spanning trees."""
+    print("\n" + "="*60)
+    print("TESTING MAZE GENERATORS")
+    print("="*60)
+    
+    for algorithm in GENERATORS:
+        for width, height in ((3, 3), (21, 15), (20, 16)):
+            maze = generate_maze(width, height, algorithm, seed=7)
+            assert maze.cells == generate_maze(width, height, algorithm, seed=7).cells
+            if algorithm == 'noise':
+                assert not maze.is_wall(maze.start) and not maze.is_wall(maze.end)
+                continue
+            
+            # A spanning tree over the rooms: every open cell reachable, one fewer passage than rooms
+            rooms = ((width - 1) // 2) * ((height - 1) // 2)
+            assert maze.cells.count(0) == 2 * rooms - 1
+            field = compute_distance_field(maze, use_numpy=False)
+            assert sum(1 for distance in field.values if distance >= 0) == 2 * rooms - 1
+            assert field.is_reachable(maze.end)
+        print(f"✅ {algorithm} generates seeded mazes")
+    
+    assert generate_maze(21, 15, 'kruskal', seed=1).cells != generate_maze(21, 15, 'kruskal', seed=2).cells
+    dense = generate_maze(100, 100, 'noise', seed=0, wall_density=0.5)
+    assert 4000 < dense.cells.count(1) < 6000
+
+def test_solve_stats():
+    """Test that every solver reports search statistics to its observer."""
+    print("\n" + "="*60)
+    print("TESTING SOLVE STATISTICS")
+    print("="*60)
+    
+    collector = StatsCollector()
+    mazes = [Maze(_corridor_grid(21, 21)), generate_maze(31, 31, 'kruskal', seed=3), Maze([['S', 1, 0, 'E']])]
+    for maze in mazes:
+        maze.component_labels()  # Labeled up front, so unreachable goals are rejected before searching
+    for name, solver_class in SOLVERS.items():
+        solver = solver_class()
+        key = solve_key(mazes[0], solver)
+        solver.observer = collector
+        assert solve_key(mazes[0], solver) == key  # Observers don't change cache keys
+        
+        for maze in mazes:
+            path = solver.solve(maze)
+            stats = solver.last_stats
+            assert collector.history[-1] == (solver_class.__name__, stats)
+            assert stats.nodes_expanded == solver.nodes_expanded
+            assert set(stats.phase_times) <= set(PHASES) and stats.elapsed > 0
+            if not maze.is_reachable(maze.start, maze.end):
+                assert path == [] and stats.nodes_expanded == 0  # Rejected before searching
+                continue
+            assert stats.nodes_expanded + stats.revisits <= stats.nodes_pushed, (name, stats)
+            assert stats.max_frontier >= 1 or name == 'distance-field'  # Wavefronts don't track it
+            if path:
+                assert stats.nodes_expanded > 0
+        print(f"✅ {name}: {solver.last_stats.as_dict()['nodes_expanded']} nodes expanded on the unsolvable maze")
+    
+    assert len(collector.history) == len(SOLVERS) * len(mazes)
+    assert collector.slowest()[0][1].elapsed >= collector.history[0][1].elapsed
+    
+    solver = AStarMazeSolver()
+    path = solver.solve(mazes[1])
+    output = io.StringIO()
+    with redirect_stdout(output):
+        mazes[1].display_with_stats(path=path, solve_stats=solver.last_stats)
+    assert f"Nodes Expanded: {solver.nodes_expanded}" in output.getvalue()
+    assert "Solve Time:" in output.getvalue()
+
+def test_set_wall():
+    """Test editing cells in place with change notification."""
+    print("\n" + "="*60)
+    print("TESTING MAZE EDITS")
+    print("="*60)
+    
+    maze = Maze(_corridor_grid(11, 7))
+    maze.neighbor_index()
+    events = []
+    maze.add_listener(lambda changed_maze, positions: events.append(positions))
+    old_hash = maze.content_hash()
+    
+    assert maze.set_wall((1, 0), True)
+    assert not maze.set_wall((1, 0), True)  # Already a wall
+    assert maze.set_walls([((1, 0), False), ((1, 1), False), ((2, 0), True)]) == [(1, 0), (1, 1), (2, 0)]
+    assert events == [[(1, 0)], [(1, 0), (1, 1), (2, 0)]]
+    assert maze.version == 2 and maze.content_hash() != old_hash
+    
+    # The neighbor index is patched in place to match a full rebuild
+    masks = bytes(maze.neighbor_index()[0])
+    maze._reset_caches()
+    assert bytes(maze.neighbor_index()[0]) == masks
+    
+    for position in (maze.start, maze.end, (-1, 0)):
+        try:
+            maze.set_wall(position)
+            assert False, "expected ValueError"
+        except ValueError:
+            pass
+    
+    # A bad change anywhere in a batch rejects the whole batch
+    cells = bytes(maze.cells)
+    try:
+        maze.set_walls([((3, 0), True), (maze.end, True)])
+        assert False, "expected ValueError"
+    except ValueError:
+        pass
+    assert bytes(maze.cells) == cells and maze.version == 2
+    
+    # Memory-mapped mazes are copied on the first edit, leaving the file alone
+    with tempfile.TemporaryDirectory() as directory:
+        file_path = os.path.join(directory, 'maze.maze')
+        save_maze(maze, file_path)
+        mapped = load_maze(file_path)
+        mapped.set_wall((1, 1), True)
+        assert isinstance(mapped.cells, bytearray) and mapped.is_wall((1, 1))
+        assert not load_maze(file_path).is_wall((1, 1))
+        del mapped
+    print("✅ Cells edited in place with listeners notified")
+
+def test_dstar_lite():
+    """Test that D* Lite repairs its search after edits and start moves."""
+    print("\n" + "="*60)
+    print("TESTING D* LITE REPLANNING")
+    print("="*60)
+    
+    maze = generate_maze(41, 41, 'noise', seed=1, wall_density=0.2)
+    solver = DStarLiteMazeSolver()
+    path = solver.solve(maze)
+    assert len(path) == len(BFSMazeSolver().solve(maze)) > 0
+    initial_expanded = solver.nodes_expanded
+    position = maze.start
+    closed = []
+    
+    for step in range(10):
+        # Close a cell on the current path, then step forward along the new one
+        closed.append(path[len(path) // 2])
+        maze.set_wall(closed[-1], True)
+        path = solver.replan(maze, position)
+        from_position = Maze.from_cells(bytearray(maze.cells), 41, 41, position, maze.end)
+        assert len(path) == len(DijkstraMazeSolver().solve(from_position))
+        if not path:
+            break
+        assert from_position.validate_path(path)['valid']
+        assert solver.nodes_expanded < initial_expanded
+        position = path[1]
+    
+    # Reopening the closed cells brings back the original shortest path
+    maze.set_walls([(cell, False) for cell in closed])
+    assert len(solver.solve(maze)) == len(BFSMazeSolver().solve(maze))
+    solver.detach()
+    assert not maze._listeners
+    print(f"✅ D* Lite replanned with under {initial_expanded} expansions per edit")
+
+def test_benchmark_suite():
+    """Test the benchmark suite and regression comparison on small mazes."""
+    print("\n" + "="*60)
+    print("TESTING BENCHMARK SUITE")
+    print("="*60)
+    
+    run = run_suite(sizes=(15,), solvers=['bfs', 'astar'], repeat=1)
+    assert len(run['results']) == len(TOPOLOGIES) * 2
+    for row in run['results']:
+        assert row['seconds'] >= 0 and row['peak_bytes'] > 0
+        solved = row['topology'] != 'unsolvable'
+        assert (row['path_length'] > 0) == solved, row
+    
+    assert compare_runs(run, run) == []
+    slower = {'results': [dict(row, nodes_expanded=row['nodes_expanded'] * 2 + 1) for row in run['results']]}
+    regressions = compare_runs(run, slower)
+    assert len(regressions) == len(run['results'])
+    assert all(regression['metric'] == 'nodes_expanded' for regression in regressions)
+    print("✅ Benchmark suite measures every solver and flags regressions")
+
+def test_connectivity():
+    """Test connected-region labels and the instant unreachable check."""
+    print("\n" + "="*60)
+    print("TESTING CONNECTIVITY")
+    print("="*60)
+    
+    maze = Maze([
+        ['S', 0, 1, 0],
+        [0, 0, 1, 'E'],
+        [1, 1, 1, 0]
+    ])
+    labels = maze.component_labels()
+    assert list(labels) == [0, 0, -1, 1, 0, 0, -1, 1, -1, -1, -1, 1]
+    assert maze.is_reachable((0, 1), (1, 0))
+    assert not maze.is_reachable(maze.start, maze.end)
+    assert not maze.is_reachable((2, 0), (2, 0))  # Walls reach nothing
+    assert not maze.is_reachable((0, 0), (9, 9))
+    
+    for name, solver_class in SOLVERS.items():
+        solver = solver_class()
+        assert solver.solve(maze) == [] and solver.nodes_expanded == 0, name
+    
+    # Solvers never label a maze themselves: without labels they search and fail
+    fresh = Maze([['S', 0, 1, 0], [0, 0, 1, 'E'], [1, 1, 1, 0]])
+    for name, solver_class in SOLVERS.items():
+        assert solver_class().solve(fresh) == [], name
+    assert ARAStarMazeSolver().solve(fresh) == [] and fresh._component_labels is None
+    
+    # Opening a wall joins the two regions
+    maze.set_wall((2, 0), False)
+    assert maze.is_reachable(maze.start, maze.end)
+    assert len(maze.component_labels()) == 12 and max(maze.component_labels()) == 0
+    assert len(BFSMazeSolver().solve(maze)) == 5
+    print("✅ Regions labeled and unreachable goals rejected without searching")
+
+def test_reduction():
+    """Test dead-end filling, corridor contraction and solving on the junction graph."""
+    print("\n" + "="*60)
+    print("TESTING MAZE REDUCTION")
+    print("="*60)
+    
+    # A perfect maze reduces to its solution path: one corridor from start to end
+    maze = generate_maze(31, 31, 'kruskal', seed=3)
+    reduced = maze.reduction()
+    assert reduced.node_count == 2 and reduced.edge_count == 1
+    assert maze.reduction() is reduced  # Cached until the maze is edited
+    solver = ReducedMazeSolver()
+    path = solver.solve(maze)
+    assert maze.validate_path(path)['valid'] and len(path) == len(BFSMazeSolver().solve(maze))
+    assert solver.nodes_expanded == 1 and maze.get_maze_stats()['reduction_ratio'] > 0.99
+    
+    # Loops and weighted cells survive; every solver finds the same cost on the pruned maze
+    maze = generate_maze(41, 41, 'noise', seed=5, wall_density=0.25)
+    cells = bytearray(maze.cells)
+    cells[maze.width * 3 + 4:maze.width * 3 + 10] = bytes([5]) * 6
+    maze = Maze.from_cells(cells, 41, 41, maze.start, maze.end)
+    dijkstra = DijkstraMazeSolver()
+    expected = maze.get_path_cost(dijkstra.solve(maze))
+    solver = ReducedMazeSolver()
+    path = solver.solve(maze)
+    assert maze.validate_path(path)['valid'] and maze.get_path_cost(path) == expected
+    assert solver.nodes_expanded < dijkstra.nodes_expanded
+    for name in ('bfs', 'astar', 'dijkstra'):
+        path = ReducedMazeSolver(name).solve(maze)
+        assert maze.validate_path(path)['valid']
+    
+    # Junction fields are only reported once a reduction exists, or on request
+    fresh = Maze.from_cells(maze.cells, 41, 41, maze.start, maze.end)
+    assert 'junction_nodes' not in fresh.get_maze_stats() and fresh._reduction is None
+    assert fresh.get_maze_stats(include_reduction=True)['junction_nodes'] == maze.reduction().node_count
+    assert 'junction_nodes' in fresh.get_maze_stats()
+    
+    stats = maze.get_maze_stats()
+    open_cells = stats['total_cells'] - stats['wall_cells']
+    assert stats['junction_nodes'] + stats['dead_end_cells'] < open_cells
+    assert 0 < stats['reduction_ratio'] < 1
+    
+    reduced = maze.reduction()
+    maze.set_wall(path[len(path) // 2], True)
+    assert maze.reduction() is not reduced
+    print(f"✅ Reduced to {stats['junction_nodes']} junctions ({stats['reduction_ratio']:.0%} of open cells contracted)")
+
+def test_hierarchical():
+    """Test HPA* paths and per-cluster rebuilding of the cached abstraction."""
+    print("\n" + "="*60)
+    print("TESTING HIERARCHICAL PATHFINDING")
+    print("="*60)
+    
+    maze = generate_maze(64, 48, 'noise', seed=2, wall_density=0.25)
+    shortest = len(DijkstraMazeSolver().solve(maze))
+    for cluster_size in (4, 8, 16):
+        path = HPAStarMazeSolver(cluster_size).solve(maze)
+        assert maze.validate_path(path)['valid']
+        assert shortest <= len(path) <= shortest * 1.5, (cluster_size, len(path), shortest)
+    
+    hierarchy = maze.hierarchy(8)
+    assert maze.hierarchy(8) is hierarchy and hierarchy.clusters_rebuilt == 8 * 6
+    
+    # An edit rebuilds only the clusters beside it
+    path = HPAStarMazeSolver(8).solve(maze)
+    maze.set_wall(path[len(path) // 2], True)
+    rebuilt = hierarchy.clusters_rebuilt
+    path = HPAStarMazeSolver(8).solve(maze)
+    assert 1 <= hierarchy.clusters_rebuilt - rebuilt <= 3
+    fresh = Maze.from_cells(bytearray(maze.cells), maze.width, maze.height, maze.start, maze.end)
+    assert path == HPAStarMazeSolver(8).solve(fresh) and maze.validate_path(path)['valid']
+    
+    try:
+        HPAStarMazeSolver(1).solve(maze)
+        assert False, "expected ValueError"
+    except ValueError:
+        pass
+    print(f"✅ HPA* paths within {len(path) / shortest:.2f}x of shortest; edits rebuild single clusters")
+
+def test_renderer():
+    """Test buffered frames, frame diffs and the scrolling viewport."""
+    print("\n" + "="*60)
+    print("TESTING TERMINAL RENDERER")
+    print("="*60)
+    
+    maze = Maze(_corridor_grid(40, 21))
+    path = BFSMazeSolver().solve(maze)
+    lines = maze.render_lines((2, 0), path)
+    assert len(lines) == maze.height + 2 and lines[1].startswith("|S|·|P|·|")
+    output = io.StringIO()
+    with redirect_stdout(output):
+        maze.display((2, 0), path)
+    assert output.getvalue() == "\n" + "\n".join(lines) + "\n" + maze.legend() + "\n\n"
+    
+    stream = io.StringIO()
+    renderer = TerminalRenderer(maze, stream, view_size=(12, 8))
+    full = renderer.draw(["header"], maze.start, path)
+    assert stream.getvalue().startswith(CLEAR_SCREEN) and renderer.origin == (0, 0)
+    
+    # One step rewrites two cells, not the frame
+    player = Player(maze.start)
+    player.move('right', maze)
+    stream.seek(0)
+    stream.truncate()
+    written = renderer.draw(["header"], player.position, path)
+    assert CLEAR_SCREEN not in stream.getvalue() and written < full // 10
+    
+    # Walking right scrolls the viewport along with the player
+    for _ in range(20):
+        player.move('right', maze)
+        renderer.draw(["header"], player.position, path)
+    x, y, width, height = renderer.viewport(player.position)
+    assert x > 0 and x <= player.position[0] < x + width and (width, height) == (12, 8)
+    
+    game = Game(maze, BFSMazeSolver(), SolveCache(), TerminalRenderer(maze, io.StringIO(), view_size=(12, 8)))
+    game.draw()
+    assert "MAZE SOLVER GAME" in game.renderer.stream.getvalue()
+    print(f"✅ Frames diffed ({written} of {full} characters for one step) with a scrolling viewport")
+
+def test_solve_server():
+    """Test the JSON-lines solve server: coalescing, backpressure and latency stats."""
+    print("\n" + "="*60)
+    print("TESTING SOLVE SERVER")
+    print("="*60)
+    
+    grid = _corridor_grid(41, 21)
+    expected = len(BFSMazeSolver().solve(Maze(grid)))
+    
+    async def exchange():
+        server = SolveServer(ThreadPoolExecutor(max_workers=2), queue_limit=4)
+        listener = await server.start(port=0)
+        reader, writer = await asyncio.open_connection('127.0.0.1', listener.sockets[0].getsockname()[1])
+        requests = [{'id': i, 'solver': 'bfs', 'grid': grid} for i in range(8)]
+        requests += [{'id': 'bad', 'solver': 'nope', 'grid': grid}, {'id': 'empty', 'grid': []},
+                     {'id': 'short', 'maze': base64.b64encode(b'MAZE').decode()}]
+        writer.write(b''.join(json.dumps(request).encode() + b'\n' for request in requests))
+        await writer.drain()
+        responses = [json.loads(await reader.readline()) for _ in requests]
+        writer.write(b'{"id": "stats", "op": "stats"}\n')
+        stats = json.loads(await reader.readline())
+        writer.close()
+        await server.close()
+        server.executor.shutdown()
+        return server, responses, stats
+    
+    server, responses, stats = asyncio.run(exchange())
+    answers = {response['id']: response for response in responses}
+    assert all(answers[i]['length'] == expected and answers[i]['solved'] for i in range(8))
+    assert 'Unknown solver' in answers['bad']['error']
+    assert answers['empty']['error'] and answers['short']['error']  # Malformed mazes are answered too
+    
+    # Pipelined duplicates share solves, and no more than queue_limit were ever pending
+    assert server.solves + server.coalesced == 8 and server.coalesced > 0
+    assert server.peak_pending <= 4 and stats['pending'] == 1
+    assert stats['requests'] == 12 and stats['errors'] == 3
+    assert 0 < stats['latency_p50_ms'] <= stats['latency_p99_ms'] <= stats['latency_max_ms']
+    
+    async def misbehave():
+        server = SolveServer(ThreadPoolExecutor(max_workers=1), queue_limit=1, line_limit=1024)
+        listener = await server.start(port=0)
+        port = listener.sockets[0].getsockname()[1]
+        idle = await asyncio.open_connection('127.0.0.1', port)  # Holds no slot while silent
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        big = {'id': 'big', 'solver': 'bfs', 'grid': _corridor_grid(41, 41)}
+        lines = [json.dumps(big), '{"id": 7, "grid": [', json.dumps({'id': 'ok', 'grid': [['S', 'E']]})]
+        writer.write(''.join(line + '\n' for line in lines).encode())
+        await writer.drain()
+        responses = [json.loads(await asyncio.wait_for(reader.readline(), 5)) for _ in lines]
+        writer.close()
+        idle[1].close()
+        await server.close()
+        server.executor.shutdown()
+        return server, responses
+    
+    server, responses = asyncio.run(misbehave())
+    answers = {response['id']: response for response in responses}
+    assert 'longer than 1024' in answers['big']['error'] and 'Invalid JSON' in answers[7]['error']
+    assert answers['ok']['solved'] and server.errors == 2 and server._slots._value == 1
+    print(f"✅ {server.solves} solves served 8 requests; p99 latency {stats['latency_p99_ms']:.1f}ms")
+
+def test_flow_field():
+    """Test the shared flow field that leads every cell to one goal."""
+    print("\n" + "="*60)
+    print("TESTING FLOW FIELD")
+    print("="*60)
+    
+    maze = generate_maze(31, 31, 'noise', seed=3, wall_density=0.25)
+    field = maze.flow_field()
+    assert maze.flow_field() is field  # Shared until the maze changes
+    assert maze._weighted is False  # Default key checked without rescanning the cells
+    
+    agents = [Player(position) for position in [(0, 0), (10, 10), (20, 4), (5, 25)] if not maze.is_wall(position)]
+    for agent in agents:
+        start = agent.position
+        expected = BFSMazeSolver().solve(Maze.from_cells(maze.cells, 31, 31, start, maze.end))
+        path = field.path_from(start)
+        assert len(path) == len(expected) and field.distance_from(start) == len(path) - 1
+        steps = 0
+        while agent.next_move(maze) is not None:
+            assert agent.move(agent.next_move(maze), maze)
+            steps += 1
+        assert (agent.position == maze.end) == bool(path) and steps == max(len(path) - 1, 0)
+    assert field.next_position(maze.end) is None and field.next_move((-1, 0)) is None
+    
+    # Weighted cells are routed around when cheaper
+    grid = [['S', 9, 0], [0, 0, 0], [0, 0, 'E']]
+    weighted = Maze(grid)
+    assert weighted.flow_field(weighted.end).next_move((0, 0)) == 'down'
+    assert weighted.flow_field(weighted.end, weighted=False).distance_from((0, 0)) == 4
+    
+    assert maze.set_wall(field.path_from(maze.start)[1], True)
+    assert maze.flow_field() is not field
+    print(f"✅ One field led {len(agents)} agents to the exit")
+
+def test_anytime():
+    """Test budgeted solving with weighted A* and ARA*."""
+    print("\n" + "="*60)
+    print("TESTING ANYTIME SOLVING")
+    print("="*60)
+    
+    maze = generate_maze(61, 61, 'noise', seed=1, wall_density=0.25)
+    optimal = len(DijkstraMazeSolver().solve(maze))
+    assert optimal
+    
+    path = ARAStarMazeSolver().solve(maze)
+    assert path.complete and path.bound == 1.0 and len(path) == optimal
+    
+    weighted = WeightedAStarMazeSolver(weight=2.0)
+    path = weighted.solve(maze)
+    assert path.complete and path[0] == maze.start and path[-1] == maze.end
+    assert 1.0 <= path.bound <= 2.0 and len(path) - 1 <= path.bound * (optimal - 1)
+    assert all(abs(x1 - x2) + abs(y1 - y2) == 1 for (x1, y1), (x2, y2) in zip(path, path[1:]))
+    
+    # Cut off before reaching the end: the path heads for it but stops short
+    solver = ARAStarMazeSolver()
+    partial = solver.solve(maze, node_limit=10)
+    assert not partial.complete and partial.bound == float('inf')
+    assert partial[0] == maze.start and partial[-1] != maze.end
+    assert solver.last_stats.nodes_expanded == 10
+    
+    # A budget that allows the first solution but not the refinements
+    first_pass = WeightedAStarMazeSolver(weight=solver.initial_weight)
+    first_pass.solve(maze)
+    first = solver.solve(maze, node_limit=first_pass.last_stats.nodes_expanded)
+    assert first.complete and first[-1] == maze.end and first.bound >= 1.0
+    
+    unsolvable = Maze([['S', 1], [1, 'E']])
+    assert ARAStarMazeSolver().solve(unsolvable, time_limit=0.01) == []
+    
+    # Without region labels the first iteration proves there is no path; no refinement follows
+    walled = generate_maze(41, 41, 'noise', seed=1, wall_density=0.2)
+    end_x, end_y = walled.end
+    walled.set_walls([(position, True) for position in ((end_x - 1, end_y), (end_x, end_y - 1))])
+    first_pass = WeightedAStarMazeSolver(weight=solver.initial_weight)
+    assert first_pass.solve(walled) == [] and solver.solve(walled) == []
+    assert solver.last_stats.nodes_expanded == first_pass.last_stats.nodes_expanded
+    print(f"✅ Partial path of {len(partial)} cells, weighted path within {path.bound:.2f}x of optimal")
+
+def test_validate_paths():
+    """Test bulk path validation and cached maze statistics."""
+    print("\n" + "="*60)
+    print("TESTING BULK PATH VALIDATION")
+    print("="*60)
+    
+    maze = generate_maze(41, 41, 'noise', seed=1, wall_density=0.25)
+    path = BFSMazeSolver().solve(maze)
+    assert path
+    wall = next(maze.to_position(i) for i in range(len(maze.cells)) if maze.cells[i] == 1)
+    jumped = path[:3] + path[4:]
+    walled = path[:2] + [wall] + path[2:]
+    outside = path[:1] + [(-1, path[0][1])] + path
+    paths = [path, [], path[1:], path[:-1], jumped, walled, outside, [list(position) for position in path]]
+    
+    expected = [maze.validate_path(candidate) for candidate in paths]
+    assert expected[0]['valid'] and not any(result['valid'] for result in expected[1:])
+    assert maze.validate_paths(paths, use_numpy=False) == expected
+    if HAVE_NUMPY:
+        assert maze.validate_paths(iter(paths), use_numpy=True) == expected
+    
+    # Statistics are counted once and recounted after an edit
+    stats = maze.get_maze_stats()
+    assert maze._stats is not None and maze.get_maze_stats() == stats
+    maze.set_wall(path[1], True)
+    assert maze._stats is None and maze.get_maze_stats()['wall_cells'] == stats['wall_cells'] + 1
+    print(f"✅ {len(paths)} paths validated in one batch (NumPy: {HAVE_NUMPY})")
+
+def test_compact_path():
+    """Test the compact path encoding."""
+    print("\n" + "="*60)
+    print("TESTING COMPACT PATHS")
+    print("="*60)
+    
+    maze = generate_maze(41, 41, 'prim', seed=2)
+    for name, solver_class in SOLVERS.items():
+        solver = solver_class()
+        assert solver.solve_compact(maze) == solver.solve(maze), name
+    
+    path = BFSMazeSolver().solve(maze)
+    packed = CompactPath.from_positions(path)
+    runs = BFSMazeSolver().solve_compact(maze, run_length=True)
+    assert len(packed) == len(runs) == len(path) and list(packed) == list(runs) == path
+    assert len(packed.data) == -(-(len(path) - 1) // 4) and len(runs.data) < len(path)
+    assert CompactPath.from_bytes(runs.to_bytes()) == path
+    
+    # Validation walks the codes and matches validate_path
+    assert packed.validate(maze) == maze.validate_path(path)
+    wall = next(position for position in maze.get_neighbors(path[0]) if position != path[1])
+    maze.set_wall(wall, True)
+    detour = [path[0], wall, path[0]] + path[1:]
+    assert CompactPath.from_positions(detour, True).validate(maze) == maze.validate_path(detour)
+    assert not CompactPath.from_positions(detour).validate(maze)['valid']
+    assert CompactPath.from_positions(path[1:]).validate(maze) == maze.validate_path(path[1:])
+    assert not CompactPath.from_positions([]) and CompactPath.from_positions([]).validate(maze) == maze.validate_path([])
+    
+    # Truncated or inconsistent records are rejected instead of decoding short
+    for encoded in (packed, runs):
+        data = encoded.to_bytes()
+        for bad in (data[:-1], data + b'\x00'):
+            try:
+                CompactPath.from_bytes(bad)
+                assert False, "expected ValueError"
+            except ValueError:
+                pass
+    short = CompactPath(packed.start, packed.end, packed.length, packed.data[:-1])
+    assert short.validate(maze) == maze.validate_path(list(short)) and not short.validate(maze)['valid']
+    
+    # Budget-cut partial paths stay marked as partial, through bytes too
+    partial = ARAStarMazeSolver().solve_compact(maze, node_limit=5)
+    restored = CompactPath.from_bytes(partial.to_bytes())
+    assert not partial.complete and not restored.complete and restored.bound == float('inf')
+    assert packed.complete and CompactPath.from_bytes(packed.to_bytes()).bound is None
+    
+    try:
+        CompactPath.from_positions([(0, 0), (2, 0)])
+        assert False, "Non-adjacent positions should be rejected"
+    except ValueError:
+        pass
+    print(f"✅ {len(path)}-cell path stored in {len(packed.data)} bytes ({len(runs.data)} run-length encoded)")
+
 def main():
     """Run all tests."""
     print("MAZE SOLVER TEST SUITE")
@@ -141,6 +1148,32 @@ def main():
         test_simple_maze()
         test_player_movement()
         test_maze_validation()
+        test_packed_grid()
+        test_neighbor_index()
+        test_parent_pointer_solvers()
+        test_weighted_dijkstra()
+        test_iterative_dfs()
+        test_distance_field()
+        test_bidirectional_solvers()
+        test_jump_point_search()
+        test_solve_cache()
+        test_path_queries()
+        test_batch_solving()
+        test_maze_files()
+        test_generators()
+        test_solve_stats()
+        test_set_wall()
+        test_connectivity()
+        test_reduction()
+        test_hierarchical()
+        test_renderer()
+        test_solve_server()
+        test_flow_field()
+        test_anytime()
+        test_validate_paths()
+        test_compact_path()
+        test_dstar_lite()
+        test_benchmark_suite()
         
         print("\n" + "="*60)
         print("✅ ALL TESTS COMPLETED SUCCESSFULLY!")
@@ -0,0 +1,130 @@
+"""
+Bulk path validation for Maze Solver.
+
+Maze.validate_path checks one path a step at a time. validate_paths checks a
+whole batch: the paths are flattened into one array of coordinates and the
+adjacency and wall checks run over every step of every path at once, with
+NumPy when it is installed. The results are the same dicts validate_path
+returns, so the two can be swapped freely.
+"""
+
+from itertools import chain
+from maze import Maze, WALL
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is an optional extra
+    np = None
+
+HAVE_NUMPY = np is not None
+
+# Positions flattened into one array at a time; bounds memory on huge batches
+_CHUNK_POSITIONS = 1 << 20
+
+
+def validate_paths(maze: Maze, paths, use_numpy=None):
+    """
+    Validate many paths against one maze.
+
+    Args:
+        maze (Maze): The maze the paths should cross
+        paths (iterable): Paths, each a list of (x, y) positions
+        use_numpy (bool): Force the NumPy engine on or off; by default it is
+            used whenever NumPy is installed
+
+    Returns:
+        list: One validation result per path, as returned by Maze.validate_path
+    """
+    if use_numpy is None:
+        use_numpy = HAVE_NUMPY
+    elif use_numpy and not HAVE_NUMPY:
+        raise ImportError("Vectorized path validation requires numpy to be installed")
+
+    results = []
+    pending = []  # (result slot, path) of paths whose steps still need checking
+    positions = 0
+    for path in paths:
+        result = _check_ends(maze, path)
+        results.append(result)
+        if result is not None:
+            continue
+        if not use_numpy:
+            results[-1] = _python_check_steps(maze, path)
+            continue
+        pending.append((len(results) - 1, path))
+        positions += len(path)
+        if positions >= _CHUNK_POSITIONS:
+            _numpy_check_steps(maze, pending, results)
+            pending = []
+            positions = 0
+
+    if pending:
+        _numpy_check_steps(maze, pending, results)
+    return results
+
+
+def _check_ends(maze, path):
+    """Return the failed result for an empty path or one with the wrong ends, else None."""
+    if not path:
+        return {'valid': False, 'error': 'Empty path'}
+    if path[0] != maze.start:
+        return {'valid': False, 'error': 'Path does not start at start position'}
+    if path[-1] != maze.end:
+        return {'valid': False, 'error': 'Path does not end at end position'}
+    return None
+
+
+def _step_error(path, step, adjacent):
+    """Return the failed result for the first bad step of a path."""
+    if not adjacent:
+        return {'valid': False, 'error': f'Non-adjacent positions at step {step}'}
+    return {'valid': False, 'error': f'Path goes through wall at {path[step + 1]}'}
+
+
+def _python_check_steps(maze, path):
+    """Check every step of one path against flat cell indices."""
+    cells = maze.cells
+    width = maze.width
+    height = maze.height
+    previous_x, previous_y = path[0]
+    for step, (x, y) in enumerate(path[1:]):
+        if abs(x - previous_x) + abs(y - previous_y) != 1:
+            return _step_error(path, step, False)
+        if not (0 <= x < width and 0 <= y < height) or cells[y * width + x] == WALL:
+            return _step_error(path, step, True)
+        previous_x, previous_y = x, y
+    return {'valid': True, 'length': len(path)}
+
+
+def _numpy_check_steps(maze, pending, results):
+    """
+    Check every step of a chunk of paths at once, filling in their results.
+
+    All positions are laid end to end; step k goes from position k to k + 1,
+    and the steps that would cross from one path into the next are masked
+    out. The first bad step of each path is then found by binary search.
+    """
+    cells = maze.cells
+    walls = np.frombuffer(cells if isinstance(cells, (bytes, bytearray)) else bytes(cells), dtype=np.uint8) == WALL
+    lengths = np.fromiter((len(path) for _, path in pending), dtype=np.int64, count=len(pending))
+    firsts = np.zeros(len(pending), dtype=np.int64)
+    np.cumsum(lengths[:-1], out=firsts[1:])
+    coordinates = np.fromiter(chain.from_iterable(chain.from_iterable(path for _, path in pending)),
+                              dtype=np.int64, count=int(lengths.sum()) * 2).reshape(-1, 2)
+    xs, ys = coordinates[:, 0], coordinates[:, 1]
+
+    adjacent = (np.abs(np.diff(xs)) + np.abs(np.diff(ys))) == 1
+    inside = (xs >= 0) & (xs < maze.width) & (ys >= 0) & (ys < maze.height)
+    blocked = ~inside
+    blocked[inside] = walls[ys[inside] * maze.width + xs[inside]]
+    bad = ~adjacent | blocked[1:]
+    bad[(firsts + lengths - 1)[:-1]] = False  # Steps from one path's end to the next path's start
+
+    bad_steps = np.flatnonzero(bad)
+    first_bad = np.searchsorted(bad_steps, firsts)
+    for (slot, path), first, length, found in zip(pending, firsts.tolist(), lengths.tolist(), first_bad.tolist()):
+        if found < len(bad_steps) and bad_steps[found] < first + length - 1:
+            step = int(bad_steps[found])
+            results[slot] = _step_error(path, step - first, bool(adjacent[step]))
+        else:
+            results[slot] = {'valid': True, 'length': length}